@@ -0,0 +1,80 @@
+"""
+Checks SOLVE_MEMORY_OVERHEAD and SOLVE_MEMORY_PER_TERM against the peak allocations of the KrawczykSolver traced by
+tracemalloc, run from the root of the repository:
+
+    python -m benchmarks.calibrate_solve_memory --seed 0
+
+on the gradient systems of dense random objectives of 1 to 3 variables and degree 3 to 9, so of degree 2 to 8, over
+boxes of width 0.5 to 8. The largest ratio of the traced peak of a solve to its estimate is printed per dimension; the
+estimate holds while the ratios stay at most 1. The traced peak depends on the versions of numpy and Python, so the
+constants are checked here rather than in the tests.
+"""
+import argparse
+import json
+import tracemalloc
+
+from itertools import product
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import numpy as np
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._float_conversion import floats_to_box
+from utils.polynomial_function import PolynomialFunction
+
+
+def _random_objective(rng: np.random.Generator, n_variables: int, degree: int) -> PolynomialFunction:
+    # Every term up to degree + 1, so that the gradient system has the given degree
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(n_variables, dp)
+    f = FloatDPBounds(0.0) * x[0]
+    for powers in product(range(degree + 2), repeat=n_variables):
+        if 0 < sum(powers) <= degree + 1:
+            term = FloatDPBounds(float(rng.uniform(-1.0, 1.0)))
+            for i, power in enumerate(powers):
+                term = term * x[i] ** power
+            f = f + term
+    return PolynomialFunction(n_variables=n_variables, f=f)
+
+
+def calibrate(seed: int) -> Dict[int, float]:
+    """
+    :param seed: seed of the random coefficients
+    :return: largest ratio of the traced peak to the estimate per number of variables
+    """
+    rng = np.random.default_rng(seed)
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+    ratios = {}
+    for n_variables in (1, 2, 3):
+        for degree, width in product((2, 4, 6, 8), (0.5, 2.0, 8.0)):
+            f = _random_objective(rng, n_variables, degree)
+            _, problems = optimiser._create_subproblems(f=f, D=floats_to_box([(-width / 2, width / 2)] * n_variables))
+            for p in problems:
+                # Solved once untraced, so that lazily loaded modules such as numpy.linalg are not counted
+                optimiser._solve_within_box(p=p)
+                tracemalloc.start()
+                optimiser._solve_within_box(p=p)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                ratio = peak / optimiser._estimate_solve_memory(p=p)
+                ratios[n_variables] = max(ratios.get(n_variables, 0.0), ratio)
+
+    return ratios
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Check the memory estimate of the KrawczykSolver")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(arguments)
+
+    print(json.dumps(calibrate(seed=args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Checks that the Krawczyk engine finds the same minima as the IntervalNewtonSolver of pyariadne, run from the root of
+the repository:
+
+    python -m benchmarks.compare_engines --dimensions 2 3 --degrees 4
+
+on the benchmark problems, which include those of the experiments, and the objectives of the examples. Two sets of
+minima agree if every box of either overlaps exactly one box of the other. The exit status is 1 if any problem
+disagrees.
+"""
+import argparse
+import json
+import sys
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from benchmarks.functions import BENCHMARKS
+from benchmarks.functions import BenchmarkProblem
+from solvers.polynomial_optimiser import ARIADNE_ENGINE
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import floats_to_box
+from utils.polynomial_function import PolynomialFunction
+
+FloatBox = List[Tuple[float, float]]
+
+
+def _examples() -> List[BenchmarkProblem]:
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return [
+        BenchmarkProblem(
+            "multivariate_demonstration",
+            PolynomialFunction(n_variables=2, f=(x[0] - 2) ** 2 + (x[1] + 3) ** 2),
+            None,
+            0.0,
+            {"n_variables": 2}
+        ),
+        BenchmarkProblem(
+            "univariate_demonstration",
+            PolynomialFunction(n_variables=1, f=x[0] ** 5 - 3 * x[0] ** 4 + 3 * x[0] ** 2 + 2),
+            None,
+            None,
+            {"n_variables": 1}
+        ),
+    ]
+
+
+def _overlaps(x: FloatBox, y: FloatBox) -> bool:
+    return all(x_lower <= y_upper and y_lower <= x_upper for (x_lower, x_upper), (y_lower, y_upper) in zip(x, y))
+
+
+def _is_matched(minima: List[FloatBox], other: List[FloatBox]) -> bool:
+    return all(sum(_overlaps(x, y) for y in other) == 1 for x in minima)
+
+
+def compare(problem: BenchmarkProblem, tolerance: float) -> Dict[str, Any]:
+    """
+    :param problem: problem whose minima are compared
+    :param tolerance: tolerance of both engines
+    :return: record of the comparison, with the minima and the solver failures of each engine
+    """
+    D = None if problem.domain is None else floats_to_box(problem.domain)
+    result = {"name": problem.name, "parameters": problem.parameters}
+    minima = {}
+    for engine in (ARIADNE_ENGINE, KRAWCZYK_ENGINE):
+        optimiser = PolynomialOptimiser(engine=engine, tolerance=tolerance)
+        try:
+            minima[engine] = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=problem.f, D=D)]
+        except Exception as e:
+            result[engine] = {"error": f"{type(e).__name__}: {e}"}
+            continue
+        result[engine] = {"minima": minima[engine], "solver_failures": optimiser.statistics.solver_failures}
+
+    result["agree"] = len(minima) == 2 and (
+        _is_matched(minima[ARIADNE_ENGINE], minima[KRAWCZYK_ENGINE])
+        and _is_matched(minima[KRAWCZYK_ENGINE], minima[ARIADNE_ENGINE])
+    )
+    return result
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare the minima of the Krawczyk and pyariadne engines")
+    parser.add_argument("--functions", nargs="+", default=sorted(BENCHMARKS), choices=sorted(BENCHMARKS))
+    parser.add_argument("--dimensions", nargs="+", type=int, default=[2])
+    parser.add_argument("--degrees", nargs="+", type=int, default=[4])
+    parser.add_argument("--tolerance", type=float, default=1e-8)
+    args = parser.parse_args(arguments)
+
+    problems = _examples()
+    seen = set()
+    for name in args.functions:
+        for n_variables in args.dimensions:
+            for degree in args.degrees:
+                problem = BENCHMARKS[name](n_variables, degree)
+                key = (name, json.dumps(problem.parameters, sort_keys=True))
+                if key not in seen:
+                    seen.add(key)
+                    problems.append(problem)
+
+    results = [compare(problem=problem, tolerance=args.tolerance) for problem in problems]
+    print(json.dumps(results, indent=2))
+    if not all(result["agree"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pyariadne import cast_exact
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from utils.polynomial_function import PolynomialFunction
+
+
+class BenchmarkProblem:
+    """
+    Objective of the benchmark suite, with the domain it is minimised over (the whole space if None) and the known
+    global minimum value if there is one
+    """
+    name: str
+    f: PolynomialFunction
+    domain: Optional[List[Tuple[float, float]]]
+    known_minimum: Optional[float]
+    parameters: Dict[str, int]
+
+    def __init__(
+        self,
+        name: str,
+        f: PolynomialFunction,
+        domain: Optional[List[Tuple[float, float]]],
+        known_minimum: Optional[float],
+        parameters: Dict[str, int]
+    ) -> None:
+        self.name = name
+        self.f = f
+        self.domain = domain
+        self.known_minimum = known_minimum
+        self.parameters = parameters
+
+
+def _coordinates(n_variables: int) -> List[MultivariatePolynomial]:
+    return MultivariatePolynomial[FloatDPBounds].coordinates(n_variables, dp)
+
+
+def goldstein_price(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(2)
+    a = 1 + (x[0] + x[1] + 1) ** 2 * (19 - 14 * x[0] + 3 * x[0] ** 2 - 14 * x[1] + 6 * x[0] * x[1] + 3 * x[1] ** 2)
+    b = 30 + (2 * x[0] - 3 * x[1]) ** 2 * (
+        18 - 32 * x[0] + 12 * x[0] ** 2 + 48 * x[1] - 36 * x[0] * x[1] + 27 * x[1] ** 2
+    )
+    f = a * b
+    return BenchmarkProblem(
+        "goldstein_price", PolynomialFunction(n_variables=2, f=f), [(-2.0, 2.0)] * 2, 3.0, {"n_variables": 2}
+    )
+
+
+def rosenbrock(n_variables: int, degree: int) -> BenchmarkProblem:
+    n_variables = max(n_variables, 2)
+    x = _coordinates(n_variables)
+    f = sum(((1 - x[i]) ** 2 + 100 * (x[i + 1] - x[i] ** 2) ** 2 for i in range(1, n_variables - 1)),
+            (1 - x[0]) ** 2 + 100 * (x[1] - x[0] ** 2) ** 2)
+    return BenchmarkProblem(
+        "rosenbrock",
+        PolynomialFunction(n_variables=n_variables, f=f),
+        [(-5.0, 10.0)] * n_variables,
+        0.0,
+        {"n_variables": n_variables}
+    )
+
+
+def schwefel_3_1(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(n_variables)
+    f = sum(((x[0] - x[i] ** 2) ** 2 + (x[i] - 1) ** 2 for i in range(1, n_variables)),
+            (x[0] - x[0] ** 2) ** 2 + (x[0] - 1) ** 2)
+    return BenchmarkProblem(
+        "schwefel_3_1",
+        PolynomialFunction(n_variables=n_variables, f=f),
+        [(-10.0, 10.0)] * n_variables,
+        0.0,
+        {"n_variables": n_variables}
+    )
+
+
+def beale(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(2)
+    f = (
+        (cast_exact(1.5) - x[0] + x[0] * x[1]) ** 2
+        + (cast_exact(2.25) - x[0] + x[0] * x[1] ** 2) ** 2
+        + (cast_exact(2.625) - x[0] + x[0] * x[1] ** 3) ** 2
+    )
+    return BenchmarkProblem("beale", PolynomialFunction(n_variables=2, f=f), [(-4.5, 4.5)] * 2, 0.0, {"n_variables": 2})
+
+
+def booth(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(2)
+    f = (x[0] + 2 * x[1] - 7) ** 2 + (2 * x[0] + x[1] - 5) ** 2
+    return BenchmarkProblem(
+        "booth", PolynomialFunction(n_variables=2, f=f), [(-10.0, 10.0)] * 2, 0.0, {"n_variables": 2}
+    )
+
+
+def matyas(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(2)
+    f = cast_exact(0.26) * (x[0] ** 2 + x[1] ** 2) - cast_exact(0.48) * x[0] * x[1]
+    return BenchmarkProblem(
+        "matyas", PolynomialFunction(n_variables=2, f=f), [(-10.0, 10.0)] * 2, 0.0, {"n_variables": 2}
+    )
+
+
+def three_hump_camel(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(2)
+    f = 2 * x[0] ** 2 - cast_exact(1.05) * x[0] ** 4 + cast_exact(1 / 6) * x[0] ** 6 + x[0] * x[1] + x[1] ** 2
+    return BenchmarkProblem(
+        "three_hump_camel", PolynomialFunction(n_variables=2, f=f), [(-5.0, 5.0)] * 2, 0.0, {"n_variables": 2}
+    )
+
+
+def levy_1(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(1)
+    f = x[0] ** 6 - 15 * x[0] ** 4 + 27 * x[0] ** 2 + 250
+    return BenchmarkProblem("levy_1", PolynomialFunction(n_variables=1, f=f), None, 7.0, {"n_variables": 1})
+
+
+def sphere(n_variables: int, degree: int) -> BenchmarkProblem:
+    """
+    sum_i (x_i - i)^2, over the usual [-5.12, 5.12] shifted along with the minimum
+    """
+    x = _coordinates(n_variables)
+    f = sum(((x[i] - i) ** 2 for i in range(1, n_variables)), x[0] ** 2)
+    return BenchmarkProblem(
+        "sphere",
+        PolynomialFunction(n_variables=n_variables, f=f),
+        [(i - 5.12, i + 5.12) for i in range(n_variables)],
+        0.0,
+        {"n_variables": n_variables}
+    )
+
+
+def power_sum(n_variables: int, degree: int) -> BenchmarkProblem:
+    """
+    sum_i (x_i - 1)^degree, rounded up to an even degree, to scale the degree independently of the dimension, over
+    the usual [-1, 1] shifted along with the minimum
+    """
+    degree = degree + degree % 2
+    x = _coordinates(n_variables)
+    f = sum(((x[i] - 1) ** degree for i in range(1, n_variables)), (x[0] - 1) ** degree)
+    return BenchmarkProblem(
+        "power_sum",
+        PolynomialFunction(n_variables=n_variables, f=f),
+        [(0.0, 2.0)] * n_variables,
+        0.0,
+        {"n_variables": n_variables, "degree": degree}
+    )
+
+
+def experiment_1(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(1)
+    f = x[0] ** 4 + cast_exact(10 / 7) * x[0] ** 3 - 4 * x[0] ** 2 - cast_exact(5 / 6) * x[0] + 1
+    return BenchmarkProblem(
+        "experiment_1", PolynomialFunction(n_variables=1, f=f), [(0.0, 2.0)], None, {"n_variables": 1}
+    )
+
+
+def experiment_2(n_variables: int, degree: int) -> BenchmarkProblem:
+    x = _coordinates(1)
+    f = x[0] ** 6 + cast_exact(3 / 4) * x[0] ** 5 - cast_exact(2 / 3) * x[0] ** 3 - cast_exact(5 / 8) * x[0] ** 2
+    return BenchmarkProblem(
+        "experiment_2", PolynomialFunction(n_variables=1, f=f), [(-2.0, 1.0)], None, {"n_variables": 1}
+    )
+
+
+def euler_first_case_study(n_variables: int, degree: int) -> BenchmarkProblem:
+    """
+    -x_N^2 for the Euler scheme x_{k+1} = x_k + h (v - x_k^2), x_0 = 9, h = 1/20 of the first case study, with degree
+    as the number of steps N
+    """
+    v = _coordinates(1)[0]
+    x = 9
+    for _ in range(max(degree, 1)):
+        x = x + cast_exact(1 / 20) * (v - x ** 2)
+    return BenchmarkProblem(
+        "euler_first_case_study",
+        PolynomialFunction(n_variables=1, f=-x ** 2),
+        [(-5.0, 5.0)],
+        None,
+        {"n_variables": 1, "steps": max(degree, 1)}
+    )
+
+
+def euler_second_case_study(n_variables: int, degree: int) -> BenchmarkProblem:
+    """
+    Cost of the linear Euler scheme of the second case study from x_0 = (1, 1), with degree as the number of steps
+    """
+    v = _coordinates(1)[0]
+    x_0 = (1, 1)
+    x = x_0
+    for _ in range(max(degree, 1)):
+        x = (
+            cast_exact(1 / 10) * (x[0] * 8 + x[1] * 2 + v * 2),
+            cast_exact(1 / 10) * (x[0] * 1 + x[1] * 9 + v * 1)
+        )
+    f = x[0] ** 2 + x[1] ** 2 + 3 * x_0[0] ** 2 + 4 * x_0[0] * x_0[1] + x_0[1] ** 2 - v ** 2
+    return BenchmarkProblem(
+        "euler_second_case_study",
+        PolynomialFunction(n_variables=1, f=f),
+        [(-2.0, 2.0)],
+        None,
+        {"n_variables": 1, "steps": max(degree, 1)}
+    )
+
+
+# Every builder takes the requested dimension and degree; the fixed test functions ignore them
+BENCHMARKS: Dict[str, Callable[[int, int], BenchmarkProblem]] = {
+    "goldstein_price": goldstein_price,
+    "rosenbrock": rosenbrock,
+    "schwefel_3_1": schwefel_3_1,
+    "beale": beale,
+    "booth": booth,
+    "matyas": matyas,
+    "three_hump_camel": three_hump_camel,
+    "levy_1": levy_1,
+    "sphere": sphere,
+    "power_sum": power_sum,
+    "experiment_1": experiment_1,
+    "experiment_2": experiment_2,
+    "euler_first_case_study": euler_first_case_study,
+    "euler_second_case_study": euler_second_case_study,
+}
@@ -0,0 +1,287 @@
+"""
+Benchmark suite of the PolynomialOptimiser, run from the root of the repository:
+
+    python -m benchmarks.run_benchmarks --dimensions 2 3 --degrees 4 6 --output results.json
+
+Every problem is timed per phase (construction, subproblem creation, solving, selection) and end to end, with the
+peak memory use, and optionally compared with the InteriorPointOptimiser and KarushKuhnTuckerOptimiser of pyariadne.
+The phased run, the end to end run and every pyariadne optimiser run in a fresh process each, so that the peak memory
+use and the statistics of a run are its own and not mixed with those of the runs before it. The results are written
+as JSON to track regressions across releases.
+"""
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from datetime import timezone
+from multiprocessing import get_context
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import numpy as np
+
+from pyariadne import dp
+from pyariadne import evaluate
+from pyariadne import FloatDPApproximationVector
+from pyariadne import FloatDPExactBox
+from pyariadne import InteriorPointOptimiser
+from pyariadne import KarushKuhnTuckerOptimiser
+from pyariadne import ValidatedOptimisationProblem
+from pyariadne import ValidatedVectorMultivariateFunction
+
+from benchmarks.functions import BENCHMARKS
+from benchmarks.functions import BenchmarkProblem
+from solvers.polynomial_optimiser import ARIADNE_ENGINE
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._float_conversion import floats_to_box
+
+FORMAT_VERSION = 2
+
+
+def _timed(function: Callable[[], Any]) -> Tuple[Any, float]:
+    start = perf_counter()
+    result = function()
+    return result, perf_counter() - start
+
+
+def _max_rss_bytes(who: int = resource.RUSAGE_SELF) -> int:
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    max_rss = resource.getrusage(who).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _objective_bounds(problem: BenchmarkProblem, x: Any) -> Optional[List[float]]:
+    if x is None:
+        return None
+    lower, upper = problem.f.evaluate_many([x])
+    return [float(lower[0]), float(upper[0])]
+
+
+def _statistics(optimiser: PolynomialOptimiser) -> Dict[str, Any]:
+    return {name: value for name, value in vars(optimiser.statistics).items() if not name.startswith("_")}
+
+
+def _run_phases(
+    problem: BenchmarkProblem, construction_seconds: float, engine: str, workers: Optional[int]
+) -> Dict[str, Any]:
+    """
+    The steps of minimise without the univariate fast path, timed one by one
+    """
+    optimiser = PolynomialOptimiser(workers=workers, engine=engine)
+    timings = {"construction": construction_seconds}
+    f = problem.f
+    domain = None if problem.domain is None else floats_to_box(problem.domain)
+    D = domain if domain is not None else floats_to_box([(-np.inf, np.inf)] * f.n_variables)
+
+    (system, problems), timings["create_subproblems"] = _timed(lambda: optimiser._create_subproblems(f=f, D=D))
+
+    def solve() -> List[Any]:
+        remaining = problems
+        if optimiser.gradient_exclusion:
+            remaining = optimiser._exclude_boxes_without_critical_points(system=system, problems=problems)
+        minima = [x for p in remaining for x in optimiser._find_all_minima_within_box(system=system, p=p)]
+        if domain is not None:
+            minima.extend(optimiser._get_endpoints_if_minima(f_derivatives=system.gradient, D=D))
+        return minima
+
+    minima, timings["solve"] = _timed(solve)
+
+    def select() -> Any:
+        return optimiser._compute_global_minimum(f=f, minima=optimiser._deduplicate(minima))
+
+    global_minimum, timings["selection"] = _timed(select)
+
+    result = {
+        "timings": timings,
+        "n_subproblems": len(problems),
+        "n_minima": len(minima),
+        "objective": _objective_bounds(problem, global_minimum),
+        "statistics": _statistics(optimiser),
+    }
+    if problem.known_minimum is not None and result["objective"] is not None:
+        result["error_to_known_minimum"] = result["objective"][1] - problem.known_minimum
+
+    return result
+
+
+def _run_end_to_end(problem: BenchmarkProblem, engine: str, workers: Optional[int]) -> Dict[str, Any]:
+    optimiser = PolynomialOptimiser(workers=workers, engine=engine)
+    domain = None if problem.domain is None else floats_to_box(problem.domain)
+
+    global_minimum, seconds = _timed(lambda: optimiser.minimise(f=problem.f, D=domain))
+
+    return {
+        "seconds": seconds,
+        "objective": _objective_bounds(problem, global_minimum),
+        "statistics": _statistics(optimiser),
+    }
+
+
+PYARIADNE_OPTIMISERS: Dict[str, Callable[[], Any]] = {
+    "InteriorPointOptimiser": InteriorPointOptimiser,
+    "KarushKuhnTuckerOptimiser": KarushKuhnTuckerOptimiser,
+}
+
+
+def _run_pyariadne_optimiser(name: str, problem: BenchmarkProblem) -> Dict[str, Any]:
+    if problem.domain is None or not all(np.isfinite(problem.domain).flat):
+        return {"optimiser": name, "skipped": "pyariadne optimisers need a bounded domain"}
+
+    D = floats_to_box(problem.domain)
+    g = ValidatedVectorMultivariateFunction.identity(problem.f.n_variables)
+    p = ValidatedOptimisationProblem(problem.f.function, D, g, D)
+    optimiser = PYARIADNE_OPTIMISERS[name]()
+    try:
+        x, seconds = _timed(lambda: optimiser.minimise(p))
+        value = evaluate(problem.f.function, FloatDPApproximationVector(x, dp))
+        return {"optimiser": name, "seconds": seconds, "x": str(x), "objective": value.get_d()}
+    except Exception as e:
+        return {"optimiser": name, "error": f"{type(e).__name__}: {e}"}
+
+
+def _measure(run: Callable[..., Dict[str, Any]], trace_memory: bool, **kwargs: Any) -> Dict[str, Any]:
+    """
+    :param run: benchmark run, called with kwargs
+    :param trace_memory: record the peak Python allocations
+    :return: record of the run, with the peak memory use of the calling process and of the workers
+    """
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        result = run(**kwargs)
+    except Exception as e:
+        result = {"error": f"{type(e).__name__}: {e}"}
+    if trace_memory:
+        result["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    result["max_rss_bytes"] = _max_rss_bytes()
+    result["max_worker_rss_bytes"] = _max_rss_bytes(resource.RUSAGE_CHILDREN)
+
+    return result
+
+
+def _run_in_fresh_process(run: Callable[..., Dict[str, Any]], trace_memory: bool, **kwargs: Any) -> Dict[str, Any]:
+    # Spawned rather than forked, so that the process does not start with the memory of the runs before it
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(_measure, run, trace_memory, **kwargs).result()
+
+
+def run_benchmark(
+    problem: BenchmarkProblem,
+    construction_seconds: float,
+    engine: str,
+    workers: Optional[int],
+    compare: bool,
+    trace_memory: bool
+) -> Dict[str, Any]:
+    """
+    :param problem: problem to benchmark, built by the caller
+    :param construction_seconds: time it took to build the problem
+    :param engine: engine of the PolynomialOptimiser
+    :param workers: number of worker processes of the PolynomialOptimiser
+    :param compare: also run the pyariadne optimisers
+    :param trace_memory: record the peak Python allocations
+    :return: record of the benchmark, with a record of the phased run, the end to end run and every pyariadne
+        optimiser, each run in its own process
+    """
+    result = {
+        "name": problem.name,
+        "parameters": problem.parameters,
+        "n_terms": problem.f.n_terms,
+        "known_minimum": problem.known_minimum,
+        "phases": _run_in_fresh_process(
+            _run_phases,
+            trace_memory,
+            problem=problem,
+            construction_seconds=construction_seconds,
+            engine=engine,
+            workers=workers
+        ),
+        "end_to_end": _run_in_fresh_process(
+            _run_end_to_end, trace_memory, problem=problem, engine=engine, workers=workers
+        ),
+    }
+
+    if compare:
+        result["comparison"] = [
+            _run_in_fresh_process(_run_pyariadne_optimiser, trace_memory, name=name, problem=problem)
+            for name in PYARIADNE_OPTIMISERS
+        ]
+
+    return result
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark suite of the PolynomialOptimiser")
+    parser.add_argument("--functions", nargs="+", default=sorted(BENCHMARKS), choices=sorted(BENCHMARKS))
+    parser.add_argument("--dimensions", nargs="+", type=int, default=[2])
+    parser.add_argument("--degrees", nargs="+", type=int, default=[4])
+    parser.add_argument("--engine", default=ARIADNE_ENGINE, choices=[ARIADNE_ENGINE, KRAWCZYK_ENGINE])
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--compare", action="store_true", help="also run the pyariadne optimisers")
+    parser.add_argument("--trace-memory", action="store_true", help="record peak Python allocations (slower)")
+    parser.add_argument("--output", default=None, help="JSON file to write, standard output if not given")
+    args = parser.parse_args(arguments)
+
+    results = []
+    seen = set()
+    for name in args.functions:
+        for n_variables in args.dimensions:
+            for degree in args.degrees:
+                problem, construction_seconds = _timed(lambda: BENCHMARKS[name](n_variables, degree))
+                # Fixed test functions ignore the dimension and degree, so run them once
+                key = (name, json.dumps(problem.parameters, sort_keys=True))
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append(run_benchmark(
+                    problem=problem,
+                    construction_seconds=construction_seconds,
+                    engine=args.engine,
+                    workers=args.workers,
+                    compare=args.compare,
+                    trace_memory=args.trace_memory
+                ))
+
+    report = {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "engine": args.engine,
+        "workers": args.workers,
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output is None:
+        print(output)
+    else:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from utils._deduplicate_minima import cluster_overlapping_boxes
+from utils._interval_array import add_down
+from utils._interval_array import add_up
+from utils._interval_array import IntervalArray
+from utils._interval_array import interval_mul
+from utils._interval_array import interval_sum_axis
+from utils.polynomial_array import PolynomialArray
+
+Box = Tuple[np.ndarray, np.ndarray]
+
+# A box is bisected when one Krawczyk step shrinks its widest side by less than this factor
+_CONTRACTION_FACTOR = 0.5
+
+
+class KrawczykSolver:
+    """
+    Interval Newton solver for square polynomial systems based on the Krawczyk operator
+        K(X) = m - Y f(m) + (I - Y J(X)) (X - m),
+    with m the midpoint of X, J the Jacobian and Y an approximate inverse of the midpoint of J(X). Roots of f in X lie
+    in K(X); K(X) disjoint from X proves there is no root and K(X) in the interior of X proves there is exactly one.
+    All boxes of the subdivision queue are processed together with vectorised, outward rounded interval arithmetic.
+    Boxes that can neither be verified nor excluded, e.g. around a singular root, are returned as unresolved so that
+    the caller can solve them with another method.
+    """
+    tolerance: float
+    max_iterations: int
+    max_boxes: int
+
+    def __init__(self, tolerance: float = 1e-8, max_iterations: int = 200, max_boxes: int = 100000) -> None:
+        """
+        :param tolerance: width below which verified boxes are returned and undecided boxes are given up on
+        :param max_iterations: maximum number of Krawczyk steps applied to the whole queue, boxes still queued after
+            them are returned as unresolved
+        :param max_boxes: maximum size of the subdivision queue, a RuntimeError is raised beyond it
+        """
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.max_boxes = max_boxes
+
+    @staticmethod
+    def _evaluate_system(system: List[PolynomialArray], lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+        values = [f.evaluate_many(lower=lower, upper=upper) for f in system]
+        return np.stack([x[0] for x in values], axis=-1), np.stack([x[1] for x in values], axis=-1)
+
+    @staticmethod
+    def _evaluate_jacobian(
+        jacobian: List[List[PolynomialArray]], lower: np.ndarray, upper: np.ndarray
+    ) -> IntervalArray:
+        rows = [KrawczykSolver._evaluate_system(row, lower, upper) for row in jacobian]
+        return np.stack([x[0] for x in rows], axis=1), np.stack([x[1] for x in rows], axis=1)
+
+    def _krawczyk(
+        self,
+        system: List[PolynomialArray],
+        jacobian: List[List[PolynomialArray]],
+        lower: np.ndarray,
+        upper: np.ndarray
+    ) -> IntervalArray:
+        n = lower.shape[1]
+        midpoint = np.clip(lower + (upper - lower) / 2, lower, upper)
+        f_lower, f_upper = self._evaluate_system(system, midpoint, midpoint)
+        j_lower, j_upper = self._evaluate_jacobian(jacobian, lower, upper)
+
+        j_midpoint = (j_lower + j_upper) / 2
+        j_midpoint = np.where(np.isfinite(j_midpoint), j_midpoint, 0.0)
+        y = np.linalg.pinv(j_midpoint)
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            # Y f(m), a point matrix times an interval vector
+            yf_lower, yf_upper = interval_sum_axis(
+                *interval_mul(y, y, f_lower[:, None, :], f_upper[:, None, :]), axis=2
+            )
+            # I - Y J(X), with (Y J)[i, k] = sum_j Y[i, j] J[j, k]
+            yj_lower, yj_upper = interval_sum_axis(
+                *interval_mul(y[..., None], y[..., None], j_lower[:, None, :, :], j_upper[:, None, :, :]), axis=2
+            )
+            identity = np.eye(n)[None]
+            r_lower = add_down(identity, -yj_upper)
+            r_upper = add_up(identity, -yj_lower)
+            # (I - Y J(X)) (X - m)
+            d_lower = add_down(lower, -midpoint)
+            d_upper = add_up(upper, -midpoint)
+            rd_lower, rd_upper = interval_sum_axis(
+                *interval_mul(r_lower, r_upper, d_lower[:, None, :], d_upper[:, None, :]), axis=2
+            )
+
+            k_lower = add_down(add_down(midpoint, -yf_upper), rd_lower)
+            k_upper = add_up(add_up(midpoint, -yf_lower), rd_upper)
+
+        return k_lower, k_upper
+
+    @staticmethod
+    def _bisect(lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+        widest = np.argmax(upper - lower, axis=1)
+        rows = np.arange(len(lower))
+        split = lower[rows, widest] + (upper[rows, widest] - lower[rows, widest]) / 2
+
+        left_upper = upper.copy()
+        left_upper[rows, widest] = split
+        right_lower = lower.copy()
+        right_lower[rows, widest] = split
+
+        return np.vstack([lower, right_lower]), np.vstack([left_upper, upper])
+
+    def solve_all(
+        self, system: List[PolynomialArray], lower: np.ndarray, upper: np.ndarray
+    ) -> Tuple[List[Box], List[Box]]:
+        """
+        Enclose all roots of a square polynomial system within a box
+        :param system: n polynomials in n variables
+        :param lower: lower bounds of the box, of shape (n,)
+        :param upper: upper bounds of the box, of shape (n,)
+        :return: lower and upper bounds of boxes within the box that each contain exactly one root, and of the
+            unresolved boxes, which may contain roots that are in none of the former
+        """
+        n = len(system)
+        assert lower.shape == upper.shape == (n,), "The system must be square and match the box"
+        jacobian = [[f.derivative(j) for j in range(n)] for f in system]
+
+        queue_lower, queue_upper = lower[None, :].astype(float), upper[None, :].astype(float)
+        verified_lower, verified_upper = np.empty((0, n)), np.empty((0, n))
+        solutions = []
+        unresolved = []
+        for _ in range(self.max_iterations):
+            if len(queue_lower) == 0 and len(verified_lower) == 0:
+                break
+
+            if len(verified_lower):
+                # Boxes known to contain a unique root only need to be contracted to the tolerance
+                k_lower, k_upper = self._krawczyk(system, jacobian, verified_lower, verified_upper)
+                new_lower = np.fmax(verified_lower, k_lower)
+                new_upper = np.fmin(verified_upper, k_upper)
+                old_width = (verified_upper - verified_lower).max(axis=1)
+                new_width = (new_upper - new_lower).max(axis=1)
+                is_done = (new_width <= self.tolerance) | (new_width >= old_width)
+                solutions.extend(zip(new_lower[is_done], new_upper[is_done]))
+                verified_lower, verified_upper = new_lower[~is_done], new_upper[~is_done]
+
+            if len(queue_lower) == 0:
+                continue
+
+            k_lower, k_upper = self._krawczyk(system, jacobian, queue_lower, queue_upper)
+            has_no_root = ((k_upper < queue_lower) | (k_lower > queue_upper)).any(axis=1)
+            has_unique_root = ((k_lower > queue_lower) & (k_upper < queue_upper)).all(axis=1)
+            verified_lower = np.vstack([verified_lower, k_lower[has_unique_root]])
+            verified_upper = np.vstack([verified_upper, k_upper[has_unique_root]])
+
+            is_undecided = ~has_no_root & ~has_unique_root
+            old_width = (queue_upper - queue_lower)[is_undecided].max(axis=1)
+            undecided_lower = np.fmax(queue_lower, k_lower)[is_undecided]
+            undecided_upper = np.fmin(queue_upper, k_upper)[is_undecided]
+            new_width = (undecided_upper - undecided_lower).max(axis=1)
+
+            # Undecided boxes at the tolerance get one attempt at verification on an inflated box, e.g. for a root on
+            # the boundary between two halves of a bisection
+            is_small = new_width <= self.tolerance
+            if is_small.any():
+                inflation = np.maximum(undecided_upper[is_small] - undecided_lower[is_small], self.tolerance)
+                inflated_lower = undecided_lower[is_small] - inflation
+                inflated_upper = undecided_upper[is_small] + inflation
+                k_lower, k_upper = self._krawczyk(system, jacobian, inflated_lower, inflated_upper)
+                is_inside = ((k_lower > inflated_lower) & (k_upper < inflated_upper)).all(axis=1)
+                # The inflated box reaches outside of the input box, so the unique root it contains is clipped to the
+                # input box; it lies outside if nothing is left or one more Krawczyk step excludes the clipped box
+                clipped_lower, clipped_upper = np.fmax(k_lower, lower), np.fmin(k_upper, upper)
+                is_outside = (clipped_lower > clipped_upper).any(axis=1)
+                is_clipped = is_inside & ~is_outside & ((k_lower < lower) | (k_upper > upper)).any(axis=1)
+                if is_clipped.any():
+                    c_lower, c_upper = clipped_lower[is_clipped], clipped_upper[is_clipped]
+                    kc_lower, kc_upper = self._krawczyk(system, jacobian, c_lower, c_upper)
+                    is_outside[is_clipped] = ((kc_upper < c_lower) | (kc_lower > c_upper)).any(axis=1)
+                is_solution = is_inside & ~is_outside
+                solutions.extend(zip(clipped_lower[is_solution], clipped_upper[is_solution]))
+                unresolved.extend(zip(undecided_lower[is_small][~is_inside], undecided_upper[is_small][~is_inside]))
+
+            is_contracting = ~is_small & (new_width < _CONTRACTION_FACTOR * old_width)
+            is_stalling = ~is_small & ~is_contracting
+            bisected_lower, bisected_upper = self._bisect(undecided_lower[is_stalling], undecided_upper[is_stalling])
+            queue_lower = np.vstack([undecided_lower[is_contracting], bisected_lower])
+            queue_upper = np.vstack([undecided_upper[is_contracting], bisected_upper])
+
+            if len(queue_lower) > self.max_boxes:
+                raise RuntimeError(f"Krawczyk solver exceeded the maximum of {self.max_boxes} boxes")
+
+        # Boxes still being contracted are verified, just wider than the tolerance
+        solutions.extend(zip(verified_lower, verified_upper))
+        unresolved.extend(zip(queue_lower, queue_upper))
+        if not solutions:
+            return [], unresolved
+
+        merged_lower, merged_upper = self._merge_verified_boxes(
+            system, jacobian, np.array([x[0] for x in solutions]), np.array([x[1] for x in solutions])
+        )
+
+        return list(zip(merged_lower, merged_upper)), unresolved
+
+    def _merge_verified_boxes(
+        self, system: List[PolynomialArray], jacobian: List[List[PolynomialArray]], lower: np.ndarray, upper: np.ndarray
+    ) -> IntervalArray:
+        """
+        A root on the face between two halves of a bisection is verified from both sides. Overlapping boxes that each
+        contain a unique root only contain the same root if the Krawczyk test proves that the hull of their cluster, or
+        the hull inflated like an undecided box, contains a unique root; they are then replaced by their intersection,
+        otherwise they are all kept.
+        :param system: n polynomials in n variables
+        :param jacobian: derivatives of the polynomials
+        :param lower: lower bounds of the verified boxes, of shape (N, n)
+        :param upper: upper bounds of the verified boxes, of shape (N, n)
+        :return: lower and upper bounds of the boxes with one box per root
+        """
+        labels = cluster_overlapping_boxes(lower, upper)
+        clusters = [labels == label for label in np.unique(labels)]
+        hull_lower = np.array([lower[members].min(axis=0) for members in clusters])
+        hull_upper = np.array([upper[members].max(axis=0) for members in clusters])
+        k_lower, k_upper = self._krawczyk(system, jacobian, hull_lower, hull_upper)
+        is_unique = ((k_lower > hull_lower) & (k_upper < hull_upper)).all(axis=1)
+        if not is_unique.all():
+            # Boxes at the tolerance can be too narrow for the test on their hull
+            inflation = np.maximum(hull_upper - hull_lower, self.tolerance)[~is_unique]
+            inflated_lower = hull_lower[~is_unique] - inflation
+            inflated_upper = hull_upper[~is_unique] + inflation
+            k_lower, k_upper = self._krawczyk(system, jacobian, inflated_lower, inflated_upper)
+            is_unique[~is_unique] = ((k_lower > inflated_lower) & (k_upper < inflated_upper)).all(axis=1)
+
+        merged_lower, merged_upper = [], []
+        for members, is_same_root in zip(clusters, is_unique):
+            if is_same_root or members.sum() == 1:
+                merged_lower.append(lower[members].max(axis=0))
+                merged_upper.append(upper[members].min(axis=0))
+            else:
+                merged_lower.extend(lower[members])
+                merged_upper.extend(upper[members])
+
+        return np.array(merged_lower), np.array(merged_upper)
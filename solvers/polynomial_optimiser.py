@@ -1,10 +1,24 @@
+from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from fractions import Fraction
+from itertools import chain
+from itertools import islice
 from itertools import product
+from math import nextafter
+from math import prod
+from time import monotonic
+from time import perf_counter
+
+import numpy as np
 
 from pyariadne import dp
 from pyariadne import is_inf
@@ -17,22 +31,56 @@ from pyariadne import FloatDPExactInterval
 from pyariadne import intersection
 from pyariadne import IntervalNewtonSolver
 from pyariadne import MultivariatePolynomial
-from pyariadne import possibly
 from pyariadne import ValidatedVectorMultivariateFunction
 
+from utils._deduplicate_minima import deduplicate_minima
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import box_to_floats
+from utils._float_conversion import floats_to_bounds_vector
+from utils._float_conversion import floatdp_to_float
+from utils._float_conversion import floats_to_box
+from utils._float_conversion import fraction_to_floats
+from utils._real_root_isolation import cauchy_bound
+from utils._real_root_isolation import derivative
+from utils._real_root_isolation import evaluate
+from utils._real_root_isolation import isolate_real_roots
+from utils._real_root_isolation import refine_root
+from utils._real_root_isolation import square_free_part
 from utils.box_operations import box_reciprocal
+from utils.gradient_system import GradientSystem
+from utils.minimisation_cache import MinimisationCache
+from utils.minimisation_result import MinimisationResult
+from utils.optimisation_statistics import Hook
+from utils.optimisation_statistics import OptimisationStatistics
 from utils.polynomial_optimisation_problem import PolynomialOptimisationProblem
 from utils.polynomial_function import PolynomialFunction
+from solvers.krawczyk_solver import KrawczykSolver
 
 INF = FloatDP.inf(dp)
 NAN = FloatDP.nan(dp)
 EPS = FloatDP.eps(dp)
 ZERO = FloatDP(0, dp)
 
+ARIADNE_ENGINE = "ariadne"
+KRAWCZYK_ENGINE = "krawczyk"
+
 B1_STR = "b1"
 B2_STR = "b2"
 B3_STR = "b3"
 
+# Number of subproblems that are created, screened and solved together when streaming
+CHUNK_SIZE = 256
+
+# Memory estimate of a solve: a fixed overhead plus bytes per term of the gradient system and variable for every
+# subdivision the solver is expected to make. Fitted to bound the peak allocations traced by tracemalloc of the
+# KrawczykSolver on dense random systems of 1 to 3 variables, degree 2 to 8 and boxes of width 0.5 to 8, see
+# benchmarks/calibrate_solve_memory.py. The IntervalNewtonSolver allocates outside the Python heap, where its use can
+# be neither traced nor estimated, so the estimate and the memory budget only apply to the KrawczykSolver.
+SOLVE_MEMORY_OVERHEAD = 64 * 2 ** 10
+SOLVE_MEMORY_PER_TERM = 16
+# Maximum number of times a box is bisected to fit the memory budget or after a MemoryError
+MAX_SUBDIVISION_DEPTH = 16
+
 B1 = FloatDPExactInterval((-INF, -1))
 B2 = FloatDPExactInterval((-1, 1))
 B3 = FloatDPExactInterval((1, INF))
@@ -110,13 +158,167 @@ def _compute_polynomial_trick_of_function_for_nth_variable(
     return q
 
 
+# A subproblem as sent to a worker process: the exact bounds of its box and which variables are in reciprocal
+# coordinates
+WorkerTask = Tuple[List[Tuple[float, float]], List[bool]]
+
+_worker_optimiser: Optional["PolynomialOptimiser"] = None
+_worker_system: Optional[GradientSystem] = None
+
+
+def _initialise_worker(optimiser: "PolynomialOptimiser", system: GradientSystem) -> None:
+    global _worker_optimiser, _worker_system
+    _worker_optimiser = optimiser
+    _worker_system = system
+
+
+def _create_problem_from_system(
+    system: GradientSystem, D: FloatDPExactBox, is_conversion_needed_per_dimension: List[bool]
+) -> PolynomialOptimisationProblem:
+    problem = PolynomialOptimisationProblem(
+        f=system.vector_function(is_conversion_needed_per_dimension),
+        D=D,
+        is_conversion_needed_per_dimension=is_conversion_needed_per_dimension,
+        components=system.components(is_conversion_needed_per_dimension)
+    )
+
+    return problem
+
+
+def _to_worker_task(p: PolynomialOptimisationProblem) -> WorkerTask:
+    return box_to_floats(p.D), list(p.is_conversion_needed_per_dimension)
+
+
+def _find_all_minima_within_box_in_worker(
+    task: WorkerTask
+) -> Tuple[List[List[Tuple[float, float]]], OptimisationStatistics]:
+    # The gradient system was sent once by the initializer; the vector function of every choice of components is built
+    # at most once per worker
+    domain_bounds, is_conversion_needed_per_dimension = task
+
+    # Every box gets its own statistics, which are merged into the statistics of the caller
+    _worker_optimiser.statistics = OptimisationStatistics()
+    with _worker_optimiser.statistics.timing("conversion"):
+        p = _create_problem_from_system(
+            system=_worker_system,
+            D=floats_to_box(domain_bounds),
+            is_conversion_needed_per_dimension=is_conversion_needed_per_dimension
+        )
+    minima = _worker_optimiser._find_all_minima_within_box(system=_worker_system, p=p)
+
+    # FloatDPBoundsVector cannot be pickled, so the exact bounds are sent back as doubles
+    with _worker_optimiser.statistics.timing("conversion"):
+        minima_bounds = [bounds_vector_to_floats(x) for x in minima]
+
+    return minima_bounds, _worker_optimiser.statistics
+
+
 class PolynomialOptimiser:
+    workers: Optional[int]
+    gradient_exclusion: bool
+    tolerance: float
+    max_steps: int
+    coarse_tolerance: Optional[float]
+    coarse_max_steps: int
+    engine: str
+    exact_univariate: bool
+    cache: Optional[MinimisationCache]
+    hooks: List[Hook]
+    memory_budget: Optional[int]
+    statistics: OptimisationStatistics
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        gradient_exclusion: bool = True,
+        tolerance: float = 1e-8,
+        max_steps: int = 10,
+        coarse_tolerance: Optional[float] = None,
+        coarse_max_steps: int = 3,
+        engine: str = ARIADNE_ENGINE,
+        exact_univariate: bool = True,
+        cache: Optional[MinimisationCache] = None,
+        hooks: Optional[List[Hook]] = None,
+        memory_budget: Optional[int] = None
+    ) -> None:
+        """
+        :param workers: number of processes to solve the subproblems with; None or 1 solves them sequentially
+        :param gradient_exclusion: drop the boxes on which a component of the gradient system provably has no zero
+            before calling the solver
+        :param tolerance: tolerance of the interval Newton solver
+        :param max_steps: maximum number of steps of the interval Newton solver
+        :param coarse_tolerance: if given, every box is first solved with this looser tolerance and coarse_max_steps,
+            and only the neighbourhoods of the candidates found are solved again with tolerance and max_steps; a box
+            on which the coarse solve fails or finds no candidates is solved again as a whole
+        :param coarse_max_steps: maximum number of steps of the coarse solve
+        :param engine: ARIADNE_ENGINE solves the gradient systems with the IntervalNewtonSolver of pyariadne,
+            KRAWCZYK_ENGINE with the vectorised KrawczykSolver on the polynomial components, using tolerance as the
+            width of the returned boxes and falling back to the IntervalNewtonSolver on the boxes it cannot resolve
+            (the coarse solve only applies to the IntervalNewtonSolver)
+        :param exact_univariate: minimise univariate polynomials with exact coefficients by exact real root isolation
+            of the derivative instead of the subproblem pipeline
+        :param cache: cache of the results of minimise_all (and minimise without branch and bound), shared by all
+            problems with the same merged terms, domain and settings
+        :param hooks: called as hook(event, data) for every event recorded in statistics, see OptimisationStatistics
+        :param memory_budget: number of bytes the solves of a call may use, shared between the workers; with
+            KRAWCZYK_ENGINE, boxes whose estimated cost exceeds it are bisected before solving. The budget does not
+            hold for the IntervalNewtonSolver, i.e. for ARIADNE_ENGINE and the boxes the KrawczykSolver leaves
+            unresolved. Boxes are bisected after a MemoryError of either solver whether or not a budget is given, and
+            the MemoryError is raised if it persists after MAX_SUBDIVISION_DEPTH bisections.
+        """
+        assert engine in (ARIADNE_ENGINE, KRAWCZYK_ENGINE), f"Unknown engine {engine}"
+
+        self.workers = workers
+        self.gradient_exclusion = gradient_exclusion
+        self.tolerance = tolerance
+        self.max_steps = max_steps
+        self.coarse_tolerance = coarse_tolerance
+        self.coarse_max_steps = coarse_max_steps
+        self.engine = engine
+        self.exact_univariate = exact_univariate
+        self.cache = cache
+        self.hooks = [] if hooks is None else list(hooks)
+        self.memory_budget = memory_budget
+        self.statistics = OptimisationStatistics(hooks=self.hooks)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The workers do not use the cache, which may hold many entries, and report their statistics back instead of
+        # running the hooks
+        state = dict(vars(self))
+        state["cache"] = None
+        state["hooks"] = []
+        state["statistics"] = OptimisationStatistics()
+        return state
+
+    def _configuration(self) -> Tuple[Any, ...]:
+        """
+        Settings that can change the minima found, part of the cache key
+        """
+        return (
+            self.gradient_exclusion,
+            self.tolerance,
+            self.max_steps,
+            self.coarse_tolerance,
+            self.coarse_max_steps,
+            self.engine,
+            self.exact_univariate,
+            self.memory_budget
+        )
+
     @staticmethod
     def solve_of_system_of_equations_within_box(
         solver: IntervalNewtonSolver,
         system_of_equations: ValidatedVectorMultivariateFunction,
-        domain: FloatDPExactBox
+        domain: FloatDPExactBox,
+        statistics: Optional[OptimisationStatistics] = None
     ) -> List[FloatDPBoundsVector]:
+        """
+        :param solver: solver to use
+        :param system_of_equations: system to find the roots of
+        :param domain: box to search
+        :param statistics: if given, a RuntimeError of the solver is recorded in it as a solver failure
+        :return: the roots found, none if the solver failed
+        """
         try:
             solutions = solver.solve_all(system_of_equations, domain)
             # if solutions:
@@ -124,26 +326,21 @@ class PolynomialOptimiser:
             #     print(system_of_equations)
             #     print(system_of_equations(solutions[0]))
             #     input()
-        except RuntimeError:
+        except RuntimeError as e:
+            if statistics is not None:
+                statistics.record_solver_failure(message=str(e))
             solutions = []
 
         return solutions if isinstance(solutions, list) else [solutions]
 
-    def _create_subproblems(
-        self, f: PolynomialFunction, D: FloatDPExactBox
-    ) -> Tuple[List[PolynomialFunction], List[PolynomialOptimisationProblem]]:
-        n_variables = f.n_variables
-
-        endpoints_infinity = _check_endpoints_infinity(D=D)
-        all_domains = _compute_boxes_to_optimise_over(D=D, endpoints_infinity=endpoints_infinity)
-        possible_domains_per_variable = [list(x.keys()) for x in all_domains.values()]
-        domains_per_problem = list(product(*possible_domains_per_variable, repeat=1))
-
+    def _create_gradient_system(
+        self, f: PolynomialFunction, endpoints_infinity: Dict[int, Dict[str, bool]]
+    ) -> GradientSystem:
+        gradient = f.gradient()
+        hessian_diagonal = []
         all_functions_per_variable = {}
-        f_derivatives = []
-        for n in range(n_variables):
-            f_derivative = f.derivative(n=n)
-            f_derivatives.append(f_derivative)
+        for n, f_derivative in enumerate(gradient):
+            hessian_diagonal.append(f_derivative.derivative(n=n))
 
             need_to_compute_trick = any(list(endpoints_infinity[n].values()))
             functions = [f_derivative]
@@ -153,53 +350,365 @@ class PolynomialOptimiser:
 
             all_functions_per_variable[n] = functions
 
-        problems = []
-        for x in domains_per_problem:
-            functions = []
-            domains = []
-            list_of_booleans_converting = []
-            for n in range(n_variables):
-                box = x[n]
-                possible_functions_for_nth_variable = all_functions_per_variable[n]
-                need_to_convert = False
-                function = possible_functions_for_nth_variable[0]
-                if box != B2_STR and endpoints_infinity[n][box]:
-                    need_to_convert = True
-                    function = possible_functions_for_nth_variable[1]
-
-                functions.append(function.function)
-                list_of_booleans_converting.append(need_to_convert)
-
-                domain = all_domains[n][box]
-                domains.append(domain)
-
-            problem = PolynomialOptimisationProblem(
-                f=ValidatedVectorMultivariateFunction(functions),
-                D=FloatDPExactBox(domains),
-                is_conversion_needed_per_dimension=list_of_booleans_converting
+        system = GradientSystem(
+            gradient=gradient,
+            hessian_diagonal=hessian_diagonal,
+            functions_per_variable=all_functions_per_variable
+        )
+        with self.statistics.timing("conversion"):
+            system.build_representations()
+
+        return system
+
+    @staticmethod
+    def _create_subproblem(
+        system: GradientSystem,
+        all_domains: Dict[int, Dict[str, FloatDPExactBox]],
+        endpoints_infinity: Dict[int, Dict[str, bool]],
+        boxes: Tuple[str, ...]
+    ) -> PolynomialOptimisationProblem:
+        domains = []
+        list_of_booleans_converting = []
+        for n, box in enumerate(boxes):
+            need_to_convert = box != B2_STR and endpoints_infinity[n][box]
+            list_of_booleans_converting.append(need_to_convert)
+
+            domain = all_domains[n][box]
+            domains.append(domain)
+
+        problem = _create_problem_from_system(
+            system=system, D=FloatDPExactBox(domains), is_conversion_needed_per_dimension=list_of_booleans_converting
+        )
+
+        return problem
+
+    def _create_subproblems_lazily(
+        self, f: PolynomialFunction, D: FloatDPExactBox
+    ) -> Tuple[GradientSystem, Iterator[PolynomialOptimisationProblem], int]:
+        """
+        Build the gradient system and a generator of the subproblems, which are only created when consumed
+        :param f: objective function
+        :param D: domain
+        :return: gradient system, generator of the subproblems and the number of subproblems it yields
+        """
+        endpoints_infinity = _check_endpoints_infinity(D=D)
+        all_domains = _compute_boxes_to_optimise_over(D=D, endpoints_infinity=endpoints_infinity)
+        possible_domains_per_variable = [list(x.keys()) for x in all_domains.values()]
+        n_problems = prod(len(x) for x in possible_domains_per_variable)
+
+        system = self._create_gradient_system(f=f, endpoints_infinity=endpoints_infinity)
+        problems = (
+            self._create_subproblem(
+                system=system, all_domains=all_domains, endpoints_infinity=endpoints_infinity, boxes=x
+            )
+            for x in product(*possible_domains_per_variable, repeat=1)
+        )
+
+        return system, problems, n_problems
+
+    def _create_subproblems(
+        self, f: PolynomialFunction, D: FloatDPExactBox
+    ) -> Tuple[GradientSystem, List[PolynomialOptimisationProblem]]:
+        system, problems, _ = self._create_subproblems_lazily(f=f, D=D)
+
+        return system, list(problems)
+
+    def _exclude_boxes_without_critical_points(
+        self, system: GradientSystem, problems: List[PolynomialOptimisationProblem]
+    ) -> List[PolynomialOptimisationProblem]:
+        """
+        Drop the subproblems whose gradient system cannot have a root in their box, because the interval evaluation of
+        one of its components over the box excludes zero. Every component is evaluated over all boxes that use it at
+        once.
+        :param system: gradient system the subproblems are built from
+        :param problems: subproblems to screen
+        :return: subproblems that may contain a critical point
+        """
+        if not problems:
+            return problems
+
+        boxes = np.array([box_to_floats(p.D) for p in problems], dtype=float)
+        is_excluded = np.zeros(len(problems), dtype=bool)
+        for n in range(boxes.shape[1]):
+            for need_to_convert in (False, True):
+                indices = [
+                    i for i, p in enumerate(problems)
+                    if p.is_conversion_needed_per_dimension[n] == need_to_convert and not is_excluded[i]
+                ]
+                if not indices:
+                    continue
+
+                component = system.component(n=n, need_to_convert=need_to_convert)
+                lower, upper = component.evaluate_many(boxes[indices])
+                is_excluded[indices] = (lower > 0) | (upper < 0)
+
+        self.statistics.n_excluded_boxes += int(is_excluded.sum())
+
+        return [p for p, x in zip(problems, is_excluded) if not x]
+
+    def _solve_with_krawczyk(self, p: PolynomialOptimisationProblem) -> List[FloatDPBoundsVector]:
+        """
+        Solve a subproblem with the KrawczykSolver, falling back to the IntervalNewtonSolver of pyariadne on the boxes
+        it leaves unresolved, or on the whole box if it fails
+        :param p: subproblem
+        :return: the roots found
+        """
+        assert p.components is not None, "The Krawczyk engine needs problems built from polynomial components"
+
+        solver = KrawczykSolver(tolerance=self.tolerance)
+        bounds = np.array(box_to_floats(p.D), dtype=float)
+        try:
+            boxes, unresolved = solver.solve_all(
+                system=[x.array for x in p.components], lower=bounds[:, 0], upper=bounds[:, 1]
+            )
+        except RuntimeError as e:
+            self.statistics.record_solver_failure(message=str(e))
+            return self._solve_with_interval_newton(p=p, domain=p.D)
+
+        solutions = [
+            floats_to_bounds_vector(list(zip(lower.tolist(), upper.tolist()))) for lower, upper in boxes
+        ]
+        if unresolved:
+            self.statistics.record_solver_failure(
+                message=f"Krawczyk solver left {len(unresolved)} boxes unresolved"
+            )
+        for lower, upper in unresolved:
+            solutions.extend(self._solve_with_interval_newton(
+                p=p, domain=floats_to_box(list(zip(lower.tolist(), upper.tolist())))
+            ))
+
+        return solutions
+
+    def _solve_with_interval_newton(
+        self, p: PolynomialOptimisationProblem, domain: FloatDPExactBox
+    ) -> List[FloatDPBoundsVector]:
+        """
+        :param p: subproblem
+        :param domain: box to solve the gradient system of p within
+        :return: the roots found by the IntervalNewtonSolver of pyariadne
+        """
+        solver = IntervalNewtonSolver(self.tolerance, self.max_steps)
+        if self.coarse_tolerance is None:
+            return self.solve_of_system_of_equations_within_box(
+                solver=solver, system_of_equations=p.f, domain=domain, statistics=self.statistics
+            )
+
+        coarse_solver = IntervalNewtonSolver(self.coarse_tolerance, self.coarse_max_steps)
+        # A failure of the coarse solve is not recorded, the box is then solved again as a whole
+        candidates = self.solve_of_system_of_equations_within_box(
+            solver=coarse_solver, system_of_equations=p.f, domain=domain
+        )
+        if not candidates:
+            return self.solve_of_system_of_equations_within_box(
+                solver=solver, system_of_equations=p.f, domain=domain, statistics=self.statistics
+            )
+
+        domain_bounds = box_to_floats(domain)
+        solutions = []
+        for x in candidates:
+            # Refine within the candidate widened by the coarse tolerance, clipped to the box being solved
+            candidate_box = [
+                (max(nextafter(lower - self.coarse_tolerance, -np.inf), domain_lower),
+                 min(nextafter(upper + self.coarse_tolerance, np.inf), domain_upper))
+                for (lower, upper), (domain_lower, domain_upper) in zip(bounds_vector_to_floats(x), domain_bounds)
+            ]
+            solutions.extend(self.solve_of_system_of_equations_within_box(
+                solver=solver,
+                system_of_equations=p.f,
+                domain=floats_to_box(candidate_box),
+                statistics=self.statistics
+            ))
+
+        return solutions
+
+    def _solve_within_box(self, p: PolynomialOptimisationProblem) -> List[FloatDPBoundsVector]:
+        if self.engine == KRAWCZYK_ENGINE:
+            return self._solve_with_krawczyk(p=p)
+
+        return self._solve_with_interval_newton(p=p, domain=p.D)
+
+    @staticmethod
+    def _estimate_solve_memory(p: PolynomialOptimisationProblem) -> Optional[float]:
+        """
+        Peak memory use of solving a subproblem, see SOLVE_MEMORY_PER_TERM: the solver holds enclosures of every term of
+        the system and its Jacobian for every box of its subdivision, and the number of boxes grows with the width of
+        the box times the degree of the system in every variable
+        :param p: subproblem
+        :return: estimated number of bytes, None if p has no polynomial components to estimate from
+        """
+        if p.components is None:
+            return None
+
+        arrays = [x.array for x in p.components]
+        n_terms = sum(x.n_terms for x in arrays)
+        degree = max((int(x.exponents.sum(axis=1).max()) for x in arrays if x.n_terms), default=0)
+        widths = [upper - lower for lower, upper in box_to_floats(p.D)]
+        n_boxes = prod(1 + width * degree for width in widths)
+
+        return SOLVE_MEMORY_OVERHEAD + SOLVE_MEMORY_PER_TERM * n_terms * len(widths) * n_boxes
+
+    @staticmethod
+    def _bisect_problem(p: PolynomialOptimisationProblem) -> Optional[List[PolynomialOptimisationProblem]]:
+        """
+        Split the box of a subproblem in two along its widest side. The halves overlap by a few ulps, like the boxes
+        of _compute_boxes_to_optimise_over, so that a root on the cut is not lost.
+        :param p: subproblem
+        :return: the two halves, None if the box cannot be bisected
+        """
+        bounds = box_to_floats(p.D)
+        widths = [upper - lower for lower, upper in bounds]
+        i = int(np.argmax(widths))
+        lower, upper = bounds[i]
+        middle = lower + (upper - lower) / 2
+        if not np.isfinite(widths[i]) or not lower < middle < upper:
+            return None
+
+        overlap = floatdp_to_float(EPS) * max(1.0, abs(middle))
+        halves = []
+        for half in ((lower, min(middle + overlap, upper)), (max(middle - overlap, lower), upper)):
+            half_bounds = list(bounds)
+            half_bounds[i] = half
+            halves.append(PolynomialOptimisationProblem(
+                f=p.f,
+                D=floats_to_box(half_bounds),
+                is_conversion_needed_per_dimension=p.is_conversion_needed_per_dimension,
+                components=p.components
+            ))
+
+        return halves
+
+    def _solve_within_memory_budget(
+        self, p: PolynomialOptimisationProblem, depth: int = 0
+    ) -> List[FloatDPBoundsVector]:
+        """
+        Solve a subproblem, bisecting it first while its estimated cost exceeds the memory budget of one worker (only
+        with the Krawczyk engine, which the estimate is calibrated for), and bisecting it and retrying after a
+        MemoryError. The roots of the halves are deduplicated.
+        :param p: subproblem
+        :param depth: number of bisections that led to p
+        :return: the roots found
+        :raises MemoryError: if the solver runs out of memory on a box that cannot be bisected any further, as
+            returning the other roots alone would silently drop the roots in that box
+        """
+        def solve_halves(halves: List[PolynomialOptimisationProblem]) -> List[FloatDPBoundsVector]:
+            return deduplicate_minima(
+                [x for q in halves for x in self._solve_within_memory_budget(p=q, depth=depth + 1)]
             )
-            problems.append(problem)
 
-        return f_derivatives, problems
+        if self.memory_budget is not None and self.engine == KRAWCZYK_ENGINE and depth < MAX_SUBDIVISION_DEPTH:
+            budget = self.memory_budget / max(1, self.workers or 1)
+            estimate = self._estimate_solve_memory(p=p)
+            # Bisection cannot bring the estimate below the fixed overhead of a solve
+            if estimate is not None and estimate > budget > SOLVE_MEMORY_OVERHEAD:
+                halves = self._bisect_problem(p=p)
+                if halves is not None:
+                    self.statistics.record_subdivision(reason="estimate")
+                    return solve_halves(halves)
+
+        try:
+            return self._solve_within_box(p=p)
+        except MemoryError as e:
+            self.statistics.record_solver_failure(message=f"MemoryError: {e}")
+            halves = self._bisect_problem(p=p) if depth < MAX_SUBDIVISION_DEPTH else None
+            if halves is None:
+                raise
+            self.statistics.record_subdivision(reason="memory_error")
+            return solve_halves(halves)
 
     def _find_all_minima_within_box(
-        self, f: PolynomialFunction, p: PolynomialOptimisationProblem
+        self, system: GradientSystem, p: PolynomialOptimisationProblem
     ) -> List[FloatDPBoundsVector]:
-        solver = IntervalNewtonSolver(1e-8, 10)
-        solutions = self.solve_of_system_of_equations_within_box(solver=solver, system_of_equations=p.f, domain=p.D)
+        start = perf_counter()
+        with self.statistics.timing("solve"):
+            solutions = self._solve_within_memory_budget(p=p)
+        self.statistics.record_box(seconds=perf_counter() - start, n_roots=len(solutions))
 
-        minima = []
-        for i, x in enumerate(solutions):
-            for dimension in range(len(p.is_conversion_needed_per_dimension)):
-                if p.is_conversion_needed_per_dimension[dimension]:
-                    x[dimension] = 1 / x[dimension]
+        with self.statistics.timing("conversion"):
+            for x in solutions:
+                for dimension in range(len(p.is_conversion_needed_per_dimension)):
+                    if p.is_conversion_needed_per_dimension[dimension]:
+                        x[dimension] = 1 / x[dimension]
 
-            second_derivative_test = [possibly(f.second_derivative(n_1=dim)(x) > 0) for dim in range(x.size())]
-            if all(second_derivative_test):
-                minima.append(solutions[i])
+        if not solutions:
+            return []
+
+        is_possibly_minimum = np.ones(len(solutions), dtype=bool)
+        for second_derivative in system.hessian_diagonal:
+            _, second_derivative_upper = second_derivative.evaluate_many(solutions)
+            is_possibly_minimum &= second_derivative_upper > 0
+        minima = [x for x, is_minimum in zip(solutions, is_possibly_minimum) if is_minimum]
+        if len(minima) < len(solutions):
+            self.statistics.record_second_derivative_rejections(n=len(solutions) - len(minima))
 
         return minima
 
+    def _create_executor(self, system: GradientSystem) -> Union[ProcessPoolExecutor, nullcontext]:
+        """
+        :param system: gradient system the subproblems are built from, sent to every worker once
+        :return: pool of self.workers processes, or a null context (entered as None) when solving sequentially
+        """
+        if self.workers is None or self.workers <= 1:
+            return nullcontext()
+
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_initialise_worker, initargs=(self, system))
+
+    def _iter_minima_of_boxes(
+        self,
+        executor: Optional[ProcessPoolExecutor],
+        system: GradientSystem,
+        problems: List[PolynomialOptimisationProblem],
+        chunksize: int = 1
+    ) -> Iterator[List[FloatDPBoundsVector]]:
+        """
+        :param executor: pool of _create_executor, None to solve in this process
+        :param system: gradient system the subproblems are built from
+        :param problems: subproblems to solve
+        :param chunksize: number of boxes sent to a worker at once
+        :return: generator of the minima found in every box, in the order of problems
+        """
+        if executor is None:
+            for p in problems:
+                yield self._find_all_minima_within_box(system=system, p=p)
+            return
+
+        # map yields the results in the order of the problems, so the minima do not depend on scheduling
+        tasks = [_to_worker_task(p) for p in problems]
+        results = executor.map(_find_all_minima_within_box_in_worker, tasks, chunksize=chunksize)
+        for solutions, box_statistics in results:
+            self.statistics.merge(box_statistics)
+            with self.statistics.timing("conversion"):
+                minima = [floats_to_bounds_vector(x) for x in solutions]
+            yield minima
+
+    def _iter_minima_per_box(
+        self, system: GradientSystem, problems: Iterator[PolynomialOptimisationProblem]
+    ) -> Iterator[Tuple[int, List[FloatDPBoundsVector]]]:
+        """
+        Screen and solve the subproblems in chunks of CHUNK_SIZE, in the order of the generator
+        :param system: gradient system the subproblems are built from
+        :param problems: generator of the subproblems
+        :return: generator of the number of boxes finished and the minima found in them
+        """
+        with self._create_executor(system=system) as executor:
+            while True:
+                with self.statistics.timing("create_subproblems"):
+                    chunk = list(islice(problems, CHUNK_SIZE))
+                if not chunk:
+                    break
+
+                remaining = chunk
+                if self.gradient_exclusion:
+                    with self.statistics.timing("exclusion"):
+                        remaining = self._exclude_boxes_without_critical_points(system=system, problems=chunk)
+                    if len(remaining) < len(chunk):
+                        yield len(chunk) - len(remaining), []
+
+                chunksize = 1 if executor is None else max(1, len(remaining) // (4 * self.workers))
+                for minima in self._iter_minima_of_boxes(
+                    executor=executor, system=system, problems=remaining, chunksize=chunksize
+                ):
+                    yield 1, minima
+
     def _get_endpoints_if_minima(
         self, f_derivatives: List[PolynomialFunction], D: FloatDPExactBox
     ) -> List[FloatDPBoundsVector]:
@@ -209,50 +718,384 @@ class PolynomialOptimiser:
             lower_endpoints.append(D[x].lower_bound())
             upper_endpoints.append(D[x].upper_bound())
 
+        # Every partial derivative is evaluated at the corner, not at one of its coordinates
+        lower_corner = FloatDPBoundsVector(lower_endpoints)
+        upper_corner = FloatDPBoundsVector(upper_endpoints)
+        self.statistics.record_endpoint_checks(n=2)
         to_add = []
-        if all([definitely(f(x) > 0) for f, x in zip(f_derivatives, lower_endpoints)]):
-            to_add.append(FloatDPBoundsVector(lower_endpoints))
-        if all([definitely(f(x) < 0) for f, x in zip(f_derivatives, upper_endpoints)]):
-            to_add.append(FloatDPBoundsVector(upper_endpoints))
+        if all([definitely(f(lower_corner) > 0) for f in f_derivatives]):
+            to_add.append(lower_corner)
+        if all([definitely(f(upper_corner) < 0) for f in f_derivatives]):
+            to_add.append(upper_corner)
 
         return to_add
 
 
-    def minimise_all(self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None) -> List[FloatDPBoundsVector]:
+    def _find_univariate_minima(self, f: PolynomialFunction, D: FloatDPExactBox) -> Optional[List[FloatDPBoundsVector]]:
+        """
+        Minima of a univariate polynomial with exact coefficients: the real roots of the square-free part of f' are
+        isolated exactly by Vincent-Collins-Akritas bisection over D, or over a Cauchy bound of the roots if D is
+        unbounded, and refined to the tolerance. A root is a minimum if f' is negative at the lower and positive at the
+        upper end of its isolating interval. Critical points on the boundary of D are found from an interval that
+        slightly exceeds D. The whole of D counts as one box in the statistics, with the critical points that are not
+        minima as second derivative rejections.
+        :param f: univariate objective function
+        :param D: domain
+        :return: the minima of f within D, or None if the coefficients of f are not exact
+        """
+        with self.statistics.timing("conversion"):
+            array = f.array
+            if not np.array_equal(array.lower, array.upper) or not np.isfinite(array.lower).all():
+                return None
+            if array.exponents.size and array.exponents.min() < 0:
+                return None
+
+            degree = int(array.exponents.max()) if array.exponents.size else 0
+            coefficients = [Fraction(0)] * (degree + 1)
+            for (k,), c in zip(array.exponents.tolist(), array.lower.tolist()):
+                coefficients[k] += Fraction(c)
+        f_derivative = derivative(coefficients)
+        if not f_derivative:
+            return None
+
+        start = perf_counter()
+        with self.statistics.timing("solve"):
+            roots = self._find_univariate_critical_points(f_derivative=f_derivative, D=D)
+        self.statistics.record_box(seconds=perf_counter() - start, n_roots=len(roots))
+
+        minima = [x for x, is_minimum in roots if is_minimum]
+        if len(minima) < len(roots):
+            self.statistics.record_second_derivative_rejections(n=len(roots) - len(minima))
+
+        return minima
+
+    def _find_univariate_critical_points(
+        self, f_derivative: List[Fraction], D: FloatDPExactBox
+    ) -> List[Tuple[FloatDPBoundsVector, bool]]:
+        """
+        :param f_derivative: exact coefficients of the derivative of the objective, not all zero
+        :param D: domain
+        :return: enclosures of the critical points within D, each with whether it is a minimum
+        """
+        if len(f_derivative) < 2:
+            # Linear f has no critical points
+            return []
+
+        g = square_free_part(f_derivative)
+        bound = cauchy_bound(g)
+        (domain_lower, domain_upper), = box_to_floats(D)
+        lower = -bound if np.isinf(domain_lower) else Fraction(domain_lower)
+        upper = bound if np.isinf(domain_upper) else Fraction(domain_upper)
+        margin = max(upper - lower, Fraction(1)) / 2 ** 52
+        lower, upper = lower - margin, upper + margin
+        while evaluate(g, lower) == 0:
+            lower -= margin
+        while evaluate(g, upper) == 0:
+            upper += margin
+
+        tolerance = Fraction(self.tolerance)
+        roots = []
+        for a, b in isolate_real_roots(g, lower, upper):
+            root_lower, root_upper = refine_root(g, a, b, tolerance)
+            if root_upper < domain_lower or root_lower > domain_upper:
+                continue
+            roots.append((
+                floats_to_bounds_vector([(fraction_to_floats(root_lower)[0], fraction_to_floats(root_upper)[1])]),
+                evaluate(f_derivative, a) < 0 < evaluate(f_derivative, b)
+            ))
+
+        return roots
+
+    def iter_minima(
+        self,
+        f: PolynomialFunction,
+        D: Optional[FloatDPExactBox] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Iterator[FloatDPBoundsVector]:
+        """
+        Yield the verified minima of f as soon as the box they are found in is solved. Subproblems are created lazily
+        and handled in chunks, so memory use does not grow with the number of boxes.
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :param progress: called as progress(n_finished_boxes, n_boxes) whenever boxes are finished
+        :return: generator of the minima, followed by the endpoints of D that are minima
+        """
         n_variables = f.n_variables
         domain = FloatDPExactBox([(-INF, INF) for _ in range(n_variables)]) if D is None else D
 
         assert domain.dimension() == n_variables, "Boxes not specified for all variables"
 
-        f_derivatives, problems = self._create_subproblems(f=f, D=domain)
-        minima = []
-        for p in problems:
-            solutions_to_problem = self._find_all_minima_within_box(f=f, p=p)
-            minima = [*minima, *solutions_to_problem]
+        self.statistics = OptimisationStatistics(hooks=self.hooks)
+        if n_variables == 1 and self.exact_univariate:
+            minima = self._find_univariate_minima(f=f, D=domain)
+            if minima is not None:
+                self.statistics.n_subproblems = 1
+                yield from minima
+                if progress is not None:
+                    progress(1, 1)
+                if D is not None:
+                    yield from self._get_endpoints_if_minima(f_derivatives=f.gradient(), D=domain)
+                return
+
+        with self.statistics.timing("create_subproblems"):
+            system, problems, n_problems = self._create_subproblems_lazily(f=f, D=domain)
+        self.statistics.n_subproblems = n_problems
+
+        n_finished_boxes = 0
+        for n_boxes, solutions_to_problem in self._iter_minima_per_box(system=system, problems=problems):
+            yield from solutions_to_problem
+            n_finished_boxes += n_boxes
+            if progress is not None:
+                progress(n_finished_boxes, n_problems)
 
         if D is not None:
-            minima = [*minima, *self._get_endpoints_if_minima(f_derivatives=f_derivatives, D=domain)]
+            yield from self._get_endpoints_if_minima(f_derivatives=system.gradient, D=domain)
+
+    def _deduplicate(self, minima: List[FloatDPBoundsVector]) -> List[FloatDPBoundsVector]:
+        deduplicated = deduplicate_minima(minima)
+        self.statistics.n_merged_minima += len(minima) - len(deduplicated)
+
+        return deduplicated
+
+    def minimise_all(
+        self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None, return_statistics: bool = False
+    ) -> Union[List[FloatDPBoundsVector], Tuple[List[FloatDPBoundsVector], OptimisationStatistics]]:
+        """
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :param return_statistics: also return the statistics of the call
+        :return: the verified minima of f, where a minimum found in several overlapping boxes is reported once, and
+            the statistics if return_statistics
+        """
+        minima = self._minimise_all(f=f, D=D)
+
+        return (minima, self.statistics) if return_statistics else minima
+
+    def _minimise_all(self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None) -> List[FloatDPBoundsVector]:
+        if self.cache is None:
+            return self._deduplicate(list(self.iter_minima(f=f, D=D)))
+
+        key = self.cache.key(f=f, D=D, configuration=self._configuration())
+        minima = self.cache.get(key)
+        if minima is not None:
+            self.statistics = OptimisationStatistics(hooks=self.hooks)
+            self.statistics.n_cache_hits = 1
+            return minima
+
+        minima = self._deduplicate(list(self.iter_minima(f=f, D=D)))
+        self.cache.put(key, minima)
 
         return minima
 
+    def _compute_global_minima(
+        self, f: PolynomialFunction, minima: List[FloatDPBoundsVector]
+    ) -> List[FloatDPBoundsVector]:
+        """
+        Minima whose objective value cannot be distinguished from the best one: the lower bound of f at each of them
+        does not exceed the smallest upper bound of f over all minima
+        :param f: objective function
+        :param minima: verified minima
+        :return: the tied global minima, in the order of minima
+        """
+        if not minima:
+            return []
+
+        with self.statistics.timing("selection"):
+            objective_lower, objective_upper = f.evaluate_many(minima)
+            best_objective_upper = objective_upper.min()
+            global_minima = [
+                x for x, x_objective_lower in zip(minima, objective_lower) if x_objective_lower <= best_objective_upper
+            ]
+
+        return global_minima
+
     def _compute_global_minimum(
         self, f: PolynomialFunction, minima: List[FloatDPBoundsVector]
     ) -> Union[FloatDPBoundsVector, None]:
         if not minima:
             return None
 
-        global_minimum = INF
-        global_minimum_objective_value = INF
-        for x in minima:
-            x_objective_value = f(x)
-            if definitely(x_objective_value < global_minimum_objective_value):
-                global_minimum = x
-                global_minimum_objective_value = x_objective_value
+        with self.statistics.timing("selection"):
+            objective_lower, objective_upper = f.evaluate_many(minima)
+            global_minimum = INF
+            global_minimum_objective_lower = np.inf
+            for x, x_objective_lower, x_objective_upper in zip(minima, objective_lower, objective_upper):
+                if x_objective_upper < global_minimum_objective_lower:
+                    global_minimum = x
+                    global_minimum_objective_lower = x_objective_lower
 
         return global_minimum
 
-    def minimise(self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None) -> FloatDPBoundsVector:
-        all_minima = self.minimise_all(f=f, D=D)
-        global_minimum = self._compute_global_minimum(f=f, minima=all_minima)
+    @staticmethod
+    def _compute_objective_lower_bounds(
+        f: PolynomialFunction, problems: List[PolynomialOptimisationProblem]
+    ) -> np.ndarray:
+        """
+        Cheap lower bound of f over the box of every subproblem, from one interval evaluation over the box.
+        Boxes in reciprocal coordinates cover unbounded parts of the domain and get -inf.
+        :param f: objective function
+        :param problems: subproblems to bound
+        :return: lower bound of f for every subproblem
+        """
+        lower_bounds = np.full(len(problems), -np.inf)
+        bounded = [i for i, p in enumerate(problems) if not any(p.is_conversion_needed_per_dimension)]
+        if bounded:
+            boxes = np.array([box_to_floats(problems[i].D) for i in bounded], dtype=float)
+            box_lower_bounds, _ = f.evaluate_many(boxes)
+            lower_bounds[bounded] = np.nan_to_num(box_lower_bounds, nan=-np.inf)
+
+        return lower_bounds
+
+    def _minimise_with_branch_and_bound(
+        self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None
+    ) -> Union[FloatDPBoundsVector, None]:
+        n_variables = f.n_variables
+        domain = FloatDPExactBox([(-INF, INF) for _ in range(n_variables)]) if D is None else D
+
+        assert domain.dimension() == n_variables, "Boxes not specified for all variables"
+
+        self.statistics = OptimisationStatistics(hooks=self.hooks)
+        with self.statistics.timing("create_subproblems"):
+            system, problems = self._create_subproblems(f=f, D=domain)
+        self.statistics.n_subproblems = len(problems)
+        if self.gradient_exclusion:
+            with self.statistics.timing("exclusion"):
+                problems = self._exclude_boxes_without_critical_points(system=system, problems=problems)
+
+        minima = self._get_endpoints_if_minima(f_derivatives=system.gradient, D=domain) if D is not None else []
+        incumbent = np.inf
+        if minima:
+            _, objective_upper = f.evaluate_many(minima)
+            incumbent = objective_upper.min()
+
+        lower_bounds = self._compute_objective_lower_bounds(f=f, problems=problems)
+        order = np.argsort(lower_bounds, kind="stable")
+        for k, i in enumerate(order):
+            if lower_bounds[i] > incumbent:
+                # The boxes are sorted by their lower bound, so all remaining boxes are dominated as well
+                self.statistics.n_pruned_boxes = len(order) - k
+                break
+
+            solutions_to_problem = self._find_all_minima_within_box(system=system, p=problems[i])
+            if solutions_to_problem:
+                _, objective_upper = f.evaluate_many(solutions_to_problem)
+                incumbent = min(incumbent, objective_upper.min())
+                minima.extend(solutions_to_problem)
+
+        global_minimum = self._compute_global_minimum(f=f, minima=self._deduplicate(minima))
 
         return global_minimum
+
+    def minimise_anytime(
+        self,
+        f: PolynomialFunction,
+        D: Optional[FloatDPExactBox] = None,
+        budget: Optional[float] = None,
+        deadline: Optional[float] = None,
+        resume_from: Optional[MinimisationResult] = None
+    ) -> MinimisationResult:
+        """
+        Minimise f within a wall-clock limit and return the best verified minimum found so far. The limit is checked
+        between boxes, so the solves that are already running (one per worker) are allowed to finish.
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :param budget: number of seconds the search may take
+        :param deadline: time.monotonic() value at which the search stops; the earlier of budget and deadline applies
+        :param resume_from: result of an earlier non-exhaustive call with the same f and D to continue from; its
+            gradient system and the lazy stream of its unexplored boxes are reused, so it can be resumed once
+        :return: the minimum and minima found so far, whether every box was explored and the unexplored boxes
+        """
+        end_time = np.inf if deadline is None else deadline
+        if budget is not None:
+            end_time = min(end_time, monotonic() + budget)
+
+        n_variables = f.n_variables
+        domain = FloatDPExactBox([(-INF, INF) for _ in range(n_variables)]) if D is None else D
+
+        assert domain.dimension() == n_variables, "Boxes not specified for all variables"
+
+        self.statistics = OptimisationStatistics(hooks=self.hooks)
+        if resume_from is None:
+            with self.statistics.timing("create_subproblems"):
+                system, problems, n_problems = self._create_subproblems_lazily(f=f, D=domain)
+            minima = self._get_endpoints_if_minima(f_derivatives=system.gradient, D=domain) if D is not None else []
+        else:
+            system, problems, n_problems = resume_from.system, resume_from.unexplored, resume_from.n_unexplored
+            minima = list(resume_from.minima)
+        self.statistics.n_subproblems = n_problems
+
+        n_taken = 0
+        unexplored_in_chunk = None
+        with self._create_executor(system=system) as executor:
+            while unexplored_in_chunk is None:
+                with self.statistics.timing("create_subproblems"):
+                    chunk = list(islice(problems, CHUNK_SIZE))
+                if not chunk:
+                    break
+                n_taken += len(chunk)
+
+                remaining = chunk
+                if self.gradient_exclusion:
+                    with self.statistics.timing("exclusion"):
+                        remaining = self._exclude_boxes_without_critical_points(system=system, problems=chunk)
+
+                # One box per task, so that at most one box per worker is still running when the time is up
+                boxes = self._iter_minima_of_boxes(executor=executor, system=system, problems=remaining)
+                for i in range(len(remaining)):
+                    if monotonic() >= end_time:
+                        unexplored_in_chunk = remaining[i:]
+                        break
+                    minima.extend(next(boxes))
+
+            if unexplored_in_chunk and executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        is_exhaustive = not unexplored_in_chunk
+        minima = self._deduplicate(minima)
+        result = MinimisationResult(
+            minimum=self._compute_global_minimum(f=f, minima=minima),
+            minima=minima,
+            is_exhaustive=is_exhaustive,
+            unexplored=iter(()) if is_exhaustive else chain(unexplored_in_chunk, problems),
+            n_unexplored=0 if is_exhaustive else len(unexplored_in_chunk) + n_problems - n_taken,
+            system=system
+        )
+
+        return result
+
+    def minimise(
+        self,
+        f: PolynomialFunction,
+        D: Optional[FloatDPExactBox] = None,
+        branch_and_bound: bool = False,
+        return_statistics: bool = False
+    ) -> Union[FloatDPBoundsVector, Tuple[FloatDPBoundsVector, OptimisationStatistics]]:
+        """
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :param branch_and_bound: solve the boxes in order of a lower bound of f and skip the boxes whose lower bound
+            exceeds the best objective value found so far; the number of skipped boxes is in statistics. It does not
+            apply to univariate problems handled by exact_univariate
+        :param return_statistics: also return the statistics of the call
+        :return: the global minimum, or None if no minimum was found, and the statistics if return_statistics
+        """
+        if branch_and_bound and not (f.n_variables == 1 and self.exact_univariate):
+            global_minimum = self._minimise_with_branch_and_bound(f=f, D=D)
+        else:
+            all_minima = self._minimise_all(f=f, D=D)
+            global_minimum = self._compute_global_minimum(f=f, minima=all_minima)
+
+        return (global_minimum, self.statistics) if return_statistics else global_minimum
+
+    def find_global_minima(
+        self, f: PolynomialFunction, D: Optional[FloatDPExactBox] = None
+    ) -> List[FloatDPBoundsVector]:
+        """
+        All global minima of f, for objectives with several minima of the same value (e.g. Levy No. 1)
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :return: the deduplicated minima whose objective value ties with the global minimum
+        """
+        all_minima = self._minimise_all(f=f, D=D)
+
+        return self._compute_global_minima(f=f, minima=all_minima)
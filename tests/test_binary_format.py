@@ -0,0 +1,176 @@
+import pickle
+import struct
+
+from math import inf
+from math import nextafter
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._binary_format import decode_array
+from utils._binary_format import decode_problem
+from utils._binary_format import encode_array
+from utils._binary_format import encode_problem
+from utils._binary_format import VERSION
+from utils._float_conversion import box_to_floats
+from utils._float_conversion import floats_to_box
+from utils.polynomial_array import PolynomialArray
+from utils.polynomial_function import PolynomialFunction
+from utils.serialization import load_array
+from utils.serialization import load_problem
+from utils.serialization import save_polynomial
+from utils.serialization import save_problem
+
+# Offset of the version in a record header: 6 bytes of magic
+_VERSION_OFFSET = 6
+
+
+def _array(exponents, lower, upper) -> PolynomialArray:
+    exponents = np.array(exponents, dtype=np.int64).reshape(len(lower), -1)
+    return PolynomialArray(exponents.shape[1], exponents, np.array(lower, dtype=float), np.array(upper, dtype=float))
+
+
+def _polynomial() -> PolynomialArray:
+    # Inexact bounds, a negative exponent from the reciprocal coordinates and an odd number of exponents to pad
+    return _array(
+        [[3, 0, 1], [0, -2, 0], [0, 0, 0]],
+        [nextafter(0.1, -inf), -2.0, 5e-324],
+        [0.1, -2.0, nextafter(5e-324, inf)]
+    )
+
+
+def _assert_same(f: PolynomialArray, g: PolynomialArray) -> None:
+    assert f.n_variables == g.n_variables
+    assert np.array_equal(f.exponents, g.exponents)
+    # Bit for bit, not just equal as numbers
+    assert f.lower.tobytes() == g.lower.tobytes() and f.upper.tobytes() == g.upper.tobytes()
+
+
+def test_polynomial_round_trip_keeps_the_exact_bounds():
+    f = _polynomial()
+    data = encode_array(f)
+
+    g, offset = decode_array(data)
+
+    _assert_same(f, g)
+    assert offset == len(data) and len(data) % 8 == 0
+
+
+def test_zero_polynomial_round_trip():
+    f = PolynomialArray(2, np.zeros((0, 2), dtype=np.int64), np.zeros(0), np.zeros(0))
+
+    g, offset = decode_array(encode_array(f))
+
+    _assert_same(f, g)
+    assert g.n_terms == 0
+
+
+def test_records_are_read_at_an_offset():
+    f = _polynomial()
+    g = _array([[1]], [1.0], [1.0])
+    data = encode_array(f) + encode_array(g)
+
+    first, offset = decode_array(data)
+    second, end = decode_array(data, offset)
+
+    _assert_same(f, first)
+    _assert_same(g, second)
+    assert end == len(data)
+
+
+def test_problem_round_trip():
+    components = [_polynomial(), _array([[0, 1, 0]], [-1.0], [1.0])]
+    domain_bounds = [(-inf, -1.0), (nextafter(1.0, inf), 1e300), (0.0, 0.0)]
+    flags = [True, False, True]
+    data = encode_problem(components, domain_bounds, flags)
+
+    decoded_components, decoded_bounds, decoded_flags, offset = decode_problem(data)
+
+    for f, g in zip(components, decoded_components):
+        _assert_same(f, g)
+    assert len(decoded_components) == 2
+    assert decoded_bounds == domain_bounds
+    assert decoded_flags == flags
+    assert offset == len(data)
+
+
+def test_function_survives_pickling():
+    f = PolynomialFunction.from_array(_polynomial())
+    _assert_same(pickle.loads(pickle.dumps(f)).array, f.array)
+    _assert_same(PolynomialFunction.from_bytes(f.to_bytes()).array, f.array)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_files_round_trip(tmp_path, mmap):
+    f = PolynomialFunction.from_array(_polynomial())
+    for name in ("f.bin", "f.npz"):
+        save_polynomial(f, tmp_path / name)
+        _assert_same(load_array(tmp_path / name, mmap=mmap), f.array)
+
+
+def test_problem_files_round_trip(tmp_path):
+    f = PolynomialFunction.from_array(_array([[4, 0], [0, 2], [1, 1]], [1.0, 1.0, -1.0], [1.0, 1.0, -1.0]))
+    _, problems = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)._create_subproblems(
+        f=f, D=floats_to_box([(-1.0, 2.0), (-3.0, 0.5)])
+    )
+    p = problems[0]
+    save_problem(p, tmp_path / "p.bin")
+
+    q = load_problem(tmp_path / "p.bin")
+
+    assert box_to_floats(q.D) == box_to_floats(p.D)
+    assert q.is_conversion_needed_per_dimension == p.is_conversion_needed_per_dimension
+    for x, y in zip(p.components, q.components):
+        _assert_same(x.array, y.array)
+
+
+def _with_version(data: bytes, version: int) -> bytes:
+    data = bytearray(data)
+    struct.pack_into("<H", data, _VERSION_OFFSET, version)
+    return bytes(data)
+
+
+def test_newer_versions_are_rejected():
+    polynomial = encode_array(_polynomial())
+    problem = encode_problem([_polynomial()], [(0.0, 1.0)] * 3, [False] * 3)
+
+    with pytest.raises(ValueError, match="version"):
+        decode_array(_with_version(polynomial, VERSION + 1))
+    with pytest.raises(ValueError, match="version"):
+        decode_problem(_with_version(problem, VERSION + 1))
+
+    f, _ = decode_array(_with_version(polynomial, VERSION))
+    _assert_same(f, _polynomial())
+
+
+def test_newer_npz_versions_are_rejected(tmp_path):
+    f = _polynomial()
+    np.savez(
+        tmp_path / "f.npz",
+        version=VERSION + 1,
+        n_variables=f.n_variables,
+        exponents=f.exponents,
+        lower=f.lower,
+        upper=f.upper
+    )
+
+    with pytest.raises(ValueError, match="version"):
+        load_array(tmp_path / "f.npz")
+
+
+def test_records_of_the_wrong_kind_are_rejected():
+    polynomial = encode_array(_polynomial())
+
+    with pytest.raises(ValueError, match="ARPROB"):
+        decode_problem(polynomial)
+    with pytest.raises(ValueError, match="ARPOLY"):
+        decode_array(b"X" * len(polynomial))
+
+
+def test_exponents_beyond_the_format_are_rejected():
+    with pytest.raises(ValueError):
+        encode_array(_array([[2 ** 31]], [1.0], [1.0]))
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from solvers.krawczyk_solver import KrawczykSolver
+from utils._deduplicate_minima import cluster_overlapping_boxes
+from utils._deduplicate_minima import deduplicate_minima
+from utils._deduplicate_minima import merge_overlapping_boxes
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import floats_to_bounds_vector
+from utils.polynomial_array import PolynomialArray
+
+
+def test_overlapping_boxes_with_distinct_roots_merge_to_their_hull():
+    # [0, 2] holds a root at 0.5 and [1, 3] one at 2.5, their intersection [1, 2] holds neither
+    minima = [floats_to_bounds_vector([(0.0, 2.0)]), floats_to_bounds_vector([(1.0, 3.0)])]
+
+    merged = [bounds_vector_to_floats(x) for x in deduplicate_minima(minima)]
+
+    assert merged == [[(0.0, 3.0)]]
+
+
+def test_a_chain_of_overlaps_does_not_join_disjoint_boxes():
+    lower = np.array([[0.0, 0.0], [0.9, 0.0], [1.9, 0.0]])
+    upper = np.array([[1.0, 1.0], [2.0, 1.0], [3.0, 1.0]])
+
+    labels = cluster_overlapping_boxes(lower, upper)
+    merged_lower, merged_upper = merge_overlapping_boxes(lower, upper)
+
+    assert labels[0] != labels[2]
+    assert len(merged_lower) == 2
+    for box_lower, box_upper in zip(lower, upper):
+        assert any(np.all(x <= box_lower) and np.all(box_upper <= y) for x, y in zip(merged_lower, merged_upper))
+
+
+def test_disjoint_boxes_are_kept():
+    lower = np.array([[0.0], [2.0], [-3.0]])
+    upper = np.array([[1.0], [2.5], [-2.0]])
+
+    merged_lower, merged_upper = merge_overlapping_boxes(lower, upper)
+
+    assert np.array_equal(merged_lower, lower) and np.array_equal(merged_upper, upper)
+
+
+def _krawczyk_merge(lower, upper):
+    # x^2 - 1 has the roots -1 and 1
+    f = PolynomialArray(1, np.array([[2], [0]]), np.array([1.0, -1.0]), np.array([1.0, -1.0]))
+    merged_lower, merged_upper = KrawczykSolver()._merge_verified_boxes(
+        [f], [[f.derivative(0)]], np.array(lower), np.array(upper)
+    )
+    return merged_lower.ravel().tolist(), merged_upper.ravel().tolist()
+
+
+def test_verified_boxes_of_distinct_roots_are_kept_apart():
+    assert _krawczyk_merge([[-1.5], [-0.2]], [[0.2], [1.5]]) == ([-1.5, -0.2], [0.2, 1.5])
+
+
+def test_verified_boxes_of_the_same_root_are_intersected():
+    assert _krawczyk_merge([[0.9], [1.0]], [[1.05], [1.1]]) == ([1.0], [1.05])
+
+
+def test_verified_boxes_at_the_tolerance_of_the_same_root_are_intersected():
+    # Both halves of the bisection at 1 verify the root 1 + 1e-12 of x^2 - (1 + 1e-12)^2 on an inflated box
+    root = 1 + 1e-12
+    f = PolynomialArray(1, np.array([[2], [0]]), np.array([1.0, -root * root]), np.array([1.0, -root * root]))
+
+    boxes, unresolved = KrawczykSolver().solve_all(system=[f], lower=np.array([0.0]), upper=np.array([2.0]))
+
+    assert len(boxes) == 1 and unresolved == []
+    assert boxes[0][0][0] <= root <= boxes[0][1][0]
@@ -0,0 +1,78 @@
+import random
+
+from fractions import Fraction
+
+import numpy as np
+
+from utils._interval_array import add_down
+from utils._interval_array import add_up
+from utils._interval_array import interval_mul
+from utils._interval_array import interval_power
+from utils._interval_array import interval_sum_rows
+from utils._interval_array import mul_down
+from utils._interval_array import mul_up
+
+
+def _random_doubles(rng: random.Random, n: int) -> np.ndarray:
+    # Mantissas with many bits and a wide range of exponents, including products that underflow
+    return np.array([rng.uniform(-1, 1) * 2.0 ** rng.randint(-540, 60) for _ in range(n)])
+
+
+def test_add_rounds_outwards_and_is_exact_when_possible():
+    rng = random.Random(0)
+    a, b = _random_doubles(rng, 2000), _random_doubles(rng, 2000)
+    lower, upper = add_down(a, b), add_up(a, b)
+    for x, y, s_lower, s_upper in zip(a, b, lower, upper):
+        exact = Fraction(x) + Fraction(y)
+        assert Fraction(s_lower) <= exact <= Fraction(s_upper)
+        if Fraction(float(x + y)) == exact:
+            assert s_lower == s_upper == x + y
+        else:
+            assert s_lower == np.nextafter(s_upper, -np.inf)
+
+
+def test_mul_rounds_outwards_and_is_exact_when_possible():
+    rng = random.Random(1)
+    a, b = _random_doubles(rng, 2000), _random_doubles(rng, 2000)
+    lower, upper = mul_down(a, b), mul_up(a, b)
+    for x, y, p_lower, p_upper in zip(a, b, lower, upper):
+        exact = Fraction(x) * Fraction(y)
+        assert Fraction(p_lower) <= exact <= Fraction(p_upper)
+
+    small_integers = np.arange(-20.0, 20.0)
+    assert np.array_equal(mul_down(small_integers, small_integers), small_integers * small_integers)
+    assert np.array_equal(mul_up(small_integers, small_integers), small_integers * small_integers)
+
+
+def test_interval_mul_encloses_every_product():
+    rng = random.Random(2)
+    bounds = np.sort(np.array([[rng.uniform(-3, 3) for _ in range(2)] for _ in range(4000)]), axis=1)
+    a_lower, a_upper, b_lower, b_upper = bounds[:2000, 0], bounds[:2000, 1], bounds[2000:, 0], bounds[2000:, 1]
+    lower, upper = interval_mul(a_lower, a_upper, b_lower, b_upper)
+    for i in range(2000):
+        corners = [Fraction(x) * Fraction(y) for x in (a_lower[i], a_upper[i]) for y in (b_lower[i], b_upper[i])]
+        assert Fraction(lower[i]) <= min(corners)
+        assert max(corners) <= Fraction(upper[i])
+
+
+def test_interval_power_encloses_powers():
+    rng = random.Random(3)
+    bounds = np.sort(np.array([[rng.uniform(-2, 2) for _ in range(2)] for _ in range(500)]), axis=1)
+    for k in range(7):
+        lower, upper = interval_power(bounds[:, 0], bounds[:, 1], k)
+        for (x_lower, x_upper), p_lower, p_upper in zip(bounds, lower, upper):
+            samples = [Fraction(x_lower), Fraction(x_upper)] + ([Fraction(0)] if x_lower <= 0 <= x_upper else [])
+            values = [x ** k for x in samples]
+            assert Fraction(p_lower) <= min(values)
+            assert max(values) <= Fraction(p_upper)
+            if k > 0 and k % 2 == 0 and x_lower <= 0 <= x_upper:
+                assert p_lower == 0
+
+
+def test_interval_sum_rows_encloses_the_exact_sum():
+    rng = random.Random(4)
+    values = np.array([_random_doubles(rng, 50) for _ in range(37)])
+    lower, upper = interval_sum_rows(values, values)
+    for column in range(values.shape[1]):
+        exact = sum(Fraction(x) for x in values[:, column])
+        assert Fraction(lower[column]) <= exact <= Fraction(upper[column])
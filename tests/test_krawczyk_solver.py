@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from solvers.krawczyk_solver import KrawczykSolver
+from solvers.polynomial_optimiser import ARIADNE_ENGINE
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._float_conversion import bounds_vector_to_floats
+from utils.polynomial_array import PolynomialArray
+from utils.polynomial_function import PolynomialFunction
+
+
+def _array(exponents, coefficients) -> PolynomialArray:
+    exponents = np.array(exponents, dtype=np.int64).reshape(len(coefficients), -1)
+    coefficients = np.array(coefficients, dtype=float)
+    return PolynomialArray(exponents.shape[1], exponents, coefficients, coefficients.copy())
+
+
+def _contains(box, root) -> bool:
+    lower, upper = box
+    return bool(np.all(lower <= root) and np.all(root <= upper))
+
+
+def test_encloses_every_root_once():
+    # x0^2 + x1^2 - 5 = 0, x0 x1 - 2 = 0: the roots are (1, 2), (2, 1), (-1, -2) and (-2, -1)
+    system = [_array([[2, 0], [0, 2], [0, 0]], [1.0, 1.0, -5.0]), _array([[1, 1], [0, 0]], [1.0, -2.0])]
+    roots = [(1.0, 2.0), (2.0, 1.0), (-1.0, -2.0), (-2.0, -1.0)]
+
+    boxes, unresolved = KrawczykSolver(tolerance=1e-10).solve_all(
+        system=system, lower=np.array([-3.0, -3.0]), upper=np.array([3.0, 3.0])
+    )
+
+    assert unresolved == []
+    assert len(boxes) == len(roots)
+    for root in roots:
+        assert sum(_contains(box, np.array(root)) for box in boxes) == 1
+    for lower, upper in boxes:
+        assert np.all(upper - lower <= 1e-8)
+
+
+def test_excludes_a_box_without_roots():
+    system = [_array([[2, 0], [0, 0]], [1.0, 1.0]), _array([[0, 1]], [1.0])]
+
+    boxes, unresolved = KrawczykSolver().solve_all(
+        system=system, lower=np.array([-3.0, -3.0]), upper=np.array([3.0, 3.0])
+    )
+
+    assert boxes == [] and unresolved == []
+
+
+def test_returns_the_boxes_around_a_singular_root_as_unresolved():
+    # x0^3 = 0, x1 = 0 has a triple root at the origin that no Krawczyk step can verify
+    system = [_array([[3, 0]], [1.0]), _array([[0, 1]], [1.0])]
+
+    boxes, unresolved = KrawczykSolver().solve_all(
+        system=system, lower=np.array([-1.0, -1.0]), upper=np.array([0.75, 1.0])
+    )
+
+    assert boxes == []
+    assert unresolved and any(_contains(box, np.zeros(2)) for box in unresolved)
+
+
+def test_never_returns_a_root_just_outside_the_box():
+    # The root 1 + 1e-12 of x^2 - (1 + 1e-12)^2 is verified on the inflated box around the corner 1
+    root = 1 + 1e-12
+    system = [_array([[2], [0]], [1.0, -root * root])]
+
+    boxes, unresolved = KrawczykSolver().solve_all(system=system, lower=np.array([0.0]), upper=np.array([1.0]))
+    assert boxes == []
+    for lower, upper in unresolved:
+        assert 0.0 <= lower[0] <= upper[0] <= 1.0
+
+    boxes, unresolved = KrawczykSolver().solve_all(system=system, lower=np.array([0.0]), upper=np.array([3.0]))
+    assert len(boxes) == 1 and _contains(boxes[0], np.array([root])) and unresolved == []
+
+
+def test_returns_the_queue_as_unresolved_after_the_last_iteration():
+    system = [_array([[2, 0], [0, 0]], [1.0, -2.0]), _array([[0, 1]], [1.0])]
+
+    boxes, unresolved = KrawczykSolver(max_iterations=1).solve_all(
+        system=system, lower=np.array([-3.0, -3.0]), upper=np.array([3.0, 3.0])
+    )
+
+    root = np.array([np.sqrt(2.0), 0.0])
+    assert any(_contains(box, root) for box in boxes + unresolved)
+    assert any(_contains(box, -root) for box in boxes + unresolved)
+
+
+def _objective() -> PolynomialFunction:
+    # (x0^2 - 1)^2 + (x1 - 1/2)^2 has minima at (-1, 1/2) and (1, 1/2)
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return PolynomialFunction(n_variables=2, f=(x[0] ** 2 - 1) ** 2 + (x[1] - FloatDPBounds(0.5)) ** 2)
+
+
+def test_agrees_with_the_interval_newton_engine():
+    minima = {}
+    for engine in (ARIADNE_ENGINE, KRAWCZYK_ENGINE):
+        optimiser = PolynomialOptimiser(engine=engine, tolerance=1e-8)
+        minima[engine] = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=_objective())]
+        assert optimiser.statistics.n_solver_failures == 0
+
+    assert len(minima[KRAWCZYK_ENGINE]) == len(minima[ARIADNE_ENGINE]) == 2
+    for root in ((-1.0, 0.5), (1.0, 0.5)):
+        for engine in (ARIADNE_ENGINE, KRAWCZYK_ENGINE):
+            assert sum(all(lower <= r <= upper for (lower, upper), r in zip(x, root)) for x in minima[engine]) == 1
+
+
+def test_falls_back_to_interval_newton_on_unresolved_boxes():
+    # The minimum of x0^4 + x1^2 is a singular root of the gradient
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=x[0] ** 4 + x[1] ** 2)
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE, tolerance=1e-6)
+
+    minima = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=f)]
+
+    assert any(all(lower <= 0.0 <= upper for lower, upper in x) for x in minima)
+    assert any("unresolved" in message for message in optimiser.statistics.solver_failures)
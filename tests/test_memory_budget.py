@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from solvers.polynomial_optimiser import ARIADNE_ENGINE
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import MAX_SUBDIVISION_DEPTH
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from solvers.polynomial_optimiser import SOLVE_MEMORY_OVERHEAD
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import box_to_floats
+from utils.polynomial_function import PolynomialFunction
+
+ROOTS = [(-1.0, 0.5), (1.0, 0.5)]
+
+
+def _objective() -> PolynomialFunction:
+    # Minima at (-1, 1/2) and (1, 1/2)
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return PolynomialFunction(n_variables=2, f=(x[0] ** 2 - 1) ** 2 + (x[1] - FloatDPBounds(0.5)) ** 2)
+
+
+def _assert_encloses_the_roots(minima) -> None:
+    minima = [bounds_vector_to_floats(x) for x in minima]
+    assert len(minima) == len(ROOTS)
+    for root in ROOTS:
+        assert sum(all(lower <= r <= upper for (lower, upper), r in zip(x, root)) for x in minima) == 1
+
+
+def test_every_box_solved_by_the_krawczyk_engine_fits_the_budget(monkeypatch):
+    budget = SOLVE_MEMORY_OVERHEAD + 2 ** 10
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE, memory_budget=budget)
+    solve = optimiser._solve_within_box
+    estimates = []
+
+    def solve_and_record(p):
+        estimates.append(optimiser._estimate_solve_memory(p=p))
+        return solve(p=p)
+
+    monkeypatch.setattr(optimiser, "_solve_within_box", solve_and_record)
+
+    _assert_encloses_the_roots(optimiser.minimise_all(f=_objective()))
+    assert estimates and all(x <= budget for x in estimates)
+
+
+def test_the_budget_does_not_apply_to_the_interval_newton_engine():
+    optimiser = PolynomialOptimiser(engine=ARIADNE_ENGINE, memory_budget=SOLVE_MEMORY_OVERHEAD + 2 ** 10)
+
+    _assert_encloses_the_roots(optimiser.minimise_all(f=_objective()))
+    assert optimiser.statistics.n_subdivided_boxes == 0
+
+
+def test_boxes_over_the_budget_are_bisected_before_solving():
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE, memory_budget=SOLVE_MEMORY_OVERHEAD + 2 ** 10)
+
+    _assert_encloses_the_roots(optimiser.minimise_all(f=_objective()))
+    assert "estimate" in optimiser.statistics.subdivision_reasons
+    assert optimiser.statistics.n_solver_failures == 0
+
+
+def test_a_budget_below_the_overhead_does_not_bisect():
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE, memory_budget=SOLVE_MEMORY_OVERHEAD)
+
+    _assert_encloses_the_roots(optimiser.minimise_all(f=_objective()))
+    assert optimiser.statistics.n_subdivided_boxes == 0
+
+
+def test_boxes_are_bisected_and_solved_again_after_a_memory_error(monkeypatch):
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+    solve = optimiser._solve_within_box
+
+    def solve_small_boxes(p):
+        if any(upper - lower > 0.5 for lower, upper in box_to_floats(p.D)):
+            raise MemoryError("std::bad_alloc")
+        return solve(p=p)
+
+    monkeypatch.setattr(optimiser, "_solve_within_box", solve_small_boxes)
+
+    _assert_encloses_the_roots(optimiser.minimise_all(f=_objective()))
+    statistics = optimiser.statistics
+    assert "memory_error" in statistics.subdivision_reasons
+    assert statistics.n_solver_failures == statistics.subdivision_reasons.count("memory_error")
+
+
+def test_a_memory_error_at_the_depth_limit_is_raised(monkeypatch):
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+
+    def out_of_memory(p):
+        raise MemoryError("std::bad_alloc")
+
+    monkeypatch.setattr(optimiser, "_solve_within_box", out_of_memory)
+
+    with pytest.raises(MemoryError):
+        optimiser.minimise_all(f=_objective())
+    assert optimiser.statistics.subdivision_reasons == ["memory_error"] * MAX_SUBDIVISION_DEPTH
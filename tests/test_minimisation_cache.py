@@ -0,0 +1,91 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._coordinate import Coordinate
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import floats_to_bounds_vector
+from utils._float_conversion import floats_to_box
+from utils.minimisation_cache import MinimisationCache
+from utils.polynomial_function import PolynomialFunction
+
+MINIMA = [[(0.1, 0.30000000000000004), (-1.0, -0.9999999999999999)], [(2.0, 2.0), (3.5, 3.5000000000000004)]]
+
+
+def _coordinates(coefficients):
+    return [Coordinate(FloatDPBounds(c), powers) for powers, c in coefficients]
+
+
+def test_key_ignores_zero_terms_and_term_order():
+    f = PolynomialFunction(n_variables=2, coordinates=_coordinates([((2, 0), 1.0), ((0, 1), -3.0)]))
+    g = PolynomialFunction(
+        n_variables=2, coordinates=_coordinates([((0, 1), -3.0), ((1, 1), 0.0), ((2, 0), 1.0)])
+    )
+    h = PolynomialFunction(n_variables=2, coordinates=_coordinates([((2, 0), 1.0), ((0, 1), -2.0)]))
+
+    assert MinimisationCache.key(f=f, D=None, configuration=[]) == MinimisationCache.key(f=g, D=None, configuration=[])
+    assert MinimisationCache.key(f=f, D=None, configuration=[]) != MinimisationCache.key(f=h, D=None, configuration=[])
+    D = floats_to_box([(-1.0, 1.0), (0.0, 2.0)])
+    assert MinimisationCache.key(f=f, D=D, configuration=[]) != MinimisationCache.key(f=f, D=None, configuration=[])
+    assert MinimisationCache.key(f=f, D=None, configuration=[1]) != MinimisationCache.key(f=f, D=None, configuration=[])
+
+
+def test_memory_tier_hits_and_evicts_the_least_recently_used():
+    cache = MinimisationCache(max_entries=2)
+    assert cache.get("a") is None
+
+    cache.put("a", [floats_to_bounds_vector(x) for x in MINIMA])
+    cache.put("b", [])
+    assert [bounds_vector_to_floats(x) for x in cache.get("a")] == MINIMA
+    cache.put("c", [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") == []
+    assert len(cache) == 2
+
+
+def test_disk_tier_is_shared_and_closes_its_connections(tmp_path, monkeypatch):
+    connections = []
+    connect = sqlite3.connect
+
+    class Connection(sqlite3.Connection):
+        is_closed = False
+
+        def close(self):
+            self.is_closed = True
+            super().close()
+
+    def tracked_connect(path):
+        connections.append(connect(path, factory=Connection))
+        return connections[-1]
+
+    monkeypatch.setattr(sqlite3, "connect", tracked_connect)
+    path = str(tmp_path / "minima.sqlite")
+    MinimisationCache(path=path).put("a", [floats_to_bounds_vector(x) for x in MINIMA])
+
+    cache = MinimisationCache(path=path)
+    assert [bounds_vector_to_floats(x) for x in cache.get("a")] == MINIMA
+    assert cache.get("b") is None
+
+    cache.clear()
+    assert MinimisationCache(path=path).get("a") is None
+    assert connections and all(x.is_closed for x in connections)
+
+
+def test_optimiser_reuses_cached_minima():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(1, dp)[0]
+    f = PolynomialFunction(n_variables=1, f=x ** 4 - 8 * x ** 2)
+    optimiser = PolynomialOptimiser(cache=MinimisationCache())
+
+    minima = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=f)]
+    assert optimiser.statistics.n_cache_hits == 0
+
+    assert [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=f)] == minima
+    assert optimiser.statistics.n_cache_hits == 1
@@ -0,0 +1,80 @@
+import random
+
+from typing import Dict
+from typing import Tuple
+
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+
+import utils._multiplication
+
+from utils._float_conversion import bounds_to_floats
+from utils._multiplication import multiply_terms
+from utils._multiplication import power_terms
+from utils._term_store import Terms
+
+Reference = Dict[Tuple[int, ...], int]
+
+
+def _random_terms(rng: random.Random, n_variables: int, n_terms: int, min_power: int = 0) -> Tuple[Terms, Reference]:
+    reference = {}
+    for _ in range(n_terms):
+        powers = tuple(rng.randint(min_power, 4) for _ in range(n_variables))
+        reference[powers] = rng.randint(-4, 4) or 1
+    terms = {powers: FloatDPBounds(str(c), dp) for powers, c in reference.items()}
+
+    return terms, reference
+
+
+def _naive_product(a: Reference, b: Reference) -> Reference:
+    result = {}
+    for powers_a, c_a in a.items():
+        for powers_b, c_b in b.items():
+            powers = tuple(x + y for x, y in zip(powers_a, powers_b))
+            result[powers] = result.get(powers, 0) + c_a * c_b
+
+    return {powers: c for powers, c in result.items() if c != 0}
+
+
+def _to_reference(terms: Terms) -> Reference:
+    result = {}
+    for powers, c in terms.items():
+        lower, upper = bounds_to_floats(c)
+        assert lower == upper, "Exact integer arithmetic must give exact coefficients"
+        result[powers] = int(lower)
+
+    return result
+
+
+@pytest.mark.parametrize("density_threshold", [0, 4, 10 ** 9])
+def test_multiply_terms_matches_naive_product(monkeypatch, density_threshold):
+    # 0 forces the sparse heap merge and a huge threshold the dense array
+    monkeypatch.setattr(utils._multiplication, "DENSITY_THRESHOLD", density_threshold)
+    rng = random.Random(density_threshold)
+    for n_variables in (1, 2, 3):
+        for _ in range(20):
+            terms, reference = _random_terms(rng, n_variables, n_terms=rng.randint(1, 12), min_power=-2)
+            other, other_reference = _random_terms(rng, n_variables, n_terms=rng.randint(1, 12), min_power=-2)
+
+            product = multiply_terms(terms, other, n_variables)
+            assert _to_reference(product) == _naive_product(reference, other_reference)
+
+
+def test_multiply_terms_pads_the_factor_with_fewer_variables():
+    terms = {(1,): FloatDPBounds("2", dp)}
+    other = {(0, 1): FloatDPBounds("3", dp), (2, 0): FloatDPBounds("1", dp)}
+
+    assert _to_reference(multiply_terms(terms, other, n_variables=2)) == {(1, 1): 6, (3, 0): 2}
+
+
+def test_power_terms_matches_repeated_multiplication():
+    rng = random.Random(7)
+    terms, reference = _random_terms(rng, n_variables=2, n_terms=4)
+    expected = reference
+    for k in range(1, 6):
+        assert _to_reference(power_terms(terms, k, n_variables=2)) == expected
+        expected = _naive_product(expected, reference)
@@ -0,0 +1,78 @@
+from time import sleep
+
+import pytest
+
+from utils.optimisation_statistics import OptimisationStatistics
+
+
+def test_nested_timings_are_not_counted_twice():
+    events = []
+    statistics = OptimisationStatistics(hooks=[lambda event, data: events.append((event, data["name"]))])
+
+    with statistics.timing("create_subproblems"):
+        with statistics.timing("conversion"):
+            sleep(0.05)
+        with statistics.timing("conversion"):
+            sleep(0.05)
+
+    assert statistics.seconds["conversion"] >= 0.1
+    assert statistics.seconds["create_subproblems"] < 0.05
+    assert events == [("timing", "conversion"), ("timing", "conversion"), ("timing", "create_subproblems")]
+
+
+def test_function_and_array_builds_are_timed_as_conversion(monkeypatch):
+    pytest.importorskip("pyariadne")
+    from pyariadne import dp
+    from pyariadne import FloatDPBounds
+    from pyariadne import MultivariatePolynomial
+
+    import utils.polynomial_function
+    from solvers.polynomial_optimiser import PolynomialOptimiser
+    from utils.polynomial_function import PolynomialFunction
+
+    build = utils.polynomial_function.convert_terms_to_factored_function
+    n_builds = []
+
+    def slow_build(*args, **kwargs):
+        n_builds.append(1)
+        sleep(0.02)
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(utils.polynomial_function, "convert_terms_to_factored_function", slow_build)
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=(x[0] - 1) ** 2 + x[1] ** 4)
+    optimiser = PolynomialOptimiser()
+
+    optimiser.minimise_all(f=f)
+
+    assert n_builds
+    assert optimiser.statistics.seconds["conversion"] >= 0.02 * len(n_builds)
+    assert optimiser.statistics.seconds["create_subproblems"] < 0.02 * len(n_builds)
+
+
+@pytest.mark.parametrize("method", ["iter_minima", "minimise_anytime", "minimise_all"])
+def test_gradient_system_is_timed_as_subproblem_creation(monkeypatch, method):
+    pytest.importorskip("pyariadne")
+    from pyariadne import dp
+    from pyariadne import FloatDPBounds
+    from pyariadne import MultivariatePolynomial
+
+    from solvers.polynomial_optimiser import PolynomialOptimiser
+    from utils.polynomial_function import PolynomialFunction
+
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=(x[0] - 1) ** 2 + x[1] ** 4)
+    optimiser = PolynomialOptimiser()
+    create = optimiser._create_gradient_system
+
+    def slow_create(*args, **kwargs):
+        sleep(0.05)
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(optimiser, "_create_gradient_system", slow_create)
+
+    result = getattr(optimiser, method)(f=f)
+    if method == "iter_minima":
+        list(result)
+
+    assert optimiser.statistics.seconds["create_subproblems"] >= 0.05
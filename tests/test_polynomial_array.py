@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from utils.polynomial_array import PolynomialArray
+
+
+def _array(exponents, coefficients) -> PolynomialArray:
+    exponents = np.array(exponents, dtype=np.int64).reshape(len(coefficients), -1)
+    coefficients = np.array(coefficients, dtype=float)
+    return PolynomialArray(exponents.shape[1], exponents, coefficients, coefficients.copy())
+
+
+def test_evaluate_many_encloses_the_values():
+    # 3 x0^2 x1 - 2 x1^3 + 1/2
+    f = _array([[2, 1], [0, 3], [0, 0]], [3.0, -2.0, 0.5])
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-2, 2, size=(100, 2))
+    lower, upper = f.evaluate_many(lower=points, upper=points)
+    expected = 3 * points[:, 0] ** 2 * points[:, 1] - 2 * points[:, 1] ** 3 + 0.5
+
+    assert np.all(lower <= upper)
+    assert np.allclose(lower, expected) and np.allclose(upper, expected)
+
+
+def test_evaluate_many_of_the_zero_polynomial():
+    lower = np.array([[1.0, -1.0], [2.0, 3.0]])
+    upper = np.array([[1.5, 0.0], [2.0, 4.0]])
+    zero = PolynomialArray(2, np.zeros((0, 2), dtype=np.int64), np.zeros(0), np.zeros(0))
+    # The derivative of x0 with respect to x1, e.g. an entry of the Jacobian of a separable system
+    derivative = _array([[1, 0]], [1.0]).derivative(1)
+
+    for f in (zero, derivative):
+        value_lower, value_upper = f.evaluate_many(lower=lower, upper=upper)
+        assert np.array_equal(value_lower, [0.0, 0.0]) and np.array_equal(value_upper, [0.0, 0.0])
@@ -0,0 +1,167 @@
+from fractions import Fraction
+
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import FloatDPBoundsVector
+from pyariadne import MultivariatePolynomial
+
+from utils._coordinate import Coordinate
+from utils._float_conversion import bounds_to_floats
+from utils._horner import HornerScheme
+from utils.polynomial_function import PolynomialFunction
+
+
+def _objective() -> PolynomialFunction:
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return PolynomialFunction(n_variables=2, f=x[0] ** 3 * x[1] - 2 * x[1] ** 2 + x[0])
+
+
+def test_gradient_keeps_derivatives_computed_earlier():
+    f = _objective()
+    derivative = f.derivative(0)
+    second_derivative = derivative.derivative(1)
+
+    gradient = f.gradient()
+    assert gradient[0] is derivative
+    assert gradient[0].derivative(1) is second_derivative
+    assert f.derivative(1) is gradient[1]
+    assert f.gradient()[1] is gradient[1]
+
+
+def test_hessian_keeps_second_derivatives_computed_earlier():
+    f = _objective()
+    mixed = f.second_derivative(0, 1)
+
+    hessian = f.hessian()
+    assert hessian[0][1] is mixed
+    assert hessian[1][0] is mixed
+    assert f.second_derivative(1, 1) is hessian[1][1]
+    for i in range(2):
+        for j in range(2):
+            assert hessian[i][j].array.exponents.tolist() == f.derivative(i).derivative(j).array.exponents.tolist()
+
+
+def test_factored_function_matches_the_flat_function():
+    f = _objective()
+    for point in ([0.5, -1.5], [2.0, 3.0], [-1.25, 0.0]):
+        x = [FloatDPBounds(value) for value in point]
+        flat = f.function(x)
+        factored = f.factored_function(x)
+        assert float(factored.lower().raw()) <= float(flat.upper().raw())
+        assert float(flat.lower().raw()) <= float(factored.upper().raw())
+
+
+# x0^2 and x1^3 occur under several nodes of the Horner scheme, with gaps between the degrees of every variable
+SHARED_POWERS = {
+    (4, 1, 0): -1, (2, 3, 0): 2, (2, 0, 1): 3, (2, 0, 0): -4, (0, 3, 2): 1, (0, 3, 0): 5, (0, 0, 1): -5, (0, 0, 0): 2
+}
+POINTS = ([0.5, -1.5, 2.0], [2.0, 3.0, -0.25], [-1.25, 0.0, 1.0], [0.0, 0.0, 0.0])
+
+
+def _shared_powers_function() -> PolynomialFunction:
+    coordinates = [Coordinate(FloatDPBounds(c), powers) for powers, c in SHARED_POWERS.items()]
+    return PolynomialFunction(n_variables=3, coordinates=coordinates)
+
+
+def _flat_value(point) -> float:
+    # The points are dyadic, so that every term and sum is exact in double precision
+    value = sum(c * Fraction(point[0]) ** p0 * Fraction(point[1]) ** p1 * Fraction(point[2]) ** p2
+                for (p0, p1, p2), c in SHARED_POWERS.items())
+    return float(value)
+
+
+def test_horner_scheme_matches_the_flat_evaluation():
+    f = _shared_powers_function()
+    horner = HornerScheme(n_variables=3, terms=f._terms)
+    for point in POINTS:
+        x = [FloatDPBounds(value) for value in point]
+        expected = _flat_value(point)
+
+        assert bounds_to_floats(horner(x)) == (expected, expected)
+        assert bounds_to_floats(f.function(x)) == (expected, expected)
+        assert horner(point) == expected
+
+
+def test_call_matches_the_flat_evaluation():
+    f = _shared_powers_function()
+    for point in POINTS:
+        x = FloatDPBoundsVector([FloatDPBounds(value) for value in point], dp)
+        expected = _flat_value(point)
+
+        assert bounds_to_floats(f(x)) == (expected, expected)
+
+
+def test_horner_scheme_encloses_the_flat_evaluation_of_inexact_points():
+    f = _shared_powers_function()
+    for point in ([0.1, -1.3, 2.7], [1 / 3, 0.7, -0.9]):
+        x = [FloatDPBounds(value) for value in point]
+        lower, upper = bounds_to_floats(f(FloatDPBoundsVector(x, dp)))
+        flat_lower, flat_upper = bounds_to_floats(f.function(x))
+
+        assert lower <= flat_upper and flat_lower <= upper
+        assert lower <= f.horner(point) <= upper
+
+
+def test_factored_function_skips_zero_terms():
+    f = PolynomialFunction(n_variables=2, coordinates=[Coordinate(FloatDPBounds(0.0), (3, 1))])
+    value = f.factored_function([FloatDPBounds(1.0), FloatDPBounds(2.0)])
+    assert float(value.lower().raw()) == float(value.upper().raw()) == 0.0
+
+
+def test_prepare_builds_the_requested_representations_once():
+    f = _objective()
+
+    f.prepare()
+    array = f.array
+    assert f._factored_function is None
+
+    f.prepare(array=False, factored_function=True)
+    factored_function = f.factored_function
+    f.prepare(array=True, factored_function=True)
+    assert f.array is array and f.factored_function is factored_function
+
+
+def test_gradient_system_is_built_with_its_representations():
+    from solvers.polynomial_optimiser import PolynomialOptimiser
+    from utils._float_conversion import floats_to_box
+
+    system, _ = PolynomialOptimiser()._create_subproblems(
+        f=_objective(), D=floats_to_box([(-float("inf"), float("inf"))] * 2)
+    )
+
+    components = [x for functions in system.functions_per_variable.values() for x in functions]
+    assert len(components) == 4
+    assert all(x._array is not None and x._factored_function is not None for x in components)
+    assert all(x._array is not None for x in system.hessian_diagonal)
+
+
+def _exact_terms(f: PolynomialFunction) -> dict:
+    return {powers: bounds_to_floats(c) for powers, c in f._terms.items()}
+
+
+def test_power_zero_is_one_and_power_one_is_the_polynomial():
+    f = _shared_powers_function()
+
+    assert _exact_terms(f ** 0) == {(0, 0, 0): (1.0, 1.0)}
+    assert _exact_terms(f ** 1) == _exact_terms(f)
+
+
+def test_power_matches_repeated_multiplication():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=x[0] - 2 * x[1] ** 2 + 1)
+
+    expected = f
+    for _ in range(12):
+        expected = expected * f
+
+    assert _exact_terms(f ** 13) == _exact_terms(expected)
+
+
+@pytest.mark.parametrize("k", [-1, 2.0, 0.5, "2"])
+def test_power_rejects_negative_and_non_integer_exponents(k):
+    with pytest.raises(Exception, match="Operation not possible"):
+        _objective() ** k
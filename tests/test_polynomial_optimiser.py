@@ -0,0 +1,231 @@
+import pickle
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from solvers.polynomial_optimiser import _find_all_minima_within_box_in_worker
+from solvers.polynomial_optimiser import _initialise_worker
+from solvers.polynomial_optimiser import _to_worker_task
+from solvers.polynomial_optimiser import ARIADNE_ENGINE
+from solvers.polynomial_optimiser import KRAWCZYK_ENGINE
+from solvers.polynomial_optimiser import PolynomialOptimiser
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import box_to_floats
+from utils._float_conversion import floats_to_box
+from utils.polynomial_function import PolynomialFunction
+
+
+def _objective() -> PolynomialFunction:
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return PolynomialFunction(n_variables=2, f=(x[0] - 2) ** 2 + (x[1] + 3) ** 2 + x[0] ** 4)
+
+
+def test_worker_tasks_hold_only_the_box_and_the_flags():
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+    f = _objective()
+    system, problems = optimiser._create_subproblems(f=f, D=floats_to_box([(-10.0, 10.0), (-10.0, 10.0)]))
+    _initialise_worker(optimiser=pickle.loads(pickle.dumps(optimiser)), system=pickle.loads(pickle.dumps(system)))
+
+    n_minima = 0
+    for p in problems:
+        task = _to_worker_task(p)
+        assert len(pickle.dumps(task)) < len(pickle.dumps(f))
+
+        minima, _ = _find_all_minima_within_box_in_worker(pickle.loads(pickle.dumps(task)))
+        expected = optimiser._find_all_minima_within_box(system=system, p=p)
+        assert minima == [bounds_vector_to_floats(x) for x in expected]
+        n_minima += len(minima)
+
+    assert n_minima == 1
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_minimise_anytime_resumes_lazily(workers):
+    f = _objective()
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE, workers=workers)
+    expected = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=f)]
+
+    result = optimiser.minimise_anytime(f=f, budget=0)
+    assert not result.is_exhaustive
+    # The boxes screened out by gradient exclusion count as explored
+    statistics = optimiser.statistics
+    assert 0 < result.n_unexplored == statistics.n_subproblems - statistics.n_excluded_boxes
+    assert not isinstance(result.unexplored, list)
+    system = result.system
+
+    resumed = optimiser.minimise_anytime(f=f, resume_from=result)
+    assert resumed.is_exhaustive
+    assert resumed.n_unexplored == 0
+    assert resumed.system is system
+    assert [bounds_vector_to_floats(x) for x in resumed.minima] == expected
+
+
+def test_univariate_path_reports_statistics_and_progress():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(1, dp)[0]
+    # Minima at -2 and 2, a maximum at 0
+    f = PolynomialFunction(n_variables=1, f=x ** 4 - 8 * x ** 2)
+    events = []
+    progress = []
+    optimiser = PolynomialOptimiser(hooks=[lambda event, data: events.append(event)])
+
+    minima = list(optimiser.iter_minima(f=f, progress=lambda *args: progress.append(args)))
+
+    assert len(minima) == 2
+    assert progress == [(1, 1)]
+    statistics = optimiser.statistics
+    assert statistics.n_subproblems == 1
+    assert statistics.n_roots_per_box == [3]
+    assert statistics.n_second_derivative_rejections == 1
+    assert {"conversion", "solve"} <= set(statistics.seconds)
+    assert {"box_solved", "second_derivative_rejections", "timing"} <= set(events)
+
+
+def test_corners_of_a_bounded_domain_are_checked_as_minima():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    # Increasing in both variables, so the minimum is the lower corner of the box
+    f = PolynomialFunction(n_variables=2, f=x[0] + 2 * x[1] + x[0] * x[1])
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+
+    minima = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=f, D=floats_to_box([(0.0, 1.0)] * 2))]
+
+    assert minima == [[(0.0, 0.0), (0.0, 0.0)]]
+
+
+def test_endpoint_check_evaluates_every_derivative_at_the_whole_corner():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    D = floats_to_box([(1.0, 2.0), (-2.0, -1.0)])
+    optimiser = PolynomialOptimiser(engine=KRAWCZYK_ENGINE)
+
+    def endpoints(f):
+        f = PolynomialFunction(n_variables=2, f=f)
+        return [bounds_vector_to_floats(x) for x in optimiser._get_endpoints_if_minima(f_derivatives=f.gradient(), D=D)]
+
+    # The gradient (x1 + 3, x0) is positive at (1, -2) but its first component is not at the coordinate -2
+    assert endpoints(x[0] * x[1] + 3 * x[0]) == [[(1.0, 1.0), (-2.0, -2.0)]]
+    # The gradient (-x1 - 3, -x0) is negative at (2, -1) but its first component is not at the coordinate 2
+    assert endpoints(-x[0] * x[1] - 3 * x[0]) == [[(2.0, 2.0), (-1.0, -1.0)]]
+    # The gradient (x1, x0) is positive at the coordinate 1 but not at the lower corner (1, -2)
+    assert endpoints(x[0] * x[1]) == []
+
+
+def test_find_global_minima_returns_every_tied_minimum():
+    # Levy No. 1 has its global minima 7 at -3 and 3, and a local minimum 250 at 0
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(1, dp)
+    f = PolynomialFunction(n_variables=1, f=x[0] ** 6 - 15 * x[0] ** 4 + 27 * x[0] ** 2 + 250)
+
+    minima = PolynomialOptimiser().find_global_minima(f=f)
+
+    boxes = sorted(bounds_vector_to_floats(x) for x in minima)
+    assert len(boxes) == 2
+    for [(lower, upper)], root in zip(boxes, (-3.0, 3.0)):
+        assert lower <= root <= upper
+    objective_lower, objective_upper = f.evaluate_many(minima)
+    assert all(lower <= 7.0 <= upper for lower, upper in zip(objective_lower, objective_upper))
+
+
+@pytest.mark.parametrize("engine", [ARIADNE_ENGINE, KRAWCZYK_ENGINE])
+def test_find_global_minima_returns_tied_minima_of_a_multivariate_objective(engine):
+    # The tied minima 0 at (-1, 1/2) and (1, 1/2), and a saddle point at (0, 1/2)
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=(x[0] ** 2 - 1) ** 2 + (x[1] - FloatDPBounds(0.5)) ** 2)
+
+    minima = sorted(bounds_vector_to_floats(x) for x in PolynomialOptimiser(engine=engine).find_global_minima(f=f))
+
+    assert len(minima) == 2
+    for minimum, root in zip(minima, ((-1.0, 0.5), (1.0, 0.5))):
+        assert all(lower <= r <= upper for (lower, upper), r in zip(minimum, root))
+
+
+def _two_minima() -> PolynomialFunction:
+    # (x0^2 - 1)^2 + (x1 - 1/2)^2 has minima at (-1, 1/2) and (1, 1/2)
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    return PolynomialFunction(n_variables=2, f=(x[0] ** 2 - 1) ** 2 + (x[1] - FloatDPBounds(0.5)) ** 2)
+
+
+def _assert_same_minima(optimiser: PolynomialOptimiser) -> None:
+    single_stage = PolynomialOptimiser(tolerance=1e-8).minimise_all(f=_two_minima())
+    single_stage = [bounds_vector_to_floats(x) for x in single_stage]
+    two_stage = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=_two_minima())]
+
+    assert len(two_stage) == len(single_stage) == 2
+    for x in single_stage:
+        assert sum(all(a <= d and c <= b for (a, b), (c, d) in zip(x, y)) for y in two_stage) == 1
+
+
+def test_coarse_solve_finds_the_minima_of_the_single_stage_solve():
+    _assert_same_minima(PolynomialOptimiser(tolerance=1e-8, coarse_tolerance=1e-2))
+
+
+class _FailingSolver:
+    def solve_all(self, f, D):
+        raise RuntimeError("coarse solve failed")
+
+
+def test_boxes_are_solved_as_a_whole_when_the_coarse_solve_fails(monkeypatch):
+    import solvers.polynomial_optimiser
+
+    solver_class = solvers.polynomial_optimiser.IntervalNewtonSolver
+
+    def failing_coarse_solver(tolerance, max_steps):
+        return _FailingSolver() if tolerance == 1e-2 else solver_class(tolerance, max_steps)
+
+    monkeypatch.setattr(solvers.polynomial_optimiser, "IntervalNewtonSolver", failing_coarse_solver)
+    optimiser = PolynomialOptimiser(tolerance=1e-8, coarse_tolerance=1e-2)
+
+    _assert_same_minima(optimiser)
+    assert optimiser.statistics.n_solver_failures == 0
+
+
+@pytest.mark.parametrize("engine", [ARIADNE_ENGINE, KRAWCZYK_ENGINE])
+def test_branch_and_bound_prunes_boxes_and_finds_the_same_minimum(engine):
+    # The minimum 0 at (5, 5) is in the box [1, 10]^2, the interval evaluation of f over the four boxes within
+    # [-10, 1]^2 is positive. Without gradient exclusion those boxes reach the pruning step.
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=(x[0] - 5) ** 2 + (x[1] - 5) ** 2)
+    D = floats_to_box([(-10.0, 10.0)] * 2)
+    optimiser = PolynomialOptimiser(engine=engine, gradient_exclusion=False)
+
+    minimum = optimiser.minimise(f=f, D=D, branch_and_bound=True)
+    n_pruned_boxes = optimiser.statistics.n_pruned_boxes
+
+    assert n_pruned_boxes == 4
+    assert bounds_vector_to_floats(minimum) == bounds_vector_to_floats(optimiser.minimise(f=f, D=D))
+    assert optimiser.statistics.n_pruned_boxes == 0
+
+
+def test_boxes_whose_gradient_excludes_zero_are_dropped():
+    # The gradient (2 (x0 - 2), 2 (x1 + 3)) only vanishes in the box of x0 in [1, inf) and x1 in (-inf, -1]
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=(x[0] - 2) ** 2 + (x[1] + 3) ** 2)
+    optimiser = PolynomialOptimiser()
+    system, problems = optimiser._create_subproblems(f=f, D=floats_to_box([(-np.inf, np.inf)] * 2))
+    critical = [p for p in problems if box_to_floats(p.D)[0][0] > 0 and box_to_floats(p.D)[1][1] < 0.5]
+    # x0 in [1, inf) and x1 in [1, inf), where only the component of x1 in reciprocal coordinates excludes zero
+    reciprocal = [
+        p for p in problems
+        if all(p.is_conversion_needed_per_dimension) and all(lower > 0 for lower, _ in box_to_floats(p.D))
+    ]
+    assert len(critical) == len(reciprocal) == 1 and all(critical[0].is_conversion_needed_per_dimension)
+
+    assert optimiser._exclude_boxes_without_critical_points(system=system, problems=problems) == critical
+    assert optimiser.statistics.n_excluded_boxes == len(problems) - 1
+    assert optimiser._exclude_boxes_without_critical_points(system=system, problems=reciprocal) == []
+
+
+@pytest.mark.parametrize("engine", [ARIADNE_ENGINE, KRAWCZYK_ENGINE])
+@pytest.mark.parametrize("D", [None, [(-2.0, 3.0), (-1.0, 2.0)]])
+def test_gradient_exclusion_does_not_change_the_minima(engine, D):
+    D = None if D is None else floats_to_box(D)
+    minima = {}
+    for gradient_exclusion in (True, False):
+        optimiser = PolynomialOptimiser(engine=engine, gradient_exclusion=gradient_exclusion)
+        minima[gradient_exclusion] = [bounds_vector_to_floats(x) for x in optimiser.minimise_all(f=_two_minima(), D=D)]
+
+    assert len(minima[True]) == 2
+    assert minima[True] == minima[False]
@@ -0,0 +1,111 @@
+from fractions import Fraction
+from typing import List
+
+import pytest
+
+from utils._real_root_isolation import evaluate
+from utils._real_root_isolation import isolate_real_roots
+from utils._real_root_isolation import Polynomial
+from utils._real_root_isolation import refine_root
+from utils._real_root_isolation import square_free_part
+
+
+def _from_roots(roots: List[Fraction], leading: Fraction = Fraction(1)) -> Polynomial:
+    p = [leading]
+    for root in roots:
+        # p (x - root)
+        p = [Fraction(0)] + p
+        for k in range(len(p) - 1):
+            p[k] -= root * p[k + 1]
+
+    return p
+
+
+def _isolated_roots(p: Polynomial, a: Fraction, b: Fraction) -> List[Fraction]:
+    intervals = isolate_real_roots(p, a, b)
+    for (lower, upper), (next_lower, _) in zip(intervals, intervals[1:]):
+        assert upper <= next_lower
+    roots = []
+    for lower, upper in intervals:
+        assert evaluate(p, lower) != 0 and evaluate(p, upper) != 0
+        root_lower, root_upper = refine_root(p, lower, upper, Fraction(1, 2 ** 40))
+        roots.append((root_lower + root_upper) / 2)
+
+    return roots
+
+
+def test_square_free_part_keeps_every_multiple_root_once():
+    roots = [Fraction(1), Fraction(-2), Fraction(1, 3)]
+    p = _from_roots([roots[0]] * 3 + [roots[1]] * 2 + [roots[2]], leading=Fraction(-7, 2))
+
+    assert square_free_part(p) == _from_roots(roots)
+
+
+def test_square_free_part_of_a_square_free_polynomial_is_monic():
+    p = _from_roots([Fraction(2), Fraction(-5, 3)], leading=Fraction(4))
+
+    assert square_free_part(p) == _from_roots([Fraction(2), Fraction(-5, 3)])
+
+
+def test_isolates_the_roots_of_a_polynomial_with_multiple_roots():
+    p = _from_roots([Fraction(1)] * 3 + [Fraction(-2)] * 2 + [Fraction(1, 3)])
+
+    roots = _isolated_roots(square_free_part(p), Fraction(-10), Fraction(10))
+
+    assert roots == pytest.approx([-2.0, 1 / 3, 1.0], abs=2 ** -40)
+
+
+def test_isolates_rational_roots_hit_by_the_bisection():
+    # 0 and 2 are midpoints of the bisection of (-4, 4), 1/3 and -2/7 are not dyadic
+    p = _from_roots([Fraction(0), Fraction(2), Fraction(1, 3), Fraction(-2, 7)])
+
+    intervals = isolate_real_roots(p, Fraction(-4), Fraction(4))
+    roots = _isolated_roots(p, Fraction(-4), Fraction(4))
+
+    assert len(intervals) == 4
+    assert roots == pytest.approx([-2 / 7, 0.0, 1 / 3, 2.0], abs=2 ** -40)
+    for root, (lower, upper) in zip([Fraction(-2, 7), Fraction(0), Fraction(1, 3), Fraction(2)], intervals):
+        assert lower < root < upper
+
+
+def test_roots_at_the_bounds_are_not_counted():
+    p = _from_roots([Fraction(-1), Fraction(0), Fraction(1)])
+
+    assert isolate_real_roots(p, Fraction(-1), Fraction(1)) == [(Fraction(-1), Fraction(1))]
+    assert isolate_real_roots(p, Fraction(0), Fraction(1)) == []
+
+
+def _critical_points(f_derivative: Polynomial, domain) -> list:
+    pytest.importorskip("pyariadne")
+    from solvers.polynomial_optimiser import PolynomialOptimiser
+    from utils._float_conversion import bounds_vector_to_floats
+    from utils._float_conversion import floats_to_box
+
+    critical_points = PolynomialOptimiser()._find_univariate_critical_points(
+        f_derivative=f_derivative, D=floats_to_box(domain)
+    )
+    return [(bounds_vector_to_floats(x)[0], is_minimum) for x, is_minimum in critical_points]
+
+
+def test_critical_points_at_the_bounds_of_the_domain_are_found():
+    # The derivative 2 x - 2 of (x - 1)^2 vanishes at the lower bound of the domain
+    [((lower, upper), is_minimum)] = _critical_points([Fraction(-2), Fraction(2)], [(1.0, 3.0)])
+    assert lower <= 1.0 <= upper and is_minimum
+
+    # The derivative 3 x^2 - 12 of x^3 - 12 x vanishes at both bounds, the maximum -2 and the minimum 2
+    critical_points = _critical_points([Fraction(-12), Fraction(0), Fraction(3)], [(-2.0, 2.0)])
+    assert len(critical_points) == 2
+    for ((lower, upper), is_minimum), root in zip(critical_points, (-2.0, 2.0)):
+        assert lower <= root <= upper and is_minimum == (root > 0)
+
+
+def test_constant_polynomials_have_no_roots():
+    assert square_free_part([Fraction(5)]) == [Fraction(1)]
+    assert isolate_real_roots([Fraction(-3)], Fraction(-1), Fraction(1)) == []
+
+
+def test_the_zero_polynomial_is_rejected():
+    with pytest.raises(AssertionError):
+        square_free_part([Fraction(0), Fraction(0)])
+    with pytest.raises(AssertionError):
+        isolate_real_roots([], Fraction(-1), Fraction(1))
@@ -0,0 +1,101 @@
+import random
+
+from typing import Dict
+from typing import Tuple
+
+import pytest
+
+pytest.importorskip("pyariadne")
+
+from pyariadne import dp
+from pyariadne import FloatDPBounds
+from pyariadne import MultivariatePolynomial
+
+from utils._coordinate import intern_powers
+from utils._coordinate import MAX_INTERNED_POWERS
+from utils._float_conversion import bounds_to_floats
+from utils._term_store import add_terms
+from utils._term_store import differentiate_terms
+from utils._term_store import gradient_terms
+from utils._term_store import hessian_terms
+from utils._term_store import Terms
+from utils._term_store import terms_to_coordinates
+from utils.polynomial_function import PolynomialFunction
+
+# Integer coefficients are exact in double precision, so the term stores can be compared exactly with integer sums
+Reference = Dict[Tuple[int, ...], int]
+
+
+def _random_terms(rng: random.Random, n_variables: int, n_terms: int) -> Tuple[Terms, Reference]:
+    reference = {}
+    for _ in range(n_terms):
+        powers = tuple(rng.randint(0, 3) for _ in range(n_variables))
+        reference[powers] = rng.randint(-5, 5) or 1
+    terms = {powers: FloatDPBounds(str(c), dp) for powers, c in reference.items()}
+
+    return terms, reference
+
+
+def _to_reference(terms: Terms) -> Reference:
+    result = {}
+    for powers, c in terms.items():
+        lower, upper = bounds_to_floats(c)
+        assert lower == upper, "Exact integer arithmetic must give exact coefficients"
+        result[powers] = int(lower)
+
+    return result
+
+
+def test_add_terms_matches_naive_sum():
+    rng = random.Random(0)
+    for _ in range(50):
+        terms, reference = _random_terms(rng, n_variables=3, n_terms=8)
+        other, other_reference = _random_terms(rng, n_variables=3, n_terms=8)
+
+        expected = dict(reference)
+        for powers, c in other_reference.items():
+            expected[powers] = expected.get(powers, 0) + c
+        expected = {powers: c for powers, c in expected.items() if c != 0}
+
+        assert _to_reference(add_terms(terms, other, n_variables=3)) == expected
+
+
+def test_add_terms_pads_exponents_of_fewer_variables():
+    terms = {(1,): FloatDPBounds("2", dp)}
+    other = {(1, 1): FloatDPBounds("3", dp), (1, 0): FloatDPBounds("-2", dp)}
+
+    assert _to_reference(add_terms(terms, other, n_variables=2)) == {(1, 1): 3}
+
+
+def test_derivatives_match_differentiate_terms():
+    rng = random.Random(1)
+    terms, _ = _random_terms(rng, n_variables=3, n_terms=10)
+
+    gradient = gradient_terms(terms, n_variables=3)
+    hessian = hessian_terms(terms, n_variables=3)
+    for i in range(3):
+        assert _to_reference(gradient[i]) == _to_reference(differentiate_terms(terms, i))
+        for j in range(3):
+            expected = differentiate_terms(differentiate_terms(terms, i), j)
+            assert _to_reference(hessian[i][j]) == _to_reference(expected)
+
+
+def test_zero_polynomial_keeps_number_of_variables():
+    x = MultivariatePolynomial[FloatDPBounds].coordinates(2, dp)
+    f = PolynomialFunction(n_variables=2, f=x[0] * x[1] + x[1])
+    zero = f - f
+
+    assert zero.n_terms == 0
+    assert zero.max_degree_nth_variable(0) == 0
+    assert zero.max_degree_nth_variable(1) == 0
+    assert [x.powers for x in terms_to_coordinates({}, n_variables=2)] == [(0, 0)]
+    assert zero.polynomial is not None
+
+
+def test_intern_powers_shares_equal_tuples_and_is_bounded():
+    powers = intern_powers((1, 2, 3))
+    assert intern_powers(tuple([1, 2, 3])) is powers
+
+    for i in range(MAX_INTERNED_POWERS + 10):
+        intern_powers((i, -1))
+    assert intern_powers.cache_info().currsize <= MAX_INTERNED_POWERS
@@ -0,0 +1,121 @@
+import struct
+
+from typing import List
+from typing import Tuple
+from typing import Union
+
+import numpy as np
+
+from utils.polynomial_array import PolynomialArray
+
+# Little-endian records, every array section starts at a multiple of 8 bytes so that it can be viewed in place, e.g.
+# in a memory-mapped file:
+#   polynomial: magic, version, n_variables, n_terms | int32 exponents (n_terms, n_variables), padded |
+#               float64 lower bounds (n_terms) | float64 upper bounds (n_terms)
+#   problem:    magic, version, n_variables, n_components | uint8 conversion flags (n_variables), padded |
+#               float64 domain bounds (n_variables, 2) | n_components polynomial records
+POLYNOMIAL_MAGIC = b"ARPOLY"
+PROBLEM_MAGIC = b"ARPROB"
+VERSION = 1
+
+_HEADER = struct.Struct("<6sHIQ")
+_HEADER_SIZE = 24
+
+Buffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+
+def _padded(n_bytes: int) -> int:
+    return (n_bytes + 7) // 8 * 8
+
+
+def _pad(data: bytes) -> bytes:
+    return data + bytes(_padded(len(data)) - len(data))
+
+
+def _read_header(buffer: Buffer, offset: int, magic: bytes) -> Tuple[int, int]:
+    found_magic, version, n_variables, n = _HEADER.unpack_from(buffer, offset)
+    if found_magic != magic:
+        raise ValueError(f"Expected a record starting with {magic!r}, found {found_magic!r}")
+    if version > VERSION:
+        raise ValueError(f"Record has format version {version}, only versions up to {VERSION} can be read")
+
+    return n_variables, n
+
+
+def encode_array(f: PolynomialArray) -> bytes:
+    """
+    :param f: polynomial to encode
+    :return: polynomial record with the exact bits of the coefficient bounds
+    """
+    if f.n_terms and np.abs(f.exponents).max() > np.iinfo(np.int32).max:
+        raise ValueError("Exponents do not fit the binary format")
+
+    header = _pad(_HEADER.pack(POLYNOMIAL_MAGIC, VERSION, f.n_variables, f.n_terms))
+    exponents = _pad(np.ascontiguousarray(f.exponents, dtype="<i4").tobytes())
+    lower = np.ascontiguousarray(f.lower, dtype="<f8").tobytes()
+    upper = np.ascontiguousarray(f.upper, dtype="<f8").tobytes()
+
+    return header + exponents + lower + upper
+
+
+def decode_array(buffer: Buffer, offset: int = 0) -> Tuple[PolynomialArray, int]:
+    """
+    Read a polynomial record; the coefficient bounds of the result are views of the buffer, not copies
+    :param buffer: bytes or array (e.g. np.memmap) holding the record
+    :param offset: position of the record in the buffer
+    :return: the polynomial and the position after the record
+    """
+    n_variables, n_terms = _read_header(buffer, offset, POLYNOMIAL_MAGIC)
+    offset += _HEADER_SIZE
+    exponents = np.frombuffer(buffer, dtype="<i4", count=n_terms * n_variables, offset=offset)
+    offset += _padded(exponents.nbytes)
+    lower = np.frombuffer(buffer, dtype="<f8", count=n_terms, offset=offset)
+    offset += lower.nbytes
+    upper = np.frombuffer(buffer, dtype="<f8", count=n_terms, offset=offset)
+    offset += upper.nbytes
+
+    f = PolynomialArray(n_variables, exponents.reshape(n_terms, n_variables).astype(np.int64), lower, upper)
+
+    return f, offset
+
+
+def encode_problem(
+    components: List[PolynomialArray],
+    domain_bounds: List[Tuple[float, float]],
+    is_conversion_needed_per_dimension: List[bool]
+) -> bytes:
+    """
+    :param components: components of the gradient system
+    :param domain_bounds: exact bounds of the box
+    :param is_conversion_needed_per_dimension: which variables are in reciprocal coordinates
+    :return: problem record
+    """
+    n_variables = len(domain_bounds)
+    header = _pad(_HEADER.pack(PROBLEM_MAGIC, VERSION, n_variables, len(components)))
+    flags = _pad(np.array(is_conversion_needed_per_dimension, dtype=np.uint8).tobytes())
+    bounds = np.array(domain_bounds, dtype="<f8").reshape(n_variables, 2).tobytes()
+
+    return header + flags + bounds + b"".join(encode_array(f) for f in components)
+
+
+def decode_problem(
+    buffer: Buffer, offset: int = 0
+) -> Tuple[List[PolynomialArray], List[Tuple[float, float]], List[bool], int]:
+    """
+    :param buffer: bytes or array holding the record
+    :param offset: position of the record in the buffer
+    :return: components, domain bounds, conversion flags and the position after the record
+    """
+    n_variables, n_components = _read_header(buffer, offset, PROBLEM_MAGIC)
+    offset += _HEADER_SIZE
+    flags = np.frombuffer(buffer, dtype=np.uint8, count=n_variables, offset=offset)
+    offset += _padded(n_variables)
+    bounds = np.frombuffer(buffer, dtype="<f8", count=2 * n_variables, offset=offset).reshape(n_variables, 2)
+    offset += bounds.nbytes
+
+    components = []
+    for _ in range(n_components):
+        f, offset = decode_array(buffer, offset)
+        components.append(f)
+
+    return components, [tuple(x) for x in bounds.tolist()], [bool(x) for x in flags], offset
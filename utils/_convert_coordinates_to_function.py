@@ -5,6 +5,9 @@ from pyariadne import ValidatedScalarMultivariateFunction
 from pyariadne import ValidatedVectorMultivariateFunction
 
 from utils._coordinate import Coordinate
+from utils._horner import HornerScheme
+from utils._term_store import prune_zero_terms
+from utils._term_store import Terms
 
 ONE = ValidatedNumber(0)
 ZERO = FloatDP(0, dp)
@@ -27,3 +30,21 @@ def convert_coordinates_to_function(
         f += coordinate
 
     return f
+
+
+def convert_terms_to_factored_function(n_variables: int, terms: Terms) -> ValidatedScalarMultivariateFunction:
+    """
+    :param n_variables: number of variables
+    :param terms: term store of the polynomial
+    :return: the polynomial as a Horner-factored function in which every power of a variable is a single shared
+        subexpression, instead of a flat sum of monomials
+    """
+    identify_function = ValidatedVectorMultivariateFunction.identity(n_variables)
+    f = ValidatedScalarMultivariateFunction.constant(n_variables, ONE)
+    terms = prune_zero_terms(terms)
+    if terms:
+        f += HornerScheme(n_variables=n_variables, terms=terms).build(
+            [identify_function[i] for i in range(n_variables)]
+        )
+
+    return f
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 from typing import List
 from typing import Optional
@@ -14,28 +15,37 @@ from utils.add_lists_elementwise import add_lists_elementwise
 
 _OPERATION_NOT_POSSIBLE_ERROR_MESSAGE = f"Operation not possible for objects of type Coordinate and "
 
+# Number of distinct exponent tuples remembered for interning; the least recently used ones are forgotten, which only
+# costs sharing between terms, so long-running processes do not keep every exponent tuple they have ever seen
+MAX_INTERNED_POWERS = 2 ** 16
+
+
+@lru_cache(maxsize=MAX_INTERNED_POWERS)
+def intern_powers(powers: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Return the canonical instance of an exponent tuple, so that equal exponents of the terms share one object
+    :param powers: exponent tuple
+    :return: interned exponent tuple equal to powers
+    """
+    return powers
+
 
 class Coordinate:
-    _coefficient: FloatDPBounds = None
-    # _powers: MultiIndex = None
-    _powers: List[int] = None
+    __slots__ = ("_coefficient", "_powers")
+
+    _coefficient: FloatDPBounds
+    _powers: Tuple[int, ...]
 
     def __init__(
-        self, coefficient: FloatDPBounds, powers: Optional[Union[MultiIndex, List[int]]] = None
+        self, coefficient: FloatDPBounds, powers: Optional[Union[MultiIndex, List[int], Tuple[int, ...]]] = None
     ) -> None:
         self._coefficient = coefficient
-        if not powers:
-            self._powers = []
-        elif isinstance(powers, list):
-            self._powers = powers
+        if powers is None:
+            self._powers = ()
+        elif isinstance(powers, (list, tuple)):
+            self._powers = intern_powers(tuple(powers))
         else:
-            powerss = []
-            for x in str(powers):
-                if x == ";":
-                    break
-                if x.isnumeric():
-                    powerss.append(int(x))
-            self._powers = powerss
+            self._powers = intern_powers(tuple(powers[i] for i in range(powers.size())))
 
     def __repr__(self) -> str:
         return "Coordinate({" + str(self._powers) + ": " + str(self._coefficient) + "})"
@@ -98,7 +108,7 @@ class Coordinate:
         return result
 
     def one_over_x(self, n: int) -> "Coordinate":
-        powers = self._powers.copy()
+        powers = list(self._powers)
         powers[n] = - powers[n]
         result = Coordinate(coefficient=self._coefficient, powers=powers)
 
@@ -110,4 +120,4 @@ class Coordinate:
 
     @property
     def powers(self) -> Tuple[int, ...]:
-        return tuple(self._powers)
+        return self._powers
@@ -0,0 +1,81 @@
+from typing import List
+from typing import Tuple
+
+import numpy as np
+
+from pyariadne import FloatDPBoundsVector
+
+from utils._float_conversion import bounds_vectors_to_arrays
+from utils._float_conversion import floats_to_bounds_vector
+
+
+def cluster_overlapping_boxes(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """
+    Group boxes into clusters of boxes that share a common point, so that a chain of overlaps does not join boxes that
+    are far apart. A sweep over the boxes sorted by their lower bound in the first dimension adds every box to the
+    first cluster whose intersection it overlaps, and only compares it with the clusters whose intersection it still
+    reaches in that dimension, which is near-linear for the small, mostly disjoint boxes of verified minima.
+    :param lower: lower bounds of the boxes, of shape (N, n)
+    :param upper: upper bounds of the boxes, of shape (N, n)
+    :return: cluster label of every box, the index of the first box of its cluster
+    """
+    n_boxes = len(lower)
+    labels = np.arange(n_boxes)
+    if n_boxes == 0 or lower.shape[1] == 0:
+        return np.zeros(n_boxes, dtype=int)
+
+    # Label and intersection of the clusters that later boxes can still overlap
+    active = []
+    for i in np.argsort(lower[:, 0], kind="stable"):
+        active = [x for x in active if x[2][0] >= lower[i, 0]]
+        for cluster in active:
+            label, intersection_lower, intersection_upper = cluster
+            if np.all(lower[i] <= intersection_upper) and np.all(intersection_lower <= upper[i]):
+                labels[i] = label
+                cluster[1] = np.fmax(intersection_lower, lower[i])
+                cluster[2] = np.fmin(intersection_upper, upper[i])
+                break
+        else:
+            active.append([i, lower[i], upper[i]])
+
+    # Relabel every cluster by its first box
+    first = {}
+    for i in range(n_boxes):
+        first.setdefault(labels[i], i)
+
+    return np.array([first[x] for x in labels], dtype=int)
+
+
+def merge_overlapping_boxes(lower: np.ndarray, upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Replace every cluster of overlapping boxes by the hull of its boxes. Overlapping boxes may enclose distinct roots,
+    so only their hull is known to contain all of them; see KrawczykSolver for intersecting boxes that are verified to
+    enclose the same root.
+    :param lower: lower bounds of the boxes, of shape (N, n)
+    :param upper: upper bounds of the boxes, of shape (N, n)
+    :return: lower and upper bounds of the merged boxes, in the order of the first box of every cluster
+    """
+    labels = cluster_overlapping_boxes(lower, upper)
+    clusters = np.unique(labels)
+    merged_lower = np.empty((len(clusters), lower.shape[1]))
+    merged_upper = np.empty((len(clusters), upper.shape[1]))
+    for k, label in enumerate(clusters):
+        members = labels == label
+        merged_lower[k], merged_upper[k] = lower[members].min(axis=0), upper[members].max(axis=0)
+
+    return merged_lower, merged_upper
+
+
+def deduplicate_minima(minima: List[FloatDPBoundsVector]) -> List[FloatDPBoundsVector]:
+    """
+    Merge the minima that are reported more than once because the boxes they were found in overlap
+    :param minima: verified minima, possibly overlapping
+    :return: the hull of every cluster of overlapping minima
+    """
+    if len(minima) < 2:
+        return list(minima)
+
+    lower, upper = bounds_vectors_to_arrays(minima)
+    merged_lower, merged_upper = merge_overlapping_boxes(lower, upper)
+
+    return [floats_to_bounds_vector(list(zip(x.tolist(), y.tolist()))) for x, y in zip(merged_lower, merged_upper)]
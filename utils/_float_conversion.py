@@ -0,0 +1,88 @@
+import math
+
+from fractions import Fraction
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from pyariadne import dp
+from pyariadne import exact
+from pyariadne import FloatDP
+from pyariadne import FloatDPBounds
+from pyariadne import FloatDPBoundsVector
+from pyariadne import FloatDPExactBox
+from pyariadne import FloatDPExactInterval
+
+INF = FloatDP.inf(dp)
+
+
+def floatdp_to_float(x: FloatDP) -> float:
+    return x.get_d()
+
+
+def float_to_floatdp(x: float) -> FloatDP:
+    """
+    Convert a double to a FloatDP without rounding; infinities are mapped to the FloatDP infinities
+    :param x: value to convert
+    :return: FloatDP with exactly the same value
+    """
+    if math.isinf(x):
+        return INF if x > 0 else -INF
+    return FloatDP(exact(x), dp)
+
+
+def fraction_to_floats(x: Fraction) -> Tuple[float, float]:
+    """
+    Enclose a rational number by doubles
+    :param x: value to enclose
+    :return: largest double not above x and smallest double not below x
+    """
+    nearest = float(x)
+    lower = nearest if Fraction(nearest) <= x else math.nextafter(nearest, -math.inf)
+    upper = nearest if Fraction(nearest) >= x else math.nextafter(nearest, math.inf)
+
+    return lower, upper
+
+
+def bounds_to_floats(x: FloatDPBounds) -> Tuple[float, float]:
+    return floatdp_to_float(x.lower().raw()), floatdp_to_float(x.upper().raw())
+
+
+def floats_to_bounds(lower: float, upper: float) -> FloatDPBounds:
+    return FloatDPBounds(float_to_floatdp(lower), float_to_floatdp(upper))
+
+
+def bounds_vector_to_floats(x: FloatDPBoundsVector) -> List[Tuple[float, float]]:
+    return [bounds_to_floats(x[i]) for i in range(x.size())]
+
+
+def floats_to_bounds_vector(bounds: Sequence[Tuple[float, float]]) -> FloatDPBoundsVector:
+    return FloatDPBoundsVector([floats_to_bounds(lower, upper) for lower, upper in bounds])
+
+
+def box_to_floats(D: FloatDPExactBox) -> List[Tuple[float, float]]:
+    return [(floatdp_to_float(D[i].lower_bound()), floatdp_to_float(D[i].upper_bound())) for i in range(D.dimension())]
+
+
+def floats_to_box(bounds: Sequence[Tuple[float, float]]) -> FloatDPExactBox:
+    intervals = [
+        FloatDPExactInterval((float_to_floatdp(lower), float_to_floatdp(upper))) for lower, upper in bounds
+    ]
+    return FloatDPExactBox(intervals)
+
+
+def bounds_vectors_to_arrays(points: Sequence[FloatDPBoundsVector]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert interval vectors to arrays of lower and upper bounds
+    :param points: N interval vectors of size n
+    :return: lower and upper bounds, both of shape (N, n)
+    """
+    bounds = np.array(
+        [[bounds_to_floats(x[i]) for i in range(x.size())] for x in points], dtype=float
+    )
+    if bounds.size == 0:
+        return np.zeros((len(points), 0)), np.zeros((len(points), 0))
+
+    return bounds[:, :, 0], bounds[:, :, 1]
@@ -0,0 +1,131 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from pyariadne import dp
+from pyariadne import FloatDP
+from pyariadne import FloatDPBounds
+from pyariadne import FloatDPBoundsVector
+
+from utils._float_conversion import bounds_to_floats
+from utils._term_store import Terms
+
+ZERO = FloatDP(0, dp)
+
+Power = Callable[[int, int], Any]
+Evaluator = Callable[[Power], Any]
+
+
+def _shared_powers(x: Sequence[Any]) -> Power:
+    """
+    Powers of the variables that are computed once per evaluation and shared by every node that needs them
+    :param x: values (or functions) of the variables
+    :return: callable returning x[v]**k
+    """
+    cache = {}
+
+    def power(v: int, k: int) -> Any:
+        if k == 1:
+            return x[v]
+        if (v, k) not in cache:
+            cache[(v, k)] = x[v] ** k
+        return cache[(v, k)]
+
+    return power
+
+
+def _choose_variable(terms: Dict[Tuple[int, ...], Any]) -> int:
+    """
+    Greedy variable ordering: factor out the variable that occurs in the most terms, the highest degree breaks ties
+    :param terms: terms of the (sub)polynomial
+    :return: index of the variable to factor out, -1 if the polynomial is constant
+    """
+    n_variables = len(next(iter(terms)))
+    best_variable = -1
+    best_key = (0, 0)
+    for v in range(n_variables):
+        occurrences = sum(1 for powers in terms if powers[v] != 0)
+        key = (occurrences, max(powers[v] for powers in terms))
+        if occurrences and key > best_key:
+            best_variable = v
+            best_key = key
+
+    return best_variable
+
+
+def _compile(terms: Dict[Tuple[int, ...], Any]) -> Evaluator:
+    v = _choose_variable(terms)
+    if v == -1:
+        constant = next(iter(terms.values()))
+        return lambda power: constant
+
+    groups = {}
+    for powers, c in terms.items():
+        groups.setdefault(powers[v], {})[powers[:v] + (0,) + powers[v+1:]] = c
+    degrees = sorted(groups, reverse=True)
+    children = [_compile(groups[k]) for k in degrees]
+    gaps = [degrees[i] - degrees[i+1] for i in range(len(degrees) - 1)]
+    lowest_degree = degrees[-1]
+    leading_child = children[0]
+    other_children = list(zip(gaps, children[1:]))
+
+    def evaluate(power: Power) -> Any:
+        result = leading_child(power)
+        for gap, child in other_children:
+            result = result * power(v, gap) + child(power)
+        if lowest_degree != 0:
+            result = result * power(v, lowest_degree)
+
+        return result
+
+    return evaluate
+
+
+class HornerScheme:
+    """
+    Polynomial compiled once into a nested multivariate Horner scheme. Calling it with FloatDPBounds values gives a
+    validated enclosure; calling it with plain floats evaluates the midpoints of the coefficients in double precision.
+    Powers of a variable that occur at several nodes are computed once per evaluation.
+    """
+    _n_variables: int
+    _terms: Terms
+    _interval_evaluator: Evaluator
+    _float_evaluator: Optional[Evaluator] = None
+
+    def __init__(self, n_variables: int, terms: Terms) -> None:
+        self._n_variables = n_variables
+        self._terms = terms
+        if terms:
+            self._interval_evaluator = _compile(terms)
+        else:
+            zero = FloatDPBounds(ZERO)
+            self._interval_evaluator = lambda power: zero
+
+    def _evaluate_floats(self, x: Sequence[float]) -> float:
+        if self._float_evaluator is None:
+            if self._terms:
+                float_terms = {powers: sum(bounds_to_floats(c)) / 2 for powers, c in self._terms.items()}
+                self._float_evaluator = _compile(float_terms)
+            else:
+                self._float_evaluator = lambda power: 0.0
+
+        return self._float_evaluator(_shared_powers(x))
+
+    def __call__(self, x: Any) -> Any:
+        if isinstance(x, FloatDPBoundsVector):
+            return self._interval_evaluator(_shared_powers([x[i] for i in range(x.size())]))
+        if all(isinstance(v, (int, float)) for v in x):
+            return self._evaluate_floats(x)
+
+        return self._interval_evaluator(_shared_powers(x))
+
+    def build(self, x: Sequence[Any]) -> Any:
+        """
+        Apply the scheme symbolically, e.g. to the coordinate functions of ValidatedVectorMultivariateFunction.identity
+        :param x: objects representing the variables, supporting +, * and ** with the coefficients
+        :return: Horner-factored expression in x, in which every power of a variable is one shared object
+        """
+        return self._interval_evaluator(_shared_powers(x))
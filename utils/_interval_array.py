@@ -0,0 +1,231 @@
+from typing import Callable
+from typing import Tuple
+
+import numpy as np
+
+IntervalArray = Tuple[np.ndarray, np.ndarray]
+
+# Veltkamp splitting constant for IEEE double precision, 2**27 + 1
+_SPLITTER = 134217729.0
+# Below this magnitude the error of a product may underflow, so TwoProduct is no longer exact
+_PRODUCT_UNDERFLOW = np.ldexp(1.0, -969)
+
+
+def _sum_error(a: np.ndarray, b: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """
+    Exact rounding error of s = a + b (Knuth's TwoSum), i.e. a + b = s + error
+    """
+    bb = s - a
+    return (a - (s - bb)) + (b - bb)
+
+
+def _split(a: np.ndarray) -> IntervalArray:
+    c = _SPLITTER * a
+    high = c - (c - a)
+    return high, a - high
+
+
+def _product_error(a: np.ndarray, b: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    Exact rounding error of p = a * b (Dekker's TwoProduct), i.e. a * b = p + error
+    """
+    a_high, a_low = _split(a)
+    b_high, b_low = _split(b)
+    error = ((a_high * b_high - p) + a_high * b_low + a_low * b_high) + a_low * b_low
+    may_underflow = (np.abs(p) < _PRODUCT_UNDERFLOW) & (a != 0) & (b != 0)
+
+    return np.where(may_underflow, np.nan, error)
+
+
+def _round(x: np.ndarray, error: np.ndarray, direction: float) -> np.ndarray:
+    # Move one ulp in the given direction unless the operation is known to be exact or already rounded that way;
+    # a NaN error (overflow in the error-free transformation) is treated as inexact
+    is_rounded_correctly = (error == 0) | ((error < 0) if direction > 0 else (error > 0))
+    return np.where(is_rounded_correctly, x, np.nextafter(x, direction))
+
+
+def add_down(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    s = a + b
+    return _round(s, _sum_error(a, b, s), -np.inf)
+
+
+def add_up(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    s = a + b
+    return _round(s, _sum_error(a, b, s), np.inf)
+
+
+def mul_down(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    p = a * b
+    return _round(p, _product_error(a, b, p), -np.inf)
+
+
+def mul_up(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    p = a * b
+    return _round(p, _product_error(a, b, p), np.inf)
+
+
+def interval_add(a_lower: np.ndarray, a_upper: np.ndarray, b_lower: np.ndarray, b_upper: np.ndarray) -> IntervalArray:
+    return add_down(a_lower, b_lower), add_up(a_upper, b_upper)
+
+
+def interval_neg(lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+    return -upper, -lower
+
+
+def interval_mul(a_lower: np.ndarray, a_upper: np.ndarray, b_lower: np.ndarray, b_upper: np.ndarray) -> IntervalArray:
+    with np.errstate(invalid="ignore", over="ignore"):
+        lower = np.minimum(
+            np.minimum(mul_down(a_lower, b_lower), mul_down(a_lower, b_upper)),
+            np.minimum(mul_down(a_upper, b_lower), mul_down(a_upper, b_upper))
+        )
+        upper = np.maximum(
+            np.maximum(mul_up(a_lower, b_lower), mul_up(a_lower, b_upper)),
+            np.maximum(mul_up(a_upper, b_lower), mul_up(a_upper, b_upper))
+        )
+
+    return lower, upper
+
+
+def interval_scale(lower: np.ndarray, upper: np.ndarray, k: np.ndarray) -> IntervalArray:
+    """
+    Multiply intervals by exact scalars (e.g. integer exponents), rounding outwards
+    :param lower: lower bounds of the intervals
+    :param upper: upper bounds of the intervals
+    :param k: scalars, broadcastable against the bounds
+    :return: lower and upper bounds of the scaled intervals
+    """
+    k = np.broadcast_to(k, np.broadcast(lower, k).shape)
+    with np.errstate(invalid="ignore", over="ignore"):
+        scaled_lower = np.where(k >= 0, mul_down(lower, k), mul_down(upper, k))
+        scaled_upper = np.where(k >= 0, mul_up(upper, k), mul_up(lower, k))
+
+    return scaled_lower, scaled_upper
+
+
+def interval_reciprocal(lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+    contains_zero = (lower <= 0) & (upper >= 0)
+    with np.errstate(divide="ignore"):
+        reciprocal_lower = np.nextafter(1 / upper, -np.inf)
+        reciprocal_upper = np.nextafter(1 / lower, np.inf)
+
+    return np.where(contains_zero, -np.inf, reciprocal_lower), np.where(contains_zero, np.inf, reciprocal_upper)
+
+
+def interval_sum_rows(lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+    """
+    Sum the rows of (M, N) interval arrays with directed rounding, adding pairs of rows in log2(M) vectorised passes
+    :param lower: lower bounds, one row per summand
+    :param upper: upper bounds, one row per summand
+    :return: lower and upper bounds of the sums, of shape (N,)
+    """
+    if len(lower) == 0:
+        return np.zeros(lower.shape[1:]), np.zeros(upper.shape[1:])
+
+    while len(lower) > 1:
+        if len(lower) % 2 == 1:
+            lower = np.vstack([lower, np.zeros_like(lower[:1])])
+            upper = np.vstack([upper, np.zeros_like(upper[:1])])
+        lower = add_down(lower[0::2], lower[1::2])
+        upper = add_up(upper[0::2], upper[1::2])
+
+    return lower[0], upper[0]
+
+
+def _power_of_nonnegative(x: np.ndarray, k: int, multiply: Callable) -> np.ndarray:
+    result = np.ones_like(x)
+    base = x
+    while k > 0:
+        if k & 1:
+            result = multiply(result, base)
+        k >>= 1
+        if k:
+            base = multiply(base, base)
+
+    return result
+
+
+def interval_power(lower: np.ndarray, upper: np.ndarray, k: int) -> IntervalArray:
+    """
+    Enclosure of [lower, upper]**k for a non-negative integer k, tight for intervals containing zero
+    :param lower: lower bounds of the intervals
+    :param upper: upper bounds of the intervals
+    :param k: exponent
+    :return: lower and upper bounds of the powers
+    """
+    if k == 0:
+        return np.ones_like(lower), np.ones_like(upper)
+    if k == 1:
+        return lower, upper
+
+    lower_magnitude = np.abs(lower)
+    upper_magnitude = np.abs(upper)
+    with np.errstate(invalid="ignore", over="ignore"):
+        if k % 2 == 1:
+            # x**k is monotone; |x|**k is rounded up for negative lower bounds and down otherwise
+            power_lower = np.where(
+                lower >= 0,
+                _power_of_nonnegative(lower_magnitude, k, mul_down),
+                -_power_of_nonnegative(lower_magnitude, k, mul_up)
+            )
+            power_upper = np.where(
+                upper >= 0,
+                _power_of_nonnegative(upper_magnitude, k, mul_up),
+                -_power_of_nonnegative(upper_magnitude, k, mul_down)
+            )
+            return power_lower, power_upper
+
+        smallest_magnitude = np.where(lower > 0, lower_magnitude, np.where(upper < 0, upper_magnitude, 0.0))
+        largest_magnitude = np.maximum(lower_magnitude, upper_magnitude)
+
+        return (
+            _power_of_nonnegative(smallest_magnitude, k, mul_down),
+            _power_of_nonnegative(largest_magnitude, k, mul_up)
+        )
+
+
+def interval_sum_grouped(
+    lower: np.ndarray, upper: np.ndarray, groups: np.ndarray, n_groups: int
+) -> IntervalArray:
+    """
+    Sum intervals that share a group index with directed rounding. The k-th member of every group is added in the
+    k-th vectorised pass, so the number of passes is the size of the largest group.
+    :param lower: lower bounds of the intervals
+    :param upper: upper bounds of the intervals
+    :param groups: group index of every interval
+    :param n_groups: number of groups
+    :return: lower and upper bounds of the sum of every group
+    """
+    order = np.argsort(groups, kind="stable")
+    sorted_groups = groups[order]
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    position = np.arange(len(groups)) - starts[sorted_groups]
+
+    sum_lower = np.zeros(n_groups)
+    sum_upper = np.zeros(n_groups)
+    for k in range(int(counts.max(initial=0))):
+        members = order[position == k]
+        members_groups = groups[members]
+        sum_lower[members_groups] = add_down(sum_lower[members_groups], lower[members])
+        sum_upper[members_groups] = add_up(sum_upper[members_groups], upper[members])
+
+    return sum_lower, sum_upper
+
+
+def interval_sum_axis(lower: np.ndarray, upper: np.ndarray, axis: int) -> IntervalArray:
+    """
+    Sum intervals along one axis with directed rounding, e.g. to finish an interval matrix product
+    :param lower: lower bounds
+    :param upper: upper bounds
+    :param axis: axis to sum over
+    :return: lower and upper bounds of the sums
+    """
+    lower = np.moveaxis(lower, axis, 0)
+    upper = np.moveaxis(upper, axis, 0)
+    sum_lower = lower[0]
+    sum_upper = upper[0]
+    for k in range(1, len(lower)):
+        sum_lower = add_down(sum_lower, lower[k])
+        sum_upper = add_up(sum_upper, upper[k])
+
+    return sum_lower, sum_upper
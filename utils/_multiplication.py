@@ -0,0 +1,142 @@
+from heapq import heapify
+from heapq import heappop
+from heapq import heapreplace
+from typing import List
+from typing import Tuple
+
+from utils._coordinate import intern_powers
+from utils._term_store import pad_powers
+from utils._term_store import prune_zero_terms
+from utils._term_store import Terms
+
+# The dense algorithm is used when the Kronecker array has at most this many slots per product of terms
+DENSITY_THRESHOLD = 4
+
+
+class _KroneckerPacking:
+    """
+    Kronecker substitution of the exponents of a product: an exponent tuple is packed into one integer with a
+    mixed-radix encoding, chosen so that packed(p) + packed(q) == packed(p + q) for every product of two terms.
+    """
+    a_offsets: List[int]
+    b_offsets: List[int]
+    strides: List[int]
+    size: int
+
+    def __init__(self, a: List[Tuple[int, ...]], b: List[Tuple[int, ...]], n_variables: int) -> None:
+        a_min = [min(p[v] for p in a) for v in range(n_variables)]
+        b_min = [min(p[v] for p in b) for v in range(n_variables)]
+        a_range = [max(p[v] for p in a) - a_min[v] for v in range(n_variables)]
+        b_range = [max(p[v] for p in b) - b_min[v] for v in range(n_variables)]
+
+        self.a_offsets = a_min
+        self.b_offsets = b_min
+        self.strides = []
+        size = 1
+        for v in range(n_variables):
+            self.strides.append(size)
+            size *= a_range[v] + b_range[v] + 1
+        self.size = size
+
+    def pack_a(self, powers: Tuple[int, ...]) -> int:
+        return sum((e - o) * s for e, o, s in zip(powers, self.a_offsets, self.strides))
+
+    def pack_b(self, powers: Tuple[int, ...]) -> int:
+        return sum((e - o) * s for e, o, s in zip(powers, self.b_offsets, self.strides))
+
+    def unpack(self, key: int) -> Tuple[int, ...]:
+        powers = []
+        for v in reversed(range(len(self.strides))):
+            e, key = divmod(key, self.strides[v])
+            powers.append(e + self.a_offsets[v] + self.b_offsets[v])
+
+        return tuple(reversed(powers))
+
+
+def _multiply_dense(a: List[Tuple[int, object]], b: List[Tuple[int, object]], size: int) -> List[Tuple[int, object]]:
+    slots = [None] * size
+    for key_x, c_x in a:
+        for key_y, c_y in b:
+            key = key_x + key_y
+            existing = slots[key]
+            product = c_x * c_y
+            slots[key] = product if existing is None else existing + product
+
+    return [(key, c) for key, c in enumerate(slots) if c is not None]
+
+
+def _multiply_sparse(a: List[Tuple[int, object]], b: List[Tuple[int, object]]) -> List[Tuple[int, object]]:
+    """
+    Johnson's heap-based multiplication: the products are generated in increasing order of their packed exponent
+    from a heap holding one candidate per term of a, so like terms arrive consecutively and are merged immediately
+    """
+    a = sorted(a, key=lambda x: x[0])
+    b = sorted(b, key=lambda x: x[0])
+    heap = [(key_x + b[0][0], i, 0) for i, (key_x, _) in enumerate(a)]
+    heapify(heap)
+
+    result = []
+    while heap:
+        key, i, j = heap[0]
+        product = a[i][1] * b[j][1]
+        if result and result[-1][0] == key:
+            result[-1] = (key, result[-1][1] + product)
+        else:
+            result.append((key, product))
+
+        if j + 1 < len(b):
+            heapreplace(heap, (a[i][0] + b[j + 1][0], i, j + 1))
+        else:
+            heappop(heap)
+
+    return result
+
+
+def multiply_terms(terms: Terms, other: Terms, n_variables: int) -> Terms:
+    """
+    Multiply two term stores, merging like terms as they are produced. Exponents are Kronecker-packed into integers;
+    the product is accumulated in a dense array indexed by packed exponent when that array is small compared to the
+    number of term products, and with a heap-based sparse merge otherwise.
+    :param terms: first factor
+    :param other: second factor
+    :param n_variables: number of variables of the product
+    :return: term store of the product
+    """
+    if not terms or not other:
+        return {}
+
+    a_powers = [pad_powers(powers, n_variables) for powers in terms]
+    b_powers = [pad_powers(powers, n_variables) for powers in other]
+    packing = _KroneckerPacking(a_powers, b_powers, n_variables)
+    a = [(packing.pack_a(powers), c) for powers, c in zip(a_powers, terms.values())]
+    b = [(packing.pack_b(powers), c) for powers, c in zip(b_powers, other.values())]
+
+    if packing.size <= DENSITY_THRESHOLD * len(a) * len(b):
+        packed_result = _multiply_dense(a, b, packing.size)
+    else:
+        # The heap holds one entry per term of its first argument, so keep it on the shorter factor
+        packed_result = _multiply_sparse(a, b) if len(a) <= len(b) else _multiply_sparse(b, a)
+
+    return prune_zero_terms({intern_powers(packing.unpack(key)): c for key, c in packed_result})
+
+
+def power_terms(terms: Terms, k: int, n_variables: int) -> Terms:
+    """
+    Raise a term store to a positive integer power by repeated squaring, merging like terms after every product
+    :param terms: base
+    :param k: exponent, at least 1
+    :param n_variables: number of variables of the base
+    :return: term store of the power
+    """
+    assert k >= 1, "Exponent must be a positive integer"
+
+    result = None
+    base = terms
+    while k > 0:
+        if k & 1:
+            result = base if result is None else multiply_terms(result, base, n_variables)
+        k >>= 1
+        if k:
+            base = multiply_terms(base, base, n_variables)
+
+    return result
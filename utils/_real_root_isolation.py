@@ -0,0 +1,158 @@
+from fractions import Fraction
+from typing import List
+from typing import Tuple
+
+# Univariate polynomial with exact rational coefficients in increasing order of degree
+Polynomial = List[Fraction]
+
+
+def _trim(p: Polynomial) -> Polynomial:
+    p = list(p)
+    while p and p[-1] == 0:
+        p.pop()
+
+    return p
+
+
+def evaluate(p: Polynomial, x: Fraction) -> Fraction:
+    result = Fraction(0)
+    for c in reversed(p):
+        result = result * x + c
+
+    return result
+
+
+def derivative(p: Polynomial) -> Polynomial:
+    return _trim([k * c for k, c in enumerate(p)][1:])
+
+
+def _divide(p: Polynomial, q: Polynomial) -> Tuple[Polynomial, Polynomial]:
+    remainder = list(p)
+    quotient = [Fraction(0)] * max(len(p) - len(q) + 1, 0)
+    for k in reversed(range(len(quotient))):
+        factor = remainder[k + len(q) - 1] / q[-1]
+        quotient[k] = factor
+        for i, c in enumerate(q):
+            remainder[k + i] -= factor * c
+
+    return _trim(quotient), _trim(remainder[:len(q) - 1])
+
+
+def square_free_part(p: Polynomial) -> Polynomial:
+    """
+    p / gcd(p, p'), which has the same real roots as p but all of them simple
+    :param p: polynomial that is not zero
+    :return: square-free part of p, [1] if p is constant
+    """
+    assert _trim(p), "The zero polynomial has no square-free part"
+
+    a, b = _trim(p), derivative(p)
+    while b:
+        a, b = b, _divide(a, b)[1]
+
+    result = _divide(p, a)[0]
+
+    return [c / result[-1] for c in result]
+
+
+def _taylor_shift(p: Polynomial, a: Fraction) -> Polynomial:
+    """
+    Coefficients of p(x + a), by repeated synthetic division
+    """
+    p = list(p)
+    for i in range(len(p)):
+        for k in reversed(range(i, len(p) - 1)):
+            p[k] += a * p[k + 1]
+
+    return p
+
+
+def _count_sign_variations(p: Polynomial) -> int:
+    signs = [c > 0 for c in p if c != 0]
+
+    return sum(1 for x, y in zip(signs, signs[1:]) if x != y)
+
+
+def _descartes_bound(p: Polynomial, a: Fraction, b: Fraction) -> int:
+    """
+    Descartes' rule of signs on (a, b): the number of sign variations of (1 + t)^d p((a + b t) / (1 + t)) is an upper
+    bound on the number of roots of p in (a, b) and has the same parity; it is exact when it is 0 or 1
+    """
+    r = _taylor_shift(p, a)
+    width = b - a
+    r = [c * width ** k for k, c in enumerate(r)]
+
+    return _count_sign_variations(_taylor_shift(list(reversed(r)), Fraction(1)))
+
+
+def cauchy_bound(p: Polynomial) -> Fraction:
+    """
+    :param p: non-constant polynomial
+    :return: B such that every real root of p lies in the open interval (-B, B)
+    """
+    return 1 + max(abs(c / p[-1]) for c in p[:-1])
+
+
+def _isolate_exact_root(p: Polynomial, root: Fraction, a: Fraction, b: Fraction) -> Fraction:
+    h = min(root - a, b - root) / 2
+    while evaluate(p, root - h) == 0 or evaluate(p, root + h) == 0 or _descartes_bound(p, root - h, root + h) != 1:
+        h /= 2
+
+    return h
+
+
+def isolate_real_roots(p: Polynomial, a: Fraction, b: Fraction) -> List[Tuple[Fraction, Fraction]]:
+    """
+    Vincent-Collins-Akritas bisection: split (a, b) until Descartes' rule of signs proves that every part has no or
+    exactly one root
+    :param p: square-free polynomial, not zero
+    :param a: lower bound of the interval, not a root of p
+    :param b: upper bound of the interval, not a root of p
+    :return: disjoint intervals (l, u) in increasing order, with endpoints that are not roots, each containing exactly
+        one root of p
+    """
+    assert _trim(p), "Every number is a root of the zero polynomial"
+
+    isolating_intervals = []
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        n_roots = _descartes_bound(p, a, b)
+        if n_roots == 0:
+            continue
+        if n_roots == 1:
+            isolating_intervals.append((a, b))
+            continue
+
+        middle = (a + b) / 2
+        if evaluate(p, middle) == 0:
+            h = _isolate_exact_root(p, middle, a, b)
+            isolating_intervals.append((middle - h, middle + h))
+            stack.extend([(a, middle - h), (middle + h, b)])
+        else:
+            stack.extend([(a, middle), (middle, b)])
+
+    return sorted(isolating_intervals)
+
+
+def refine_root(p: Polynomial, a: Fraction, b: Fraction, tolerance: Fraction) -> Tuple[Fraction, Fraction]:
+    """
+    Bisect an isolating interval of a simple root until it is at most tolerance wide
+    :param p: square-free polynomial
+    :param a: lower bound of the isolating interval
+    :param b: upper bound of the isolating interval
+    :param tolerance: maximum width of the result
+    :return: interval containing the root, (r, r) if the root r was hit exactly
+    """
+    is_positive_at_a = evaluate(p, a) > 0
+    while b - a > tolerance:
+        middle = (a + b) / 2
+        value = evaluate(p, middle)
+        if value == 0:
+            return middle, middle
+        if (value > 0) == is_positive_at_a:
+            a = middle
+        else:
+            b = middle
+
+    return a, b
@@ -0,0 +1,127 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from pyariadne import definitely
+from pyariadne import dp
+from pyariadne import FloatDP
+from pyariadne import FloatDPBounds
+
+from utils._coordinate import Coordinate
+from utils._coordinate import intern_powers
+
+Terms = Dict[Tuple[int, ...], FloatDPBounds]
+
+ZERO = FloatDP(0, dp)
+
+
+def pad_powers(powers: Tuple[int, ...], n_variables: int) -> Tuple[int, ...]:
+    if len(powers) >= n_variables:
+        return intern_powers(powers)
+    return intern_powers(powers + (0,) * (n_variables - len(powers)))
+
+
+def merge_term(terms: Terms, powers: Tuple[int, ...], coefficient: FloatDPBounds) -> None:
+    """
+    Insert a single term into the store, adding it to the coefficient of a like term if there is one
+    :param terms: term store to update in place
+    :param powers: exponent tuple of the term
+    :param coefficient: coefficient of the term
+    """
+    existing = terms.get(powers)
+    terms[powers] = coefficient if existing is None else existing + coefficient
+
+
+def prune_zero_terms(terms: Terms) -> Terms:
+    """
+    Drop the terms whose coefficient is exactly zero. The zero polynomial becomes the empty store, so its number of
+    variables has to be kept by the owner of the store, see terms_to_coordinates.
+    :param terms: term store
+    :return: term store without zero terms
+    """
+    zero = FloatDPBounds(ZERO)
+    return {powers: c for powers, c in terms.items() if not definitely(c == zero)}
+
+
+def terms_from_coordinates(coordinates: List[Coordinate], n_variables: int) -> Terms:
+    terms = {}
+    for x in coordinates:
+        merge_term(terms, pad_powers(x.powers, n_variables), x.coefficient)
+
+    return terms
+
+
+def terms_to_coordinates(terms: Terms, n_variables: int) -> List[Coordinate]:
+    if not terms:
+        # A single zero term keeps the number of variables of the zero polynomial, e.g. for MultivariatePolynomial
+        return [Coordinate(coefficient=FloatDPBounds(ZERO), powers=(0,) * n_variables)]
+    return [Coordinate(coefficient=c, powers=powers) for powers, c in terms.items()]
+
+
+def negate_terms(terms: Terms) -> Terms:
+    return {powers: -c for powers, c in terms.items()}
+
+
+def scale_terms(terms: Terms, scalar: Any) -> Terms:
+    return prune_zero_terms({powers: c * scalar for powers, c in terms.items()})
+
+
+def add_terms(terms: Terms, other: Terms, n_variables: int) -> Terms:
+    result = {pad_powers(powers, n_variables): c for powers, c in terms.items()}
+    for powers, c in other.items():
+        merge_term(result, pad_powers(powers, n_variables), c)
+
+    return prune_zero_terms(result)
+
+
+def differentiate_terms(terms: Terms, n: int) -> Terms:
+    result = {}
+    for powers, c in terms.items():
+        e = powers[n]
+        if e != 0:
+            result[intern_powers(powers[:n] + (e - 1,) + powers[n+1:])] = c * e
+
+    return result
+
+
+def gradient_terms(terms: Terms, n_variables: int) -> List[Terms]:
+    """
+    All first partial derivatives of a term store, computed in a single pass over its terms
+    :param terms: term store to differentiate
+    :param n_variables: number of variables
+    :return: term store of the derivative with respect to every variable
+    """
+    result = [{} for _ in range(n_variables)]
+    for powers, c in terms.items():
+        for n, e in enumerate(powers):
+            if e != 0:
+                result[n][intern_powers(powers[:n] + (e - 1,) + powers[n+1:])] = c * e
+
+    return result
+
+
+def hessian_terms(terms: Terms, n_variables: int) -> List[List[Terms]]:
+    """
+    All second partial derivatives of a term store, computed in a single pass over its terms. The matrix is
+    symmetric and the entries below the diagonal are the same objects as the ones above it.
+    :param terms: term store to differentiate
+    :param n_variables: number of variables
+    :return: term store of the derivative with respect to variables i and j at position [i][j]
+    """
+    upper = {(i, j): {} for i in range(n_variables) for j in range(i, n_variables)}
+    for powers, c in terms.items():
+        for i in range(n_variables):
+            e_i = powers[i]
+            if e_i == 0:
+                continue
+            for j in range(i, n_variables):
+                e_j = powers[j] - 1 if i == j else powers[j]
+                if e_j == 0:
+                    continue
+                second_powers = list(powers)
+                second_powers[i] -= 1
+                second_powers[j] -= 1
+                upper[(i, j)][intern_powers(tuple(second_powers))] = c * (e_i * e_j)
+
+    return [[upper[(min(i, j), max(i, j))] for j in range(n_variables)] for i in range(n_variables)]
@@ -0,0 +1,63 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Sequence
+from typing import Tuple
+
+from pyariadne import ValidatedVectorMultivariateFunction
+
+from utils.polynomial_function import PolynomialFunction
+
+
+class GradientSystem:
+    """
+    Gradient, diagonal of the Hessian and the candidate component functions of the gradient system of a polynomial.
+    Every variable has at most two component functions: its partial derivative and, for unbounded domains, the
+    reciprocal trick of it. The vector functions built from them are shared by all subproblems with the same choice.
+    """
+    gradient: List[PolynomialFunction]
+    hessian_diagonal: List[PolynomialFunction]
+    functions_per_variable: Dict[int, List[PolynomialFunction]]
+    _vector_functions: Dict[Tuple[bool, ...], ValidatedVectorMultivariateFunction]
+
+    def __init__(
+        self,
+        gradient: List[PolynomialFunction],
+        hessian_diagonal: List[PolynomialFunction],
+        functions_per_variable: Dict[int, List[PolynomialFunction]]
+    ) -> None:
+        self.gradient = gradient
+        self.hessian_diagonal = hessian_diagonal
+        self.functions_per_variable = functions_per_variable
+        self._vector_functions = {}
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # The cached vector functions are pyariadne objects and are rebuilt on demand after unpickling
+        return GradientSystem, (self.gradient, self.hessian_diagonal, self.functions_per_variable)
+
+    def build_representations(self) -> None:
+        """
+        Build the arrays and factored functions of the components and the arrays of the Hessian diagonal, which the
+        exclusion, the solvers and the selection evaluate, up front instead of on first use
+        """
+        for functions in self.functions_per_variable.values():
+            for x in functions:
+                x.prepare(array=True, factored_function=True)
+        for x in self.hessian_diagonal:
+            x.prepare(array=True)
+
+    def component(self, n: int, need_to_convert: bool) -> PolynomialFunction:
+        return self.functions_per_variable[n][1 if need_to_convert else 0]
+
+    def components(self, is_conversion_needed_per_dimension: Sequence[bool]) -> List[PolynomialFunction]:
+        return [self.component(n, x) for n, x in enumerate(is_conversion_needed_per_dimension)]
+
+    def vector_function(
+        self, is_conversion_needed_per_dimension: Sequence[bool]
+    ) -> ValidatedVectorMultivariateFunction:
+        key = tuple(is_conversion_needed_per_dimension)
+        if key not in self._vector_functions:
+            functions = [x.factored_function for x in self.components(key)]
+            self._vector_functions[key] = ValidatedVectorMultivariateFunction(functions)
+
+        return self._vector_functions[key]
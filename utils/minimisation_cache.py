@@ -0,0 +1,157 @@
+import hashlib
+import json
+import sqlite3
+
+from collections import OrderedDict
+from contextlib import closing
+from contextlib import contextmanager
+from time import time
+from typing import Any
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+
+from pyariadne import FloatDPBoundsVector
+from pyariadne import FloatDPExactBox
+
+from utils._float_conversion import box_to_floats
+from utils._float_conversion import bounds_vector_to_floats
+from utils._float_conversion import floats_to_bounds_vector
+from utils._term_store import prune_zero_terms
+from utils.polynomial_array import PolynomialArray
+from utils.polynomial_function import PolynomialFunction
+
+# Minima as exact double bounds, which can be stored without loss
+StoredMinima = List[List[Tuple[float, float]]]
+
+
+def _encode(minima: StoredMinima) -> str:
+    return json.dumps([[[lower.hex(), upper.hex()] for lower, upper in x] for x in minima])
+
+
+def _decode(value: str) -> StoredMinima:
+    return [[(float.fromhex(lower), float.fromhex(upper)) for lower, upper in x] for x in json.loads(value)]
+
+
+@contextmanager
+def _connect(path: str) -> Iterator[sqlite3.Connection]:
+    """
+    Connection that commits when the block succeeds and rolls back when it raises, and is closed in both cases, which
+    the context of sqlite3.connect does not do
+    """
+    with closing(sqlite3.connect(path)) as connection, connection:
+        yield connection
+
+
+class MinimisationCache:
+    """
+    Cache of the minima of a PolynomialOptimiser, keyed by a hash of the merged terms of the objective, the domain and
+    the settings of the optimiser. Entries live in an in-memory LRU tier and, if a path is given, in an sqlite file
+    that is shared between processes and runs. The disk tier evicts its least recently used entries when it grows
+    beyond max_disk_bytes. The minima are stored as exact double bounds, so a hit returns the same enclosures.
+    """
+    max_entries: int
+    path: Optional[str]
+    max_disk_bytes: int
+    _memory: "OrderedDict[str, StoredMinima]"
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None, max_disk_bytes: int = 64 * 2 ** 20) -> None:
+        """
+        :param max_entries: number of entries kept in memory
+        :param path: sqlite file of the disk tier, no disk tier if None
+        :param max_disk_bytes: size of the stored minima above which the disk tier evicts entries
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        if path is not None:
+            with _connect(path) as connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS minima "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+                )
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    @staticmethod
+    def key(f: PolynomialFunction, D: Optional[FloatDPExactBox], configuration: Sequence[Any]) -> str:
+        """
+        Canonical hash of a minimisation problem: the terms are merged, stripped of zero coefficients and sorted by
+        exponent and all bounds are written in hexadecimal, so equal problems get the same key however their terms
+        were built
+        :param f: objective function
+        :param D: domain, the whole space if None
+        :param configuration: settings of the optimiser that change its result
+        :return: hexadecimal sha256 digest
+        """
+        array = PolynomialArray.from_terms(n_variables=f.n_variables, terms=prune_zero_terms(f.array.to_terms()))
+        order = np.lexsort(array.exponents.T[::-1]) if array.n_terms else np.arange(0)
+        terms = [
+            [array.exponents[i].tolist(), float(array.lower[i]).hex(), float(array.upper[i]).hex()] for i in order
+        ]
+        domain = None if D is None else [[lower.hex(), upper.hex()] for lower, upper in box_to_floats(D)]
+        canonical = json.dumps([f.n_variables, terms, domain, list(configuration)])
+
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _remember(self, key: str, minima: StoredMinima) -> None:
+        self._memory[key] = minima
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[List[FloatDPBoundsVector]]:
+        """
+        :param key: key of the problem
+        :return: the cached minima, or None if the problem is not cached
+        """
+        minima = self._memory.get(key)
+        if minima is not None:
+            self._memory.move_to_end(key)
+        elif self.path is not None:
+            with _connect(self.path) as connection:
+                row = connection.execute("SELECT value FROM minima WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    connection.execute("UPDATE minima SET last_used = ? WHERE key = ?", (time(), key))
+                    minima = _decode(row[0])
+                    self._remember(key, minima)
+
+        if minima is None:
+            return None
+
+        return [floats_to_bounds_vector(x) for x in minima]
+
+    def put(self, key: str, minima: List[FloatDPBoundsVector]) -> None:
+        """
+        :param key: key of the problem
+        :param minima: minima to cache for it
+        """
+        stored = [bounds_vector_to_floats(x) for x in minima]
+        self._remember(key, stored)
+        if self.path is None:
+            return
+
+        value = _encode(stored)
+        with _connect(self.path) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO minima (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time())
+            )
+            total_size, = connection.execute("SELECT COALESCE(SUM(size), 0) FROM minima").fetchone()
+            for evicted_key, size in connection.execute("SELECT key, size FROM minima ORDER BY last_used").fetchall():
+                if total_size <= self.max_disk_bytes:
+                    break
+                connection.execute("DELETE FROM minima WHERE key = ?", (evicted_key,))
+                total_size -= size
+
+    def clear(self) -> None:
+        self._memory.clear()
+        if self.path is not None:
+            with _connect(self.path) as connection:
+                connection.execute("DELETE FROM minima")
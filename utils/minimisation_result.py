@@ -0,0 +1,44 @@
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from pyariadne import FloatDPBoundsVector
+
+from utils.gradient_system import GradientSystem
+from utils.polynomial_optimisation_problem import PolynomialOptimisationProblem
+
+
+class MinimisationResult:
+    """
+    Outcome of a time-budgeted minimisation: the best verified minimum among the boxes explored so far, whether the
+    search covered every box, and what is needed to resume the search later: the lazy stream of the boxes left to
+    explore, their number and the gradient system they are built from
+    """
+    minimum: Optional[FloatDPBoundsVector]
+    minima: List[FloatDPBoundsVector]
+    is_exhaustive: bool
+    unexplored: Iterator[PolynomialOptimisationProblem]
+    n_unexplored: int
+    system: GradientSystem
+
+    def __init__(
+        self,
+        minimum: Optional[FloatDPBoundsVector],
+        minima: List[FloatDPBoundsVector],
+        is_exhaustive: bool,
+        unexplored: Iterator[PolynomialOptimisationProblem],
+        n_unexplored: int,
+        system: GradientSystem
+    ) -> None:
+        self.minimum = minimum
+        self.minima = minima
+        self.is_exhaustive = is_exhaustive
+        self.unexplored = unexplored
+        self.n_unexplored = n_unexplored
+        self.system = system
+
+    def __repr__(self) -> str:
+        return (
+            f"MinimisationResult(minimum={self.minimum}, is_exhaustive={self.is_exhaustive}, "
+            f"n_unexplored={self.n_unexplored})"
+        )
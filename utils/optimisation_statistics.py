@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+# Called as hook(event, data) for every event recorded, e.g. to forward the metrics to telemetry. The events are
+# "box_solved" (seconds, n_roots), "solver_failure" (message), "second_derivative_rejections" (n),
+# "endpoint_checks" (n), "box_subdivided" (reason) and "timing" (name, seconds).
+Hook = Callable[[str, Dict[str, Any]], None]
+
+
+class OptimisationStatistics:
+    """
+    Counters, per-box records and timings of the last minimise/minimise_all call of a PolynomialOptimiser. The
+    timings are in seconds per phase: "create_subproblems", "exclusion", "solve", "selection" and "conversion" (from
+    the terms to the factored functions and arrays, and between pyariadne objects, doubles and reciprocal coordinates).
+    A phase timed within another one only counts towards its own timing.
+    """
+    n_subproblems: int
+    n_pruned_boxes: int
+    n_excluded_boxes: int
+    n_merged_minima: int
+    n_cache_hits: int
+    n_solver_failures: int
+    solver_failures: List[str]
+    n_second_derivative_rejections: int
+    n_endpoint_checks: int
+    n_subdivided_boxes: int
+    subdivision_reasons: List[str]
+    box_solve_seconds: List[float]
+    n_roots_per_box: List[int]
+    seconds: Dict[str, float]
+    _hooks: List[Hook]
+    _nested_seconds: List[float]
+
+    def __init__(self, hooks: Optional[List[Hook]] = None) -> None:
+        self.n_subproblems = 0
+        self.n_pruned_boxes = 0
+        self.n_excluded_boxes = 0
+        self.n_merged_minima = 0
+        self.n_cache_hits = 0
+        self.n_solver_failures = 0
+        self.solver_failures = []
+        self.n_second_derivative_rejections = 0
+        self.n_endpoint_checks = 0
+        self.n_subdivided_boxes = 0
+        self.subdivision_reasons = []
+        self.box_solve_seconds = []
+        self.n_roots_per_box = []
+        self.seconds = {}
+        self._hooks = [] if hooks is None else list(hooks)
+        self._nested_seconds = []
+
+    def __repr__(self) -> str:
+        counters = ", ".join(
+            f"{name}={len(value) if isinstance(value, list) else value}"
+            for name, value in vars(self).items() if not name.startswith("_")
+        )
+        return f"OptimisationStatistics({counters})"
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Hooks may not be picklable and only run in the process that owns them
+        state = dict(vars(self))
+        state["_hooks"] = []
+        return state
+
+    def _emit(self, event: str, **data: Any) -> None:
+        for hook in self._hooks:
+            hook(event, data)
+
+    def record_box(self, seconds: float, n_roots: int) -> None:
+        self.box_solve_seconds.append(seconds)
+        self.n_roots_per_box.append(n_roots)
+        self._emit("box_solved", seconds=seconds, n_roots=n_roots)
+
+    def record_solver_failure(self, message: str) -> None:
+        self.n_solver_failures += 1
+        self.solver_failures.append(message)
+        self._emit("solver_failure", message=message)
+
+    def record_second_derivative_rejections(self, n: int) -> None:
+        self.n_second_derivative_rejections += n
+        self._emit("second_derivative_rejections", n=n)
+
+    def record_endpoint_checks(self, n: int) -> None:
+        self.n_endpoint_checks += n
+        self._emit("endpoint_checks", n=n)
+
+    def record_subdivision(self, reason: str) -> None:
+        self.n_subdivided_boxes += 1
+        self.subdivision_reasons.append(reason)
+        self._emit("box_subdivided", reason=reason)
+
+    def record_time(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self._emit("timing", name=name, seconds=seconds)
+
+    @contextmanager
+    def timing(self, name: str) -> Iterator[None]:
+        """
+        Add the time spent in the block to the timing called name, except for the time spent in the timing blocks
+        nested in it
+        """
+        start = perf_counter()
+        self._nested_seconds.append(0.0)
+        try:
+            yield
+        finally:
+            seconds = perf_counter() - start
+            nested_seconds = self._nested_seconds.pop()
+            if self._nested_seconds:
+                self._nested_seconds[-1] += seconds
+            self.record_time(name, seconds - nested_seconds)
+
+    def merge(self, other: "OptimisationStatistics") -> None:
+        """
+        Add the records of another instance, e.g. of a worker process, replaying them through the hooks
+        :param other: statistics to add
+        """
+        for seconds, n_roots in zip(other.box_solve_seconds, other.n_roots_per_box):
+            self.record_box(seconds=seconds, n_roots=n_roots)
+        for message in other.solver_failures:
+            self.record_solver_failure(message=message)
+        if other.n_second_derivative_rejections:
+            self.record_second_derivative_rejections(n=other.n_second_derivative_rejections)
+        if other.n_endpoint_checks:
+            self.record_endpoint_checks(n=other.n_endpoint_checks)
+        for reason in other.subdivision_reasons:
+            self.record_subdivision(reason=reason)
+        for name, seconds in other.seconds.items():
+            self.record_time(name=name, seconds=seconds)
@@ -0,0 +1,172 @@
+from typing import Any
+from typing import List
+
+import numpy as np
+
+from pyariadne import MultivariatePolynomial
+
+from utils._convert_coordinates_to_polynomial import convert_coordinates_to_polynomial
+from utils._coordinate import Coordinate
+from utils._float_conversion import bounds_to_floats
+from utils._float_conversion import floats_to_bounds
+from utils._interval_array import IntervalArray
+from utils._interval_array import interval_mul
+from utils._interval_array import interval_power
+from utils._interval_array import interval_reciprocal
+from utils._interval_array import interval_scale
+from utils._interval_array import interval_sum_grouped
+from utils._interval_array import interval_sum_rows
+from utils._term_store import pad_powers
+from utils._term_store import Terms
+from utils._term_store import terms_from_coordinates
+from utils._term_store import terms_to_coordinates
+
+_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE = f"Operation not possible for objects of type PolynomialArray and "
+
+
+class PolynomialArray:
+    """
+    Polynomial stored as an integer exponent matrix with one row per term and the lower and upper bounds of the
+    interval coefficients as float arrays. Arithmetic is vectorised and rounds outwards, so the coefficients stay
+    rigorous enclosures of the coefficients of the exact result.
+    """
+    n_variables: int
+    exponents: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+
+    def __init__(self, n_variables: int, exponents: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> None:
+        assert exponents.shape == (len(lower), n_variables), "Exponent matrix does not match the coefficients"
+        self.n_variables = n_variables
+        self.exponents = exponents
+        self.lower = lower
+        self.upper = upper
+
+    def __repr__(self) -> str:
+        return f"PolynomialArray(n_variables={self.n_variables}, n_terms={self.n_terms})"
+
+    @staticmethod
+    def _merged(n_variables: int, exponents: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> "PolynomialArray":
+        if len(lower) == 0:
+            return PolynomialArray(n_variables, exponents.reshape(0, n_variables), lower, upper)
+
+        unique_exponents, groups = np.unique(exponents, axis=0, return_inverse=True)
+        groups = groups.reshape(-1)
+        merged_lower, merged_upper = interval_sum_grouped(lower, upper, groups, len(unique_exponents))
+
+        non_zero = (merged_lower != 0) | (merged_upper != 0)
+        return PolynomialArray(n_variables, unique_exponents[non_zero], merged_lower[non_zero], merged_upper[non_zero])
+
+    def _padded_exponents(self, n_variables: int) -> np.ndarray:
+        padding = np.zeros((self.n_terms, n_variables - self.n_variables), dtype=self.exponents.dtype)
+        return np.hstack([self.exponents, padding])
+
+    def __neg__(self) -> "PolynomialArray":
+        return PolynomialArray(self.n_variables, self.exponents, -self.upper, -self.lower)
+
+    def __add__(self, other: Any) -> "PolynomialArray":
+        if not isinstance(other, PolynomialArray):
+            raise Exception(_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE, type(other))
+
+        n_variables = max(self.n_variables, other.n_variables)
+        exponents = np.vstack([self._padded_exponents(n_variables), other._padded_exponents(n_variables)])
+        lower = np.concatenate([self.lower, other.lower])
+        upper = np.concatenate([self.upper, other.upper])
+
+        return PolynomialArray._merged(n_variables, exponents, lower, upper)
+
+    def __sub__(self, other: Any) -> "PolynomialArray":
+        return self.__add__(other=-other)
+
+    def __mul__(self, other: Any) -> "PolynomialArray":
+        if not isinstance(other, PolynomialArray):
+            raise Exception(_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE, type(other))
+
+        n_variables = max(self.n_variables, other.n_variables)
+        self_exponents = self._padded_exponents(n_variables)
+        other_exponents = other._padded_exponents(n_variables)
+        exponents = (self_exponents[:, None, :] + other_exponents[None, :, :]).reshape(-1, n_variables)
+        lower, upper = interval_mul(
+            self.lower[:, None], self.upper[:, None], other.lower[None, :], other.upper[None, :]
+        )
+
+        return PolynomialArray._merged(n_variables, exponents, lower.reshape(-1), upper.reshape(-1))
+
+    def derivative(self, n: int) -> "PolynomialArray":
+        assert n < self.n_variables, f"{n}th variable does not exist, there are at most {self.n_variables} variables"
+
+        powers = self.exponents[:, n]
+        keep = powers != 0
+        exponents = self.exponents[keep].copy()
+        exponents[:, n] -= 1
+        lower, upper = interval_scale(self.lower[keep], self.upper[keep], powers[keep].astype(float))
+
+        return PolynomialArray(self.n_variables, exponents, lower, upper)
+
+    def evaluate_many(self, lower: np.ndarray, upper: np.ndarray) -> IntervalArray:
+        """
+        Evaluate the polynomial over N interval vectors in one vectorised pass, rounding outwards
+        :param lower: lower bounds of the points, of shape (N, n_variables)
+        :param upper: upper bounds of the points, of shape (N, n_variables)
+        :return: lower and upper bounds of the enclosures of the values, both of shape (N,)
+        """
+        n_points = len(lower)
+        assert lower.shape == upper.shape == (n_points, self.n_variables), "Points do not match the polynomial"
+
+        term_lower = np.repeat(self.lower[:, None], n_points, axis=1)
+        term_upper = np.repeat(self.upper[:, None], n_points, axis=1)
+        for n in range(self.n_variables):
+            distinct_powers, power_index = np.unique(self.exponents[:, n], return_inverse=True)
+            # The zero polynomial has no terms and evaluates to zero
+            if len(distinct_powers) == 0 or (len(distinct_powers) == 1 and distinct_powers[0] == 0):
+                continue
+
+            x_lower = lower[:, n]
+            x_upper = upper[:, n]
+            if distinct_powers[0] < 0:
+                reciprocal_lower, reciprocal_upper = interval_reciprocal(x_lower, x_upper)
+            powers_lower = []
+            powers_upper = []
+            for k in distinct_powers:
+                if k < 0:
+                    power_lower, power_upper = interval_power(reciprocal_lower, reciprocal_upper, -int(k))
+                else:
+                    power_lower, power_upper = interval_power(x_lower, x_upper, int(k))
+                powers_lower.append(power_lower)
+                powers_upper.append(power_upper)
+
+            power_index = power_index.reshape(-1)
+            term_lower, term_upper = interval_mul(
+                term_lower, term_upper, np.array(powers_lower)[power_index], np.array(powers_upper)[power_index]
+            )
+
+        return interval_sum_rows(term_lower, term_upper)
+
+    @property
+    def n_terms(self) -> int:
+        return len(self.lower)
+
+    @staticmethod
+    def from_terms(n_variables: int, terms: Terms) -> "PolynomialArray":
+        exponents = np.array(
+            [pad_powers(powers, n_variables) for powers in terms], dtype=np.int64
+        ).reshape(len(terms), n_variables)
+        bounds = np.array([bounds_to_floats(c) for c in terms.values()], dtype=float).reshape(len(terms), 2)
+
+        return PolynomialArray(n_variables, exponents, bounds[:, 0].copy(), bounds[:, 1].copy())
+
+    def to_terms(self) -> Terms:
+        return {
+            tuple(int(e) for e in powers): floats_to_bounds(float(lower), float(upper))
+            for powers, lower, upper in zip(self.exponents, self.lower, self.upper)
+        }
+
+    @staticmethod
+    def from_coordinates(n_variables: int, coordinates: List[Coordinate]) -> "PolynomialArray":
+        return PolynomialArray.from_terms(n_variables, terms_from_coordinates(coordinates, n_variables))
+
+    def to_coordinates(self) -> List[Coordinate]:
+        return terms_to_coordinates(self.to_terms(), self.n_variables)
+
+    def to_polynomial(self) -> MultivariatePolynomial:
+        return convert_coordinates_to_polynomial(coordinates=self.to_coordinates())
@@ -1,10 +1,14 @@
 from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+import numpy as np
 
-from pyariadne import derivative
 from pyariadne import dp
-from pyariadne import evaluate
 from pyariadne import FloatDP
 from pyariadne import FloatDPBounds
 from pyariadne import FloatDPBoundsVector
@@ -13,18 +17,45 @@ from pyariadne import MultivariatePolynomial
 from pyariadne import Rational
 from pyariadne import ValidatedScalarMultivariateFunction
 
+from utils._binary_format import decode_array
+from utils._binary_format import encode_array
 from utils._convert_coordinates_to_function import convert_coordinates_to_function
+from utils._convert_coordinates_to_function import convert_terms_to_factored_function
 from utils._convert_coordinates_to_polynomial import convert_coordinates_to_polynomial
 from utils._convert_polynomial_to_coordinates import convert_polynomial_to_coordinates
 from utils._coordinate import Coordinate
+from utils._float_conversion import bounds_vectors_to_arrays
+from utils._horner import HornerScheme
+from utils._multiplication import multiply_terms
+from utils._multiplication import power_terms
+from utils._interval_array import IntervalArray
 from utils._scalar import is_scalar
+from utils._term_store import add_terms
+from utils._term_store import differentiate_terms
+from utils._term_store import gradient_terms
+from utils._term_store import hessian_terms
+from utils._term_store import negate_terms
+from utils._term_store import scale_terms
+from utils._term_store import Terms
+from utils._term_store import terms_from_coordinates
+from utils._term_store import terms_to_coordinates
+from utils.polynomial_array import PolynomialArray
 
 _OPERATION_NOT_POSSIBLE_ERROR_MESSAGE = f"Operation not possible for objects of type PolynomialFunction and "
 
 
 class PolynomialFunction:
+    # Instances are immutable: every operation returns a new PolynomialFunction, so the materialisations below and
+    # the derivatives are computed at most once per instance
     _n_variables: int
-    _coordinates: List[Coordinate]
+    _terms: Terms
+    _polynomial: Optional[MultivariatePolynomial] = None
+    _function: Optional[ValidatedScalarMultivariateFunction] = None
+    _factored_function: Optional[ValidatedScalarMultivariateFunction] = None
+    _array: Optional[PolynomialArray] = None
+    _horner: Optional[HornerScheme] = None
+    _derivatives: Optional[Dict[int, "PolynomialFunction"]] = None
+    _second_derivatives: Optional[Dict[Tuple[int, int], "PolynomialFunction"]] = None
 
     def __init__(
         self,
@@ -35,62 +66,75 @@ class PolynomialFunction:
         assert f or coordinates, "Need to specify either the function or the coordinates"
         self._n_variables = n_variables
         if f:
-            self._coordinates = convert_polynomial_to_coordinates(f=f)
+            self._terms = terms_from_coordinates(convert_polynomial_to_coordinates(f=f), n_variables)
         else:
-            self._coordinates = coordinates
+            self._terms = terms_from_coordinates(coordinates, n_variables)
         if f and coordinates:
             assert convert_polynomial_to_coordinates(f=f) == coordinates
 
+    @staticmethod
+    def _from_terms(n_variables: int, terms: Terms) -> "PolynomialFunction":
+        result = PolynomialFunction.__new__(PolynomialFunction)
+        result._n_variables = n_variables
+        result._terms = terms
+
+        return result
+
     def __repr__(self) -> str:
         return str(self.function)
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # pyariadne objects cannot be pickled, the binary record holds the exact coefficient bounds
+        return PolynomialFunction.from_bytes, (self.to_bytes(),)
+
     def __call__(self, x: Any) -> Any:
         if is_scalar(x=x) or isinstance(x, FloatDP):
             x_to_evaluate = FloatDPBoundsVector([x], dp)
-        elif isinstance(x, FloatDPBounds) or isinstance(x, FloatDPBoundsVector):
+        elif isinstance(x, FloatDPBounds):
+            x_to_evaluate = [x]
+        elif isinstance(x, FloatDPBoundsVector):
             x_to_evaluate = x
         else:
             raise Exception(f"PolynomialFunction object is not callable with object of type {type(x)}")
 
-        result = evaluate(self.polynomial, x_to_evaluate)
+        result = self.horner(x_to_evaluate)
 
         return result
 
+    def evaluate_many(self, points: Union[np.ndarray, Sequence[FloatDPBoundsVector]]) -> IntervalArray:
+        """
+        Evaluate the polynomial at many points at once with rigorous outward rounding
+        :param points: N interval vectors, either as FloatDPBoundsVectors or as an array of shape (N, n, 2) holding
+            lower and upper bounds; an array of shape (N, n) is read as exact points
+        :return: lower and upper bounds of the enclosures of f at every point, both of shape (N,)
+        """
+        if isinstance(points, np.ndarray):
+            lower = points[..., 0] if points.ndim == 3 else points
+            upper = points[..., 1] if points.ndim == 3 else points
+        else:
+            lower, upper = bounds_vectors_to_arrays(points=points)
+        lower = np.asarray(lower, dtype=float).reshape(-1, self._n_variables)
+        upper = np.asarray(upper, dtype=float).reshape(-1, self._n_variables)
+
+        return self.array.evaluate_many(lower=lower, upper=upper)
+
     # TODO: all operations should be used from MultivariatePolynomial
     def __neg__(self) -> "PolynomialFunction":
-        coordinates = [-x for x in self._coordinates]
-        result = PolynomialFunction(n_variables=self._n_variables, coordinates=coordinates)
-
-        return result
+        return PolynomialFunction._from_terms(n_variables=self._n_variables, terms=negate_terms(self._terms))
 
     def __add__(self, other: Any) -> "PolynomialFunction":
-        coordinates = self._coordinates.copy()
         if is_scalar(x=other):
-            constant_coordinate = MultiIndex([0 for _ in range(self._n_variables)])
-            other_coordinate = Coordinate(coefficient=FloatDPBounds(str(other), dp), powers=constant_coordinate)
-            did_update = False
-            for i, x in enumerate(coordinates):
-                if x.powers == constant_coordinate:
-                    coordinates[i] = x + other_coordinate
-                    did_update = True
-                    break
-            if not did_update:
-                coordinates.append(other_coordinate)
+            n_variables = self._n_variables
+            constant_powers = (0,) * n_variables
+            other_terms = {constant_powers: FloatDPBounds(str(other), dp)}
         elif isinstance(other, PolynomialFunction):
-            other_coordinates = other._coordinates
-            for y in other_coordinates:
-                did_update = False
-                for i, x in enumerate(coordinates):
-                    if x.powers == y.powers:
-                        coordinates[i] = x + y
-                        did_update = True
-                        break
-                if not did_update:
-                    coordinates.append(y)
+            n_variables = max(self._n_variables, other._n_variables)
+            other_terms = other._terms
         else:
             raise Exception(_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE, type(other))
 
-        result = PolynomialFunction(n_variables=max(self._n_variables, other.n_variables), coordinates=coordinates)
+        terms = add_terms(self._terms, other_terms, n_variables)
+        result = PolynomialFunction._from_terms(n_variables=n_variables, terms=terms)
 
         return result
 
@@ -100,23 +144,38 @@ class PolynomialFunction:
     def __sub__(self, other: Any) -> "PolynomialFunction":
         return self.__add__(other=-other)
 
+    def __rsub__(self, other: Any) -> "PolynomialFunction":
+        return (-self).__add__(other=other)
+
     def __mul__(self, other: Any) -> "PolynomialFunction":
-        if is_scalar(x=other):
-            coordinates = [x*other for x in self._coordinates]
+        if is_scalar(x=other) or isinstance(other, FloatDPBounds):
+            terms = scale_terms(self._terms, other)
             n_variables = self._n_variables
         elif isinstance(other, PolynomialFunction):
-            coordinates = [x*y for x in self._coordinates for y in other._coordinates]
             n_variables = max(self._n_variables, other._n_variables)
+            terms = multiply_terms(self._terms, other._terms, n_variables)
         else:
             raise Exception(_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE, type(other))
 
-        result = PolynomialFunction(n_variables=n_variables, coordinates=coordinates)
+        result = PolynomialFunction._from_terms(n_variables=n_variables, terms=terms)
 
         return result
 
     def __rmul__(self, other: Any) -> "PolynomialFunction":
         return self.__mul__(other=other)
 
+    def __pow__(self, k: int) -> "PolynomialFunction":
+        if not isinstance(k, int) or k < 0:
+            raise Exception(_OPERATION_NOT_POSSIBLE_ERROR_MESSAGE, type(k))
+
+        if k == 0:
+            terms = {(0,) * self._n_variables: FloatDPBounds("1", dp)}
+        else:
+            terms = power_terms(self._terms, k, self._n_variables)
+        result = PolynomialFunction._from_terms(n_variables=self._n_variables, terms=terms)
+
+        return result
+
     def _reciprocal(self) -> "PolynomialFunction":
         coordinates = [1/x for x in self._coordinates]
         result = PolynomialFunction(n_variables=self._n_variables, coordinates=coordinates)
@@ -143,23 +202,62 @@ class PolynomialFunction:
         return result
 
     def derivative(self, n: int) -> "PolynomialFunction":
-        derivative_polynomial = derivative(self.polynomial, n)
-        result = PolynomialFunction(n_variables=self.n_variables, f=derivative_polynomial)
+        assert n < self._n_variables, f"{n}th variable does not exist, there are at most {self._n_variables} variables"
 
-        return result
+        if self._derivatives is None:
+            self._derivatives = {}
+        if n not in self._derivatives:
+            terms = differentiate_terms(self._terms, n)
+            self._derivatives[n] = PolynomialFunction._from_terms(n_variables=self._n_variables, terms=terms)
+
+        return self._derivatives[n]
 
     def second_derivative(self, n_1: int, n_2: Optional[int] = None) -> "PolynomialFunction":
-        first_derivative = self.derivative(n_1)
         if n_2 is None:
             n_2 = n_1
-        second_derivative = first_derivative.derivative(n_2)
-
-        return second_derivative
+        if self._second_derivatives is None:
+            self._second_derivatives = {}
+        if (n_1, n_2) not in self._second_derivatives:
+            first_derivative = self.derivative(n_1)
+            self._second_derivatives[(n_1, n_2)] = first_derivative.derivative(n_2)
+
+        return self._second_derivatives[(n_1, n_2)]
+
+    def gradient(self) -> List["PolynomialFunction"]:
+        if self._derivatives is None:
+            self._derivatives = {}
+        # Derivatives computed earlier, e.g. by derivative(n), are kept so that their own caches stay valid
+        missing = [n for n in range(self._n_variables) if n not in self._derivatives]
+        if missing:
+            all_terms = gradient_terms(self._terms, self._n_variables)
+            for n in missing:
+                self._derivatives[n] = PolynomialFunction._from_terms(n_variables=self._n_variables, terms=all_terms[n])
+
+        return [self._derivatives[n] for n in range(self._n_variables)]
+
+    def hessian(self) -> List[List["PolynomialFunction"]]:
+        n_variables = self._n_variables
+        if self._second_derivatives is None:
+            self._second_derivatives = {}
+        missing = [
+            (i, j) for i in range(n_variables) for j in range(n_variables) if (i, j) not in self._second_derivatives
+        ]
+        if missing:
+            all_terms = hessian_terms(self._terms, n_variables)
+            for i, j in missing:
+                if (j, i) in self._second_derivatives:
+                    self._second_derivatives[(i, j)] = self._second_derivatives[(j, i)]
+                else:
+                    self._second_derivatives[(i, j)] = PolynomialFunction._from_terms(
+                        n_variables=n_variables, terms=all_terms[i][j]
+                    )
+
+        return [[self._second_derivatives[(i, j)] for j in range(n_variables)] for i in range(n_variables)]
 
     # TODO: eventually this should go to __call__
     def evaluate_at_one_over_x(self, n: int) -> "PolynomialFunction":
-        coordinates = [x.one_over_x(n=n) for x in self._coordinates]
-        result = PolynomialFunction(n_variables=self._n_variables, coordinates=coordinates)
+        terms = {powers[:n] + (-powers[n],) + powers[n+1:]: c for powers, c in self._terms.items()}
+        result = PolynomialFunction._from_terms(n_variables=self._n_variables, terms=terms)
 
         return result
 
@@ -167,21 +265,91 @@ class PolynomialFunction:
     def n_variables(self) -> int:
         return self._n_variables
 
+    @property
+    def n_terms(self) -> int:
+        return len(self._terms)
+
+    @property
+    def _coordinates(self) -> List[Coordinate]:
+        return terms_to_coordinates(self._terms, self._n_variables)
+
     @property
     def polynomial(self) -> MultivariatePolynomial:
-        f_as_polynomial = convert_coordinates_to_polynomial(coordinates=self._coordinates)
+        if self._polynomial is None:
+            self._polynomial = convert_coordinates_to_polynomial(coordinates=self._coordinates)
 
-        return f_as_polynomial
+        return self._polynomial
+
+    @property
+    def horner(self) -> HornerScheme:
+        """
+        Cached nested Horner scheme of the polynomial, callable with FloatDPBounds values or plain floats
+        """
+        if self._horner is None:
+            self._horner = HornerScheme(n_variables=self._n_variables, terms=self._terms)
+
+        return self._horner
+
+    def prepare(self, array: bool = True, factored_function: bool = False) -> None:
+        """
+        Build cached representations up front instead of on first use
+        :param array: build the array
+        :param factored_function: build the factored function
+        """
+        if array and self._array is None:
+            self._array = PolynomialArray.from_terms(n_variables=self._n_variables, terms=self._terms)
+        if factored_function and self._factored_function is None:
+            self._factored_function = convert_terms_to_factored_function(
+                n_variables=self._n_variables, terms=self._terms
+            )
+
+    @property
+    def array(self) -> PolynomialArray:
+        self.prepare(array=True)
+
+        return self._array
+
+    @staticmethod
+    def from_array(f: PolynomialArray) -> "PolynomialFunction":
+        result = PolynomialFunction._from_terms(n_variables=f.n_variables, terms=f.to_terms())
+        result._array = f
+
+        return result
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: versioned binary record of the exponent matrix and the exact coefficient bounds
+        """
+        return encode_array(self.array)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "PolynomialFunction":
+        f, _ = decode_array(data)
+
+        return PolynomialFunction.from_array(f)
 
     @property
     def function(self) -> ValidatedScalarMultivariateFunction:
-        f = convert_coordinates_to_function(n_variables=self._n_variables, coordinates=self._coordinates)
-        return f
+        if self._function is None:
+            self._function = convert_coordinates_to_function(
+                n_variables=self._n_variables, coordinates=self._coordinates
+            )
+
+        return self._function
+
+    @property
+    def factored_function(self) -> ValidatedScalarMultivariateFunction:
+        """
+        Horner-factored function with shared powers, used as input to the solver
+        """
+        self.prepare(array=False, factored_function=True)
+
+        return self._factored_function
 
     def max_degree_nth_variable(self, n: int) -> int:
         assert n < self._n_variables, f"{n}th variable does not exist, there are at most {self._n_variables} variables"
 
-        max_degree = max([x.powers[n] for x in self._coordinates])
+        max_degree = max((powers[n] for powers in self._terms), default=0)
         return max_degree
 
     @staticmethod
@@ -1,20 +1,71 @@
+from typing import Any
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from pyariadne import FloatDPExactBox
 from pyariadne import ValidatedVectorMultivariateFunction
 
+from utils._binary_format import decode_problem
+from utils._binary_format import encode_problem
+from utils._float_conversion import box_to_floats
+from utils._float_conversion import floats_to_box
+from utils.polynomial_function import PolynomialFunction
+
 
 class PolynomialOptimisationProblem:
     f: ValidatedVectorMultivariateFunction
     D: FloatDPExactBox
     is_conversion_needed_per_dimension: List[bool]
+    components: Optional[List[PolynomialFunction]]
 
     def __init__(
         self,
         f: ValidatedVectorMultivariateFunction,
         D: FloatDPExactBox,
-        is_conversion_needed_per_dimension: List[bool]
+        is_conversion_needed_per_dimension: List[bool],
+        components: Optional[List[PolynomialFunction]] = None
     ) -> None:
         self.f = f
         self.D = D
         self.is_conversion_needed_per_dimension = is_conversion_needed_per_dimension
+        self.components = components
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return PolynomialOptimisationProblem.from_bytes, (self.to_bytes(),)
+
+    def to_bytes(self) -> bytes:
+        """
+        :return: versioned binary record of the components, the exact domain bounds and the conversion flags
+        """
+        assert self.components is not None, "Only problems built from polynomial components can be serialised"
+        return encode_problem(
+            components=[x.array for x in self.components],
+            domain_bounds=box_to_floats(self.D),
+            is_conversion_needed_per_dimension=self.is_conversion_needed_per_dimension
+        )
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "PolynomialOptimisationProblem":
+        components, domain_bounds, is_conversion_needed_per_dimension, _ = decode_problem(data)
+
+        return _restore_problem(
+            components=[PolynomialFunction.from_array(x) for x in components],
+            domain_bounds=domain_bounds,
+            is_conversion_needed_per_dimension=is_conversion_needed_per_dimension
+        )
+
+
+def _restore_problem(
+    components: List[PolynomialFunction],
+    domain_bounds: List[Tuple[float, float]],
+    is_conversion_needed_per_dimension: List[bool]
+) -> PolynomialOptimisationProblem:
+    problem = PolynomialOptimisationProblem(
+        f=ValidatedVectorMultivariateFunction([x.factored_function for x in components]),
+        D=floats_to_box(domain_bounds),
+        is_conversion_needed_per_dimension=is_conversion_needed_per_dimension,
+        components=components
+    )
+
+    return problem
@@ -0,0 +1,83 @@
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+from utils._binary_format import decode_array
+from utils._binary_format import VERSION
+from utils.polynomial_array import PolynomialArray
+from utils.polynomial_function import PolynomialFunction
+from utils.polynomial_optimisation_problem import PolynomialOptimisationProblem
+
+PathLike = Union[str, Path]
+
+
+def dumps_polynomial(f: PolynomialFunction) -> bytes:
+    return f.to_bytes()
+
+
+def loads_polynomial(data: bytes) -> PolynomialFunction:
+    return PolynomialFunction.from_bytes(data)
+
+
+def save_polynomial(f: PolynomialFunction, path: PathLike) -> None:
+    """
+    Save a polynomial with its exact coefficient bounds, as an .npz archive if the path ends in .npz and in the binary
+    format of PolynomialFunction.to_bytes otherwise
+    :param f: polynomial to save
+    :param path: file to write
+    """
+    if str(path).endswith(".npz"):
+        array = f.array
+        np.savez(
+            path,
+            version=VERSION,
+            n_variables=array.n_variables,
+            exponents=array.exponents,
+            lower=array.lower,
+            upper=array.upper
+        )
+    else:
+        Path(path).write_bytes(f.to_bytes())
+
+
+def load_array(path: PathLike, mmap: bool = True) -> PolynomialArray:
+    """
+    Load the array representation of a saved polynomial, without building its terms
+    :param path: file written by save_polynomial
+    :param mmap: map a binary file into memory instead of reading it
+    :return: the polynomial as a PolynomialArray
+    """
+    if str(path).endswith(".npz"):
+        with np.load(path) as data:
+            version = int(data["version"])
+            if version > VERSION:
+                raise ValueError(f"File has format version {version}, only versions up to {VERSION} can be read")
+            return PolynomialArray(int(data["n_variables"]), data["exponents"], data["lower"], data["upper"])
+
+    buffer = np.memmap(path, dtype=np.uint8, mode="r") if mmap else Path(path).read_bytes()
+    f, _ = decode_array(buffer)
+
+    return f
+
+
+def load_polynomial(path: PathLike, mmap: bool = True) -> PolynomialFunction:
+    return PolynomialFunction.from_array(load_array(path=path, mmap=mmap))
+
+
+def dumps_problem(p: PolynomialOptimisationProblem) -> bytes:
+    return p.to_bytes()
+
+
+def loads_problem(data: bytes) -> PolynomialOptimisationProblem:
+    return PolynomialOptimisationProblem.from_bytes(data)
+
+
+def save_problem(p: PolynomialOptimisationProblem, path: PathLike) -> None:
+    Path(path).write_bytes(p.to_bytes())
+
+
+def load_problem(path: PathLike, mmap: bool = True) -> PolynomialOptimisationProblem:
+    buffer = np.memmap(path, dtype=np.uint8, mode="r") if mmap else Path(path).read_bytes()
+
+    return PolynomialOptimisationProblem.from_bytes(buffer)